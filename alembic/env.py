@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from backend.core.config import get_settings
 from backend.models import Base  # noqa: E402
+from backend.models.search import DOCUMENTS_FTS_TABLE, STAFF_FTS_TABLE
 
 # this is the Alembic Config object
 config = context.config
@@ -49,9 +50,16 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def include_name(name, type_, parent_names) -> bool:
+    """Skip FTS5 search tables (managed by backend.models.search) in autogenerate."""
+    if type_ == "table" and name and name.startswith((DOCUMENTS_FTS_TABLE, STAFF_FTS_TABLE)):
+        return False
+    return True
+
+
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with a connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=target_metadata, include_name=include_name)
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,25 @@
+"""add rendered_html_fingerprint to documents
+
+Revision ID: a4c9e2d17b53
+Revises: f7a3b8c4d2e1
+Create Date: 2026-10-16 09:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c9e2d17b53'
+down_revision: Union[str, None] = 'f7a3b8c4d2e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('rendered_html_fingerprint', sa.String(length=64), nullable=True, comment='Відбиток даних, з яких відрендерено rendered_html'))
+
+
+def downgrade() -> None:
+    op.drop_column('documents', 'rendered_html_fingerprint')
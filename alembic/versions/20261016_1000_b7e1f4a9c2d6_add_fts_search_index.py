@@ -0,0 +1,33 @@
+"""add FTS5 search index for documents and staff
+
+Revision ID: b7e1f4a9c2d6
+Revises: a4c9e2d17b53
+Create Date: 2026-10-16 10:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.models.search import create_search_index, drop_search_index_ddl
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e1f4a9c2d6'
+down_revision: Union[str, None] = 'a4c9e2d17b53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        # Virtual tables + sync triggers, filled from existing rows
+        create_search_index(bind)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        for statement in drop_search_index_ddl():
+            op.execute(sa.text(statement))
@@ -0,0 +1,36 @@
+"""add composite indexes for documents and attendance
+
+Revision ID: c3d8a5f1e7b4
+Revises: b7e1f4a9c2d6
+Create Date: 2026-10-16 11:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d8a5f1e7b4'
+down_revision: Union[str, None] = 'b7e1f4a9c2d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = (
+    ('ix_documents_staff_status', 'documents', ['staff_id', 'status']),
+    ('ix_documents_status_changed', 'documents', ['status', 'status_changed_at']),
+    ('ix_documents_status_period', 'documents', ['status', 'date_start', 'date_end']),
+    ('ix_documents_created_at_id', 'documents', ['created_at', 'id']),
+    ('ix_attendance_staff_date', 'attendance', ['staff_id', 'date', 'is_correction']),
+    ('ix_attendance_correction_period', 'attendance', ['correction_year', 'correction_month', 'date']),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,48 @@
+"""add generation_jobs table
+
+Revision ID: d9b2e6c4a8f1
+Revises: c3d8a5f1e7b4
+Create Date: 2026-10-16 12:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9b2e6c4a8f1'
+down_revision: Union[str, None] = 'c3d8a5f1e7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'generation_jobs',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('kind', sa.String(50), nullable=False),
+        sa.Column('status', sa.Enum('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', name='jobstatus'), nullable=False),
+        sa.Column('dedup_key', sa.String(255), nullable=True, comment='Ключ дедуплікації однакових задач'),
+        sa.Column('params', sa.JSON(), nullable=False),
+        sa.Column('progress_done', sa.Integer(), nullable=False),
+        sa.Column('progress_total', sa.Integer(), nullable=True),
+        sa.Column('results', sa.JSON(), nullable=False, comment='Часткові результати по елементах'),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_by', sa.String(200), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index('ix_generation_jobs_status', 'generation_jobs', ['status'])
+    op.create_index('ix_generation_jobs_dedup_key', 'generation_jobs', ['dedup_key'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_generation_jobs_dedup_key', table_name='generation_jobs')
+    op.drop_index('ix_generation_jobs_status', table_name='generation_jobs')
+    op.drop_table('generation_jobs')
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('DROP TYPE IF EXISTS jobstatus')
@@ -0,0 +1,35 @@
+"""add blobs table (content-addressed storage)
+
+Revision ID: e4f7a2c9b5d3
+Revises: d9b2e6c4a8f1
+Create Date: 2026-10-16 13:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4f7a2c9b5d3'
+down_revision: Union[str, None] = 'd9b2e6c4a8f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'blobs',
+        sa.Column('sha256', sa.String(64), primary_key=True),
+        sa.Column('size', sa.BigInteger(), nullable=False),
+        sa.Column('extension', sa.String(10), nullable=False),
+        sa.Column('ref_count', sa.Integer(), nullable=False, comment='Кількість посилань з документів'),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index('ix_blobs_ref_count', 'blobs', ['ref_count'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_blobs_ref_count', table_name='blobs')
+    op.drop_table('blobs')
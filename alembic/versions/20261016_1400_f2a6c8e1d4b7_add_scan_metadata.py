@@ -0,0 +1,29 @@
+"""add scan page count, size and thumbnail to documents
+
+Revision ID: f2a6c8e1d4b7
+Revises: e4f7a2c9b5d3
+Create Date: 2026-10-16 14:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a6c8e1d4b7'
+down_revision: Union[str, None] = 'e4f7a2c9b5d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('scan_page_count', sa.Integer(), nullable=True, comment='Кількість сторінок скану'))
+    op.add_column('documents', sa.Column('scan_size', sa.BigInteger(), nullable=True, comment='Розмір файлу скану в байтах'))
+    op.add_column('documents', sa.Column('scan_thumbnail_path', sa.String(500), nullable=True, comment='Мініатюра першої сторінки скану'))
+
+
+def downgrade() -> None:
+    op.drop_column('documents', 'scan_thumbnail_path')
+    op.drop_column('documents', 'scan_size')
+    op.drop_column('documents', 'scan_page_count')
@@ -0,0 +1,34 @@
+"""add partial index of stale documents by age
+
+Revision ID: a7c3e9f1b2d6
+Revises: f2a6c8e1d4b7
+Create Date: 2026-10-16 15:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9f1b2d6'
+down_revision: Union[str, None] = 'f2a6c8e1d4b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Умова має збігатися з backend.models.document.stale_status_condition()
+    op.create_index(
+        'ix_documents_stale_age',
+        'documents',
+        [sa.text('coalesce(status_changed_at, updated_at, created_at)'), 'id'],
+        sqlite_where=sa.text(
+            "(+ status) IN ('DRAFT', 'SIGNED_BY_APPLICANT', 'APPROVED_BY_DISPATCHER', "
+            "'SIGNED_DEP_HEAD', 'AGREED', 'SIGNED_RECTOR', 'SCANNED')"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_stale_age', table_name='documents')
@@ -8,12 +8,16 @@ from sqlalchemy import func
 
 from backend.api.dependencies import DBSession
 from backend.core.dependencies import get_current_user, require_department_head
+from backend.core.pagination import InvalidCursorError, paginate
 from backend.models.attendance import Attendance
 from backend.models.staff import Staff
 from backend.services.tabel_approval_service import TabelApprovalService
 
 router = APIRouter(prefix="/attendance", tags=["attendance"])
 
+# Порядок списку відвідуваності: новіші дати першими
+ATTENDANCE_SORT_KEY = ((Attendance.date, True), (Attendance.id, True))
+
 
 @router.get("/list")
 async def list_all_attendance(
@@ -23,6 +27,8 @@ async def list_all_attendance(
     year: Optional[int] = Query(None, description="Filter by year"),
     month: Optional[int] = Query(None, ge=1, le=12, description="Filter by month (1-12)"),
     is_correction: Optional[bool] = Query(None, description="Filter by correction status"),
+    cursor: Optional[str] = Query(None, description="Cursor of the next page (next_cursor from the previous response)"),
+    include_total: Optional[bool] = Query(None, description="Count total records (by default only without cursor)"),
     db: DBSession = None,
     current_user = Depends(require_department_head),
 ):
@@ -37,9 +43,11 @@ async def list_all_attendance(
     - **staff_id**: Фільтр по співробітнику.
     - **year/month**: Фільтр по періоду (рік/місяць).
     - **is_correction**: Фільтрувати тільки корекції (True) або тільки основні (False).
+    - **cursor**: Keyset пагінація за (date, id); skip ігнорується.
+    - **include_total**: Чи рахувати total (за замовчуванням - лише без курсора).
 
     Returns:
-    - Список записів з детальною інформацією про тип табеля.
+    - Список записів з детальною інформацією про тип табеля та next_cursor.
     """
     query = db.query(Attendance)
 
@@ -53,11 +61,16 @@ async def list_all_attendance(
     if is_correction is not None:
         query = query.filter(Attendance.is_correction == is_correction)
 
-    # Get total count
-    total = query.count()
+    # Total count is optional for cursor pages
+    if include_total is None:
+        include_total = cursor is None
+    total = query.count() if include_total else None
 
     # Apply pagination and ordering
-    records = query.order_by(Attendance.date.desc(), Attendance.id.desc()).offset(skip).limit(limit).all()
+    try:
+        records, next_cursor = paginate(query, ATTENDANCE_SORT_KEY, limit, cursor=cursor, skip=skip)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     result_items = []
     for record in records:
@@ -98,6 +111,7 @@ async def list_all_attendance(
         "total": total,
         "skip": skip,
         "limit": limit,
+        "next_cursor": next_cursor,
     }
 
 
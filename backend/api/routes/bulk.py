@@ -1,6 +1,7 @@
 """API маршрути для масових операцій з документами."""
 
 from fastapi import APIRouter, Depends, HTTPException
+from starlette.concurrency import run_in_threadpool
 from backend.api.dependencies import DBSession, GrammarSvc
 from backend.core.dependencies import require_department_head
 from backend.schemas.document import BulkValidationRequest, BulkGenerateRequest
@@ -43,7 +44,10 @@ async def validate_bulk_generation(
         date_start=request.date_start,
         date_end=request.date_end
     )
-    
+    validation_token = service.issue_validation_token(
+        staff_list, request.date_start, request.date_end, result
+    )
+
     # Transform result for frontend response (Staff objects to simplified dicts)
     valid_staff = [
         {
@@ -66,7 +70,8 @@ async def validate_bulk_generation(
         "invalid": invalid_staff,
         "total_requested": len(staff_list),
         "valid_count": len(valid_staff),
-        "invalid_count": len(invalid_staff)
+        "invalid_count": len(invalid_staff),
+        "validation_token": validation_token,
     }
 
 
@@ -95,11 +100,12 @@ async def generate_bulk_documents(
 
     service = BulkDocumentService(db, grammar)
     
-    # Filter only valid staff again just in case
+    # Результат /validate за токеном, інакше валідація виконується знову
     validation_result = service.validate_staff_for_batch(
         staff_list=staff_list,
         date_start=request.date_start,
-        date_end=request.date_end
+        date_end=request.date_end,
+        validation_token=request.validation_token,
     )
     
     valid_staff_list = validation_result['valid']
@@ -108,17 +114,22 @@ async def generate_bulk_documents(
         raise HTTPException(status_code=400, detail="Немає валідних співробітників для генерації")
 
     # Generate documents
-    documents = service.generate_batch(
+    report = service.generate_batch(
         staff_list=valid_staff_list,
         doc_type=request.doc_type,
         date_start=request.date_start,
         date_end=request.date_end,
         file_suffix=request.file_suffix
     )
-    
+    if request.render_pdf:
+        # Рендеринг PDF - поза event loop (для великих пакетів - /api/jobs/bulk-generate)
+        await run_in_threadpool(service.render_batch_pdfs, report)
+
     return {
         "success": True,
-        "generated_count": len(documents),
-        "message": f"Успішно створено {len(documents)} документів",
-        "document_ids": [d.id for d in documents]
+        "generated_count": len(report.documents),
+        "message": f"Успішно створено {len(report.documents)} документів",
+        "document_ids": [d.id for d in report.documents],
+        "failed_count": len(report.failed),
+        "items": [item.to_dict() for item in report.items],
     }
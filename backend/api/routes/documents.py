@@ -1,8 +1,6 @@
 """API маршрути для управління документами."""
 
 from datetime import date, datetime, timedelta
-import os
-import shutil
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
@@ -16,7 +14,10 @@ from backend.api.dependencies import (
     get_db,
 )
 from backend.core.dependencies import get_current_user, require_employee
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form
+from backend.core.pagination import InvalidCursorError, paginate
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, UploadFile, File, Form
+from fastapi.responses import FileResponse, Response
+from starlette.concurrency import run_in_threadpool
 from backend.models.document import Document
 from backend.models.attendance import Attendance, ATTENDANCE_CODES
 from backend.schemas.document import (
@@ -28,13 +29,28 @@ from backend.schemas.document import (
     DocumentStatusUpdate,
 )
 from backend.schemas.auth import TokenData
-from backend.services.document_renderer import render_document
+from backend.services.document_list_service import document_list_options, parse_list_fields
+from backend.services.search_service import apply_document_search
+from backend.services.document_render_cache import (
+    get_rendered_html,
+    refresh_rendered_html,
+    render_context_version,
+)
 from shared.enums import DocumentStatus, DocumentType, get_document_type_label
 from backend.core.config import get_settings
 from backend.core.websocket import manager
+from backend.services.blob_store import BlobStore
+from backend.services.generation_jobs import submit_scan_thumbnail
+from backend.services.scan_thumbnails import (
+    THUMBNAIL_MEDIA_TYPES,
+    reset_scan_info,
+    thumbnail_url,
+    thumbnail_version,
+)
+from backend.services.scan_upload import ScanTooLargeError, stage_upload
 from backend.services.staff_service import StaffService
 from backend.schemas.responses import UploadResponse
-from shared.constants import ALLOWED_EXTENSIONS, MAX_FILE_SIZE
+from shared.constants import ALLOWED_EXTENSIONS
 from pathlib import Path
 from typing import Annotated
 
@@ -42,6 +58,9 @@ settings = get_settings()
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
+# Порядок реєстру документів: новіші першими
+DOCUMENT_SORT_KEY = ((Document.created_at, True), (Document.id, True))
+
 
 @router.get("/types")
 async def get_document_types():
@@ -78,6 +97,9 @@ async def list_documents(
     needs_scan: bool = Query(False),
     filter: str | None = Query(None, description="Фільтр: 'stale' для документів з проблемами"),
     exclude_statuses: str | None = Query(None, description="Статуси для виключення (через кому)"),
+    fields: str | None = Query(None, description="Додаткові великі поля (через кому): rendered_html, content, new_employee_data"),
+    cursor: str | None = Query(None, description="Курсор наступної сторінки (next_cursor з попередньої відповіді)"),
+    include_total: bool | None = Query(None, description="Рахувати загальну кількість (за замовчуванням - лише без курсора)"),
     current_user: get_current_user = Depends(require_employee),
 ):
     """
@@ -92,15 +114,24 @@ async def list_documents(
     - **staff_id** (int, optional): Фільтр по конкретному співробітнику.
     - **status** (str, optional): Точний збіг статусу (наприклад, 'draft').
     - **doc_type** (str, optional): Тип документа.
-    - **search** (str, optional): Пошук по тексту документа або коментарям.
+    - **search** (str, optional): Повнотекстовий пошук по тексту документа та коментарям (за префіксами слів).
     - **start_date/end_date** (str, optional): Діапазон дат створення (YYYY-MM-DD).
     - **needs_scan** (bool): Спеціальний фільтр - документи, що потребують сканування (підписані, але без файлу).
     - **filter** (str, optional): Пресети фільтрів ('pending', 'stale', 'not_confirmed').
+    - **fields** (str, optional): Великі поля, які треба додати до рядків ('rendered_html', 'content', 'new_employee_data').
+    - **cursor** (str, optional): Keyset пагінація за (created_at, id); skip ігнорується.
+    - **include_total** (bool, optional): Чи рахувати total (за замовчуванням - лише без курсора).
     
     Returns:
     - **data**: Список документів з деталями (співробітник, дати, статус).
-    - **total**: Загальна кількість знайдених документів.
+    - **total**: Загальна кількість знайдених документів (None, якщо не рахувалася).
+    - **next_cursor**: Курсор наступної сторінки або None.
     """
+    try:
+        extra_fields = parse_list_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     query = db.query(Document)
 
     if needs_scan:
@@ -127,13 +158,9 @@ async def list_documents(
         ]
         query = query.filter(Document.status.in_(pending_statuses))
     elif filter == 'stale':
-        # Filter for stale documents (not processed, not updated for STALE_THRESHOLD_DAYS+)
+        # Filter for stale documents (same predicate as /stale)
         from backend.services.stale_document_service import StaleDocumentService
-        stale_threshold = datetime.now() - timedelta(days=StaleDocumentService.STALE_THRESHOLD_DAYS)
-        query = query.filter(
-            Document.status != DocumentStatus.PROCESSED,
-            Document.updated_at <= stale_threshold
-        )
+        query = query.filter(StaleDocumentService.stale_filter())
     else:
         # Normal filters
         if staff_id is not None:
@@ -159,19 +186,30 @@ async def list_documents(
                 query = query.filter(~Document.status.in_(excluded))
 
     if search:
-        # Search by custom_text or editor_content
-        query = query.filter(
-            (Document.custom_text.ilike(f"%{search}%")) |
-            (Document.editor_content.ilike(f"%{search}%"))
-        )
+        # Full-text search over document text and comments (FTS5)
+        query = apply_document_search(query, db, search)
 
     if start_date:
         query = query.filter(Document.created_at >= start_date)
     if end_date:
         query = query.filter(Document.created_at <= end_date)
 
-    total = int(query.count())
-    items = query.order_by(Document.created_at.desc()).offset(skip).limit(limit).all()
+    if include_total is None:
+        include_total = cursor is None
+    total = int(query.count()) if include_total else None
+    try:
+        items, next_cursor = paginate(
+            query.options(*document_list_options(extra_fields)),
+            DOCUMENT_SORT_KEY,
+            limit,
+            cursor=cursor,
+            skip=skip,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Settings/approvers/templates version is shared by all rows of the page
+    context_version = render_context_version(db) if "rendered_html" in extra_fields else None
 
     # Return simplified response using correct field names
     result_items = []
@@ -180,14 +218,11 @@ async def list_documents(
         # Generate title from doc_type
         doc_title = get_document_type_label(doc.doc_type.value) if doc.doc_type else "Документ"
 
-        # Always re-render to use the correct template
-        doc.rendered_html = render_document(doc, db)
-
         # Get blocking status from database (stored field)
         is_blocked = doc.is_blocked
         blocked_reason = doc.blocked_reason
 
-        result_items.append({
+        item = {
             "id": doc.id,
             "staff_id": doc.staff_id,
             "staff": {
@@ -201,8 +236,6 @@ async def list_documents(
                 "name": get_document_type_label(doc.doc_type.value) if doc.doc_type else "",
             },
             "title": doc_title,
-            "content": doc.editor_content or doc.custom_text or "",
-            "rendered_html": doc.rendered_html,
             "status": doc.status.value if doc.status else "draft",
             "date_start": doc.date_start.isoformat() if doc.date_start else None,
             "date_end": doc.date_end.isoformat() if doc.date_end else None,
@@ -214,18 +247,31 @@ async def list_documents(
             "staff_name": staff.pib_nom if staff else "",
             "staff_position": staff.position if staff else "",
             "file_scan_path": doc.file_scan_path,
+            "scan_page_count": doc.scan_page_count,
+            "scan_size": doc.scan_size,
+            "scan_thumbnail_url": thumbnail_url(doc.id, doc.scan_thumbnail_path),
             "is_blocked": is_blocked,
             "blocked_reason": blocked_reason,
             "progress": doc.get_workflow_progress() if hasattr(doc, 'get_workflow_progress') else {},
-        })
+        }
 
-    db.commit()  # Save any updated rendered_html values
+        # Large fields only on request
+        if "content" in extra_fields:
+            item["content"] = doc.editor_content or doc.custom_text or ""
+        if "rendered_html" in extra_fields:
+            # Cached HTML; only stale entries are re-rendered (never written here)
+            item["rendered_html"] = get_rendered_html(doc, db, context_version)
+        if "new_employee_data" in extra_fields:
+            item["new_employee_data"] = doc.new_employee_data
+
+        result_items.append(item)
 
     return {
         "data": result_items,
         "total": total,
         "page": skip // limit + 1,
         "page_size": limit,
+        "next_cursor": next_cursor,
     }
 
 
@@ -234,6 +280,11 @@ async def get_stale_documents(
     db: DBSession,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    status: str | None = Query(None, description="Фільтр за статусом"),
+    staff_id: int | None = Query(None),
+    age_bucket: str | None = Query(None, description="Вікова група, днів без руху: 1-3, 3-7, 7-30, 30+"),
+    cursor: str | None = Query(None, description="Курсор наступної сторінки (next_cursor з попередньої відповіді)"),
+    include_total: bool | None = Query(None, description="Рахувати загальну кількість (за замовчуванням - лише без курсора)"),
     current_user: get_current_user = Depends(require_employee),
 ):
     """
@@ -241,13 +292,41 @@ async def get_stale_documents(
 
     Повертає документи, рух яких зупинився (статус не змінювався довгий час).
     Використовується для моніторингу "завислих" процесів.
+    Найдовше застарілі документи йдуть першими; фільтрація та пагінація
+    виконуються в базі даних.
 
     Returns:
     - Список застарілих документів з інформацією про причину (stale_info).
     """
     from backend.services.stale_document_service import StaleDocumentService
 
-    stale_docs = StaleDocumentService.get_stale_documents(db)
+    status_filter = None
+    if status is not None:
+        try:
+            status_filter = DocumentStatus(status)
+        except ValueError:
+            pass  # Invalid status, skip filter
+
+    try:
+        query = StaleDocumentService.stale_query(
+            db, status=status_filter, staff_id=staff_id, age_bucket=age_bucket,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if include_total is None:
+        include_total = cursor is None
+    total = int(query.count()) if include_total else None
+    try:
+        stale_docs, next_cursor = paginate(
+            query.options(*document_list_options()),
+            StaleDocumentService.SORT_KEY,
+            limit,
+            cursor=cursor,
+            skip=skip,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     # Convert to response format
     result_items = []
@@ -280,14 +359,12 @@ async def get_stale_documents(
             "stale_info": StaleDocumentService.get_stale_document_info(doc),
         })
 
-    total = len(result_items)
-    items = result_items[skip:skip + limit]
-
     return {
-        "data": items,
+        "data": result_items,
         "total": total,
         "page": skip // limit + 1,
         "page_size": limit,
+        "next_cursor": next_cursor,
     }
 
 
@@ -384,7 +461,7 @@ async def update_document_status(
         # Re-fetch to return full object
         db.refresh(doc)
         # Re-render html to update status text in doc if needed
-        doc.rendered_html = render_document(doc, db)
+        refresh_rendered_html(doc, db)
         db.commit()
 
         response = DocumentResponse.model_validate(doc)
@@ -525,15 +602,15 @@ async def get_document(
         staff = doc.staff
         staff_name = staff.pib_nom if staff else ""
         staff_position = staff.position if staff else ""
-        # Re-render for drafts/non-archived documents
-        doc.rendered_html = render_document(doc, db)
-        db.commit()
     
     # Generate title from doc_type
     doc_title = get_document_type_label(doc.doc_type.value) if doc.doc_type else "Документ"
     
-    # Use rendered_html from context (archive) or document
-    rendered_html = context.get("rendered_html") or doc.rendered_html
+    # Use rendered_html from context (archive) or the cached render of the live document
+    if context.get("from_archive"):
+        rendered_html = context.get("rendered_html") or doc.rendered_html
+    else:
+        rendered_html = get_rendered_html(doc, db)
 
     return {
         "id": doc.id,
@@ -554,6 +631,9 @@ async def get_document(
         "staff_position": staff_position,
         "file_docx_path": doc.file_docx_path,
         "file_scan_path": doc.file_scan_path,
+        "scan_page_count": doc.scan_page_count,
+        "scan_size": doc.scan_size,
+        "scan_thumbnail_url": thumbnail_url(doc.id, doc.scan_thumbnail_path),
         "archive_metadata_path": doc.archive_metadata_path,
         "from_archive": context.get("from_archive", False),
         "progress": doc.get_workflow_progress() if hasattr(doc, 'get_workflow_progress') else {},
@@ -708,7 +788,7 @@ async def create_document(
     db.refresh(document)
 
     # Render and store HTML using db session for settings
-    document.rendered_html = render_document(document, db)
+    refresh_rendered_html(document, db)
     db.commit()
 
     # Create response with frontend-compatible fields
@@ -724,15 +804,52 @@ async def create_document(
     return response
 
 
-def _generate_scan_path(document: Document, extension: str) -> Path:
-    """Генерує шлях для збереження скану."""
-    year = document.date_start.year
-    month = document.date_start.strftime("%m_%B").lower()
+def _queue_scan_processing(db: Session, document: Document) -> None:
+    """Ставить у фонову чергу мініатюру і метадані скану (не блокує відповідь)."""
+    try:
+        submit_scan_thumbnail(db, document)
+    except Exception as e:
+        import logging
+        logging.warning(f"Failed to queue scan thumbnail for document {document.id}: {e}")
+
+
+@router.get("/{document_id}/thumbnail")
+async def get_scan_thumbnail(
+    document_id: int,
+    request: Request,
+    db: DBSession,
+    v: str | None = Query(None, description="Версія мініатюри (з scan_thumbnail_url)"),
+    current_user: TokenData = Depends(require_employee),
+):
+    """
+    Мініатюра першої сторінки скану документа.
 
-    surname = document.staff.pib_nom.split()[0] if document.staff.pib_nom.split() else "unknown"
-    filename = f"{surname}_{document.id}_signed{extension}"
+    Мініатюра адресується хешем скану: з актуальною версією (v з
+    scan_thumbnail_url) відповідь кешується назавжди лише браузером
+    (private - скани персональних документів), без неї -
+    перевіряється за ETag.
 
-    return settings.storage_dir / str(year) / month / "signed" / filename
+    Errors:
+    - **404 Not Found**: Документ не знайдено або мініатюра ще не готова.
+    """
+    doc = db.get(Document, document_id)
+    if not doc:
+        raise HTTPException(status_code=404, detail="Документ не знайдено")
+    thumbnail = Path(doc.scan_thumbnail_path) if doc.scan_thumbnail_path else None
+    if thumbnail is None or not await run_in_threadpool(thumbnail.is_file):
+        raise HTTPException(status_code=404, detail="Мініатюра ще не готова")
+
+    version = thumbnail_version(thumbnail)
+    etag = f'"{version}"'
+    cache_control = "private, max-age=31536000, immutable" if v == version else "private, no-cache"
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(
+        thumbnail,
+        media_type=THUMBNAIL_MEDIA_TYPES.get(thumbnail.suffix, "application/octet-stream"),
+        headers=headers,
+    )
 
 
 @router.post("/{document_id}/upload", response_model=UploadResponse)
@@ -774,25 +891,21 @@ async def upload_scan(
             detail=f"Недопустимий формат файлу. Дозволені: {', '.join(ALLOWED_EXTENSIONS)}",
         )
 
-    # Читаємо файл
-    contents = await file.read()
-    if len(contents) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=413,
-            detail=f"Файл завеликий. Максимум: {MAX_FILE_SIZE / 1024 / 1024:.1f} MB",
-        )
+    # Потокове читання у тимчасовий файл (розмір перевіряється по блоках)
+    try:
+        staged = await stage_upload(file)
+    except ScanTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
 
     # Зберігаємо файл
     try:
-        save_path = _generate_scan_path(doc, file_ext)
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(save_path, "wb") as f:
-            f.write(contents)
+        # Сховище файлів: повторне завантаження того самого скану не пише на диск
+        store = BlobStore(db)
+        save_path = store.attach(doc, "file_scan_path", await staged.commit_to_store(store, file_ext))
+        reset_scan_info(doc, staged.size)
 
         # Оновлюємо документ
         old_status = doc.status.value
-        doc.file_scan_path = str(save_path)
         doc.is_blocked = True
         doc.blocked_reason = "Документ має завантажений скан. Редагування заблоковано."
 
@@ -833,15 +946,19 @@ async def upload_scan(
         # WebSocket повідомлення про завантаження скану
         await manager.notify_document_signed(document_id, str(save_path))
         await manager.notify_document_status_changed(document_id, doc.status.value, old_status)
+        _queue_scan_processing(db, doc)
 
         return UploadResponse(
             success=True,
             file_path=str(save_path),
             message="Скан успішно завантажено",
+            sha256=staged.sha256,
+            size=staged.size,
         )
 
     except Exception as e:
         db.rollback()
+        await staged.discard()
         raise HTTPException(status_code=500, detail=f"Помилка збереження файлу: {str(e)}")
 
 
@@ -938,27 +1055,23 @@ async def direct_scan_upload(
     db.refresh(document)
     
     # Render document HTML using the same logic as document preview
-    document.rendered_html = render_document(document, db)
+    refresh_rendered_html(document, db)
     db.commit()
 
     # 2. Save file
-    storage_dir = os.path.join("storage", "scans")
-    os.makedirs(storage_dir, exist_ok=True)
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    ext = file.filename.split(".")[-1]
-    filename = f"scan_{document.id}_{timestamp}.{ext}"
-    file_path = os.path.join(storage_dir, filename)
-    
+    store = BlobStore(db)
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        staged = await stage_upload(file)
+        blob = await staged.commit_to_store(store, Path(file.filename or "").suffix)
     except Exception as e:
         db.delete(document) # Rollback document creation on file failure
         db.commit()
+        if isinstance(e, ScanTooLargeError):
+            raise HTTPException(status_code=413, detail=str(e))
         raise HTTPException(status_code=500, detail=f"Помилка збереження файлу: {str(e)}")
 
-    document.file_scan_path = file_path
+    store.attach(document, "file_scan_path", blob)
+    reset_scan_info(document, staged.size)
     document.is_blocked = True
     document.blocked_reason = "Документ має завантажений скан. Редагування заблоковано."
     document.scanned_at = datetime.now()
@@ -1003,7 +1116,8 @@ async def direct_scan_upload(
             print(f"Error auto-creating attendance: {e}")
 
     db.commit()
-    
+    _queue_scan_processing(db, document)
+
     return {"message": "Документ створено та скан завантажено", "document_id": document.id}
 
 
@@ -0,0 +1,95 @@
+"""API маршрути фонових задач генерації документів."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from backend.api.dependencies import DBSession
+from backend.core.dependencies import get_current_user, require_department_head
+from backend.models.document import Document
+from backend.models.generation_job import GenerationJob, JobStatus
+from backend.schemas.document import BulkGenerateRequest
+from backend.schemas.job import JobResponse, TabelPdfJobRequest
+from backend.services.generation_jobs import submit_bulk_generate, submit_document_pdf, submit_tabel_pdf
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def _job_response(job: GenerationJob, created: bool = True) -> JobResponse:
+    return JobResponse(**job.to_dict(), deduplicated=not created)
+
+
+@router.post("/documents/{document_id}/pdf", response_model=JobResponse, status_code=202)
+async def submit_document_pdf_job(
+    document_id: int,
+    db: DBSession,
+    current_user=Depends(get_current_user),
+):
+    """
+    Поставити в чергу генерацію PDF документа.
+
+    Повторний запит для того ж документа, поки задача активна, повертає
+    ту саму задачу (deduplicated=true).
+    """
+    if db.get(Document, document_id) is None:
+        raise HTTPException(status_code=404, detail="Документ не знайдено")
+    job, created = submit_document_pdf(db, document_id, created_by=current_user.username)
+    return _job_response(job, created)
+
+
+@router.post("/bulk-generate", response_model=JobResponse, status_code=202)
+async def submit_bulk_generate_job(
+    request: BulkGenerateRequest,
+    db: DBSession,
+    current_user=Depends(require_department_head),
+):
+    """
+    Поставити в чергу масове створення документів.
+
+    Прогрес і результат по кожному співробітнику - у results задачі.
+    """
+    if not request.staff_ids:
+        raise HTTPException(status_code=400, detail="Список співробітників порожній")
+    job, created = submit_bulk_generate(db, request.model_dump(mode="json"), created_by=current_user.username)
+    return _job_response(job, created)
+
+
+@router.post("/tabel-pdf", response_model=JobResponse, status_code=202)
+async def submit_tabel_pdf_job(
+    request: TabelPdfJobRequest,
+    db: DBSession,
+    current_user=Depends(require_department_head),
+):
+    """Поставити в чергу генерацію PDF табеля (з титульною сторінкою)."""
+    job, created = submit_tabel_pdf(db, request.model_dump(mode="json"), created_by=current_user.username)
+    return _job_response(job, created)
+
+
+@router.get("", response_model=list[JobResponse])
+async def list_jobs(
+    db: DBSession,
+    status: JobStatus | None = Query(None, description="Фільтр за статусом"),
+    limit: int = Query(50, ge=1, le=200),
+    current_user=Depends(get_current_user),
+):
+    """Останні задачі генерації."""
+    query = db.query(GenerationJob)
+    if status is not None:
+        query = query.filter(GenerationJob.status == status)
+    jobs = query.order_by(GenerationJob.id.desc()).limit(limit).all()
+    return [_job_response(job) for job in jobs]
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: int,
+    db: DBSession,
+    current_user=Depends(get_current_user),
+):
+    """
+    Стан задачі: статус, прогрес, часткові результати та помилки.
+
+    Ті самі оновлення розсилаються по WebSocket /ws (type="job_updated").
+    """
+    job = db.get(GenerationJob, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Задачу не знайдено")
+    return _job_response(job)
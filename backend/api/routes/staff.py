@@ -8,16 +8,21 @@ from sqlalchemy.orm import Session
 
 from backend.api.dependencies import DBSession
 from backend.core.dependencies import get_current_user, require_admin, require_department_head, require_employee
+from backend.core.pagination import InvalidCursorError, paginate
 from backend.models.staff import Staff
 from backend.models.document import Document
 from backend.models.schedule import AnnualSchedule
 from backend.models.attendance import Attendance
 from backend.schemas.staff import StaffCreate, StaffListResponse, StaffResponse, StaffUpdate
+from backend.services.search_service import apply_staff_search
 from backend.services.staff_service import StaffService
 from shared.enums import EmploymentType
 
 router = APIRouter(prefix="/staff", tags=["staff"])
 
+# Порядок списку співробітників: за ПІБ
+STAFF_SORT_KEY = ((Staff.pib_nom, False), (Staff.id, False))
+
 
 @router.get("", response_model=StaffListResponse)
 async def list_staff(
@@ -28,6 +33,8 @@ async def list_staff(
     employment_type: EmploymentType | None = Query(None, description="Фільтр за типом працевлаштування"),
     search: str | None = Query(None, description="Пошук за ПІБ"),
     filter: str | None = Query(None, description="Фільтр: 'expiring' для контрактів, що скоро закінчуються"),
+    cursor: str | None = Query(None, description="Курсор наступної сторінки (next_cursor з попередньої відповіді)"),
+    include_total: bool | None = Query(None, description="Рахувати загальну кількість (за замовчуванням - лише без курсора)"),
     current_user: get_current_user = Depends(require_employee),
 ):
     """
@@ -42,12 +49,15 @@ async def list_staff(
     - **employment_type** (str, optional): Фільтр за типом працевлаштування (main/external/internal).
     - **search** (str, optional): Пошуковий рядок (пошук за ПІБ).
     - **filter** (str, optional): Спеціальні фільтри (наприклад, 'expiring' для контрактів, що закінчуються).
+    - **cursor** (str, optional): Keyset пагінація за (pib_nom, id); skip ігнорується.
+    - **include_total** (bool, optional): Чи рахувати total (за замовчуванням - лише без курсора).
 
     Returns:
     - **items**: Список об'єктів StaffResponse.
-    - **total**: Загальна кількість записів, що відповідають фільтрам.
+    - **total**: Загальна кількість записів, що відповідають фільтрам (None, якщо не рахувалася).
     - **page**: Номер поточної сторінки.
     - **page_size**: Розмір сторінки.
+    - **next_cursor**: Курсор наступної сторінки або None.
     """
     query = db.query(Staff)
 
@@ -58,7 +68,7 @@ async def list_staff(
         query = query.filter(Staff.employment_type == employment_type)
 
     if search:
-        query = query.filter(Staff.pib_nom.ilike(f"%{search}%"))
+        query = apply_staff_search(query, db, search)
 
     # Filter for expiring contracts (within 30 days)
     if filter == 'expiring':
@@ -68,8 +78,13 @@ async def list_staff(
             Staff.term_end <= deadline,
         )
 
-    total = int(query.count())
-    items = query.order_by(Staff.pib_nom).offset(skip).limit(limit).all()
+    if include_total is None:
+        include_total = cursor is None
+    total = int(query.count()) if include_total else None
+    try:
+        items, next_cursor = paginate(query, STAFF_SORT_KEY, limit, cursor=cursor, skip=skip)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     # Додаємо computed properties
     result_items = []
@@ -84,6 +99,7 @@ async def list_staff(
         total=total,
         page=skip // limit + 1,
         page_size=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -297,7 +313,8 @@ async def search_staff(
     """
     Швидкий пошук співробітників (для автодоповнення).
 
-    Шукає активних співробітників за входженням рядка в ПІБ або назву посади.
+    Шукає активних співробітників за словами (префіксами) ПІБ або назви посади,
+    найрелевантніші першими.
     Повертає обмежений список результатів (до 20 записів) у спрощеному форматі.
 
     Parameters:
@@ -306,9 +323,12 @@ async def search_staff(
     Returns:
     - Список скорочених об'єктів співробітників.
     """
-    query = db.query(Staff).filter(
-        Staff.is_active == True,
-        (Staff.pib_nom.ilike(f"%{q}%") | Staff.position.ilike(f"%{q}%"))
+    query = apply_staff_search(
+        db.query(Staff).filter(Staff.is_active == True),
+        db,
+        q,
+        columns=("pib_nom", "position"),
+        ranked=True,
     ).limit(20).all()
 
     return [
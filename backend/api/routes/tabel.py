@@ -1,25 +1,74 @@
 """API маршрути для табеля обліку робочого часу."""
 
 from pathlib import Path
-from typing import Optional
+from itertools import chain
+from typing import Iterator, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, model_validator
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from backend.api.dependencies import DBSession
 from backend.core.dependencies import get_current_user, require_department_head
 from backend.services.tabel_service import (
     generate_tabel_html,
+    stream_tabel_html,
     save_tabel_archive,
     list_tabel_archives,
     reconstruct_tabel_from_archive,
-    reconstruct_tabel_html_from_archive,
 )
+from backend.services.tabel_render_cache import get_cached_tabel_html, render_cache_key
 from backend.services.tabel_approval_service import TabelApprovalService
+from backend.services.tabel_batch_service import (
+    MAX_BATCH_TARGETS,
+    TabelTarget,
+    generate_tabel_batch,
+)
 from backend.models.settings import SystemSettings
 
 router = APIRouter(prefix="/tabel", tags=["tabel"])
 
+class TabelBatchTarget(BaseModel):
+    """Табель у пакетному запиті."""
+    month: int = Field(..., ge=1, le=12)
+    year: int = Field(..., ge=2020, le=2100)
+    is_correction: bool = False
+    correction_month: Optional[int] = Field(None, ge=1, le=12)
+    correction_year: Optional[int] = Field(None, ge=2020, le=2100)
+
+    @model_validator(mode="after")
+    def validate_correction_period(self):
+        """Табель корекції потребує місяця та року, що коригуються."""
+        if self.is_correction and (self.correction_month is None or self.correction_year is None):
+            raise ValueError("Для табеля корекції потрібні correction_month і correction_year")
+        return self
+
+
+class TabelBatchRequest(BaseModel):
+    """Запит пакетної генерації табелів."""
+    targets: list[TabelBatchTarget] = Field(..., min_length=1, max_length=MAX_BATCH_TARGETS)
+    employees_per_page: int = Field(0, ge=0)
+
+
+# Розмір фрагмента відповіді при потоковій передачі HTML
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _buffered_chunks(chunks: Iterator[str], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """Об'єднує дрібні фрагменти Template.generate у блоки ~chunk_size символів."""
+    buffer: list[str] = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            yield "".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer)
+
 
 @router.get("/generate")
 async def generate_tabel(
@@ -79,6 +128,107 @@ async def generate_tabel(
         )
 
 
+@router.get("/generate/stream")
+async def generate_tabel_stream(
+    month: int = Query(..., ge=1, le=12, description="Month (1-12)"),
+    year: int = Query(..., ge=2020, le=2100, description="Year"),
+    is_correction: bool = Query(
+        False, description="Whether this is a correction tabel"
+    ),
+    correction_month: Optional[int] = Query(
+        None, ge=1, le=12, description="Correction month"
+    ),
+    correction_year: Optional[int] = Query(
+        None, ge=2020, le=2100, description="Correction year"
+    ),
+    employees_per_page: int = Query(
+        0, ge=0, description="Employees per page (0 = single page)"
+    ),
+    db: DBSession = None,
+    current_user=Depends(require_department_head),
+):
+    """
+    Потокова генерація HTML табеля.
+
+    Віддає text/html частинами (chunked transfer): кожна сторінка надсилається
+    одразу після рендерингу, тому клієнт може показати першу сторінку, поки
+    решта ще формується. Об'єднаний результат збігається з полем `html`
+    відповіді `/generate`.
+    """
+    institution_name = SystemSettings.get_value(db, "institution_name", "ЦНТУ")
+    edrpou_code = SystemSettings.get_value(db, "edrpou_code", "02065502")
+
+    chunks = stream_tabel_html(
+        month=month,
+        year=year,
+        institution_name=institution_name,
+        edrpou_code=edrpou_code,
+        employees_per_page=employees_per_page,
+        is_correction=is_correction,
+        correction_month=correction_month,
+        correction_year=correction_year,
+    )
+    try:
+        # Data loading happens before the first chunk; fail before headers are sent
+        first_chunk = next(chunks, "")
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Помилка генерації табеля: {str(e)}"
+        )
+
+    return StreamingResponse(
+        _buffered_chunks(chain([first_chunk], chunks)),
+        media_type="text/html; charset=utf-8",
+    )
+
+
+@router.post("/batch")
+async def generate_tabel_batch_endpoint(
+    request: TabelBatchRequest,
+    db: DBSession = None,
+    current_user=Depends(require_department_head),
+):
+    """
+    Пакетна генерація табелів (наприклад, 12 місяців та їх корекції).
+
+    Дані завантажуються одним проходом, сторінки рендеряться паралельно
+    в пулі процесів. Помилка одного табеля не зупиняє решту пакета.
+
+    Returns:
+    - **results**: Результати у порядку запиту (key, html, page_count, error).
+    """
+    institution_name = SystemSettings.get_value(db, "institution_name", "ЦНТУ")
+    edrpou_code = SystemSettings.get_value(db, "edrpou_code", "02065502")
+
+    targets = [
+        TabelTarget(
+            month=target.month,
+            year=target.year,
+            is_correction=target.is_correction,
+            correction_month=target.correction_month,
+            correction_year=target.correction_year,
+        )
+        for target in request.targets
+    ]
+    try:
+        # Long-running: keep the event loop free while the pool renders
+        results = await run_in_threadpool(
+            generate_tabel_batch,
+            targets,
+            institution_name=institution_name,
+            edrpou_code=edrpou_code,
+            employees_per_page=request.employees_per_page,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Помилка пакетної генерації табелів: {str(e)}"
+        )
+
+    return {"results": [result.to_dict() for result in results.values()]}
+
+
 @router.get("/preview")
 async def preview_tabel(
     month: int = Query(..., ge=1, le=12, description="Month (1-12)"),
@@ -188,19 +338,54 @@ async def get_tabel_archives(
         )
 
 
+@router.get("/archives/{archive_filename}/html")
+async def get_archive_html(
+    archive_filename: str,
+    request: Request,
+    current_user=Depends(require_department_head),
+):
+    """
+    HTML архівного табеля з незмінного кешу рендерингу.
+
+    Відповідь має ETag (хеш архіву + версія шаблонів); при збігу
+    If-None-Match повертається 304 без читання HTML.
+    """
+    archive_dir = Path(__file__).parent.parent.parent.parent / "tabel" / "archive"
+    archive_path = archive_dir / Path(archive_filename).name
+    if not archive_path.is_file():
+        raise HTTPException(status_code=404, detail="Архів не знайдено")
+
+    try:
+        etag = f'"{render_cache_key(archive_path)}"'
+        headers = {"ETag": etag, "Cache-Control": "private, max-age=0, must-revalidate"}
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+
+        html, _ = get_cached_tabel_html(archive_path)
+        return HTMLResponse(html, headers=headers)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Помилка відтворення архіву: {str(e)}"
+        )
+
+
 @router.get("/archives/{archive_filename}")
 async def get_archive_detail(
     archive_filename: str,
+    include_raw_data: bool = Query(
+        False, description="Include raw attendance/staff/vacation snapshots"
+    ),
     current_user=Depends(require_department_head),
 ):
     """
     Відтворити табель з архівного файлу.
 
-    Завантажує дані з JSON-файлу та рендерить HTML.
+    Завантажує дані з архіву (стиснутий v2 або JSON v1.x) та рендерить HTML.
     Дозволяє переглядати історичні табелі точно такими, якими вони були збережені.
 
     Parameters:
     - **archive_filename**: Ім'я файлу архіву.
+    - **include_raw_data**: Додати сирі знімки даних (за замовчуванням не розпаковуються).
 
     Returns:
     - Деталі архіву та відновлений HTML.
@@ -214,7 +399,9 @@ async def get_archive_detail(
             raise HTTPException(status_code=404, detail="Архів не знайдено")
 
         archive_data = reconstruct_tabel_from_archive(archive_path)
-        html = reconstruct_tabel_html_from_archive(archive_data)
+        html, _ = get_cached_tabel_html(archive_path)
+        if include_raw_data:
+            archive_data = archive_data.load_all()
 
         return {
             "archive_data": archive_data,
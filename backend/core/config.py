@@ -54,6 +54,42 @@ class Settings(BaseSettings):
         default=Path("./templates"),
         description="Директорія з Word шаблонами",
     )
+    template_bytecode_cache_dir: Path | None = Field(
+        default=None,
+        description="Директорія байткоду Jinja2 шаблонів (за замовчуванням - тимчасова)",
+    )
+    scan_max_size: int = Field(
+        default=10 * 1024 * 1024,
+        description="Максимальний розмір скану в байтах",
+    )
+    upload_chunk_size: int = Field(
+        default=1024 * 1024,
+        description="Розмір блоку потокового завантаження файлів в байтах",
+    )
+    thumbnail_width: int = Field(
+        default=256,
+        description="Ширина мініатюри скану в пікселях",
+    )
+
+    # PDF
+    pdf_workers: int = Field(
+        default=2,
+        description="Кількість процесів рендерингу PDF (0 - лише weasyprint.exe)",
+    )
+    pdf_queue_size: int = Field(
+        default=32,
+        description="Максимальна кількість PDF, що очікують на рендеринг",
+    )
+    pdf_job_timeout: float = Field(
+        default=60.0,
+        description="Ліміт часу рендерингу одного PDF в секундах",
+    )
+
+    # JOBS
+    job_workers: int = Field(
+        default=2,
+        description="Кількість потоків виконання фонових задач генерації",
+    )
 
     # LOGGING
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
@@ -0,0 +1,129 @@
+"""Keyset (cursor) пагінація для списків.
+
+Замість OFFSET наступна сторінка вибирається умовою "після останнього
+рядка попередньої сторінки" за ключем сортування, що закінчується
+унікальним id, тому глибокі сторінки не повільніші за першу.
+
+Курсор - непрозорий рядок (base64url від JSON значень ключа останнього
+рядка), який клієнт передає назад без змін.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Sequence
+
+from sqlalchemy import String, and_, or_, type_coerce
+from sqlalchemy.orm import Query
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+# Ключ сортування: (колонка, за спаданням)
+SortKey = Sequence[tuple[InstrumentedAttribute, bool]]
+
+
+class InvalidCursorError(ValueError):
+    """Курсор пошкоджений або не відповідає списку."""
+
+
+def _raw(column: InstrumentedAttribute):
+    """
+    Колонка без перетворення типу.
+
+    SQLite зберігає дати як текст у різних форматах (func.now() - без
+    мікросекунд, Python datetime - з ними), тому курсор зберігає і порівнює
+    саме збережене значення: так умова курсора збігається з ORDER BY.
+    """
+    return type_coerce(column, String)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Створює курсор зі значень ключа сортування рядка.
+
+    Args:
+        values: Збережені значення колонок ключа сортування
+
+    Returns:
+        str: Непрозорий курсор
+    """
+    payload = json.dumps(
+        [_encode_value(value) for value in values], ensure_ascii=False, separators=(",", ":"),
+    ).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: SortKey) -> list[Any]:
+    """
+    Розбирає курсор у значення ключа сортування.
+
+    Raises:
+        InvalidCursorError: Якщо курсор некоректний
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError("Некоректний курсор пагінації") from e
+    if (
+        not isinstance(values, list)
+        or len(values) != len(sort_key)
+        or not all(isinstance(value, (str, int, float)) for value in values)
+    ):
+        raise InvalidCursorError("Некоректний курсор пагінації")
+    return values
+
+
+def _after(sort_key: SortKey, values: list[Any]):
+    """Умова "рядок іде після курсора" (лексикографічно, з урахуванням напрямку)."""
+    columns = [_raw(column) for column, _ in sort_key]
+    conditions = []
+    for i, (_, descending) in enumerate(sort_key):
+        step = columns[i] < values[i] if descending else columns[i] > values[i]
+        conditions.append(and_(*(columns[j] == values[j] for j in range(i)), step))
+    return or_(*conditions)
+
+
+def paginate(
+    query: Query,
+    sort_key: SortKey,
+    limit: int,
+    cursor: str | None = None,
+    skip: int = 0,
+) -> tuple[list[Any], str | None]:
+    """
+    Повертає сторінку списку та курсор наступної сторінки.
+
+    З курсором сторінка вибирається keyset умовою (skip ігнорується), без
+    курсора - як раніше через OFFSET. Курсор наступної сторінки
+    повертається в обох режимах.
+
+    Args:
+        query: Відфільтрований запит без сортування
+        sort_key: Ключ сортування; має закінчуватися унікальною колонкою (id)
+        limit: Розмір сторінки
+        cursor: Курсор з попередньої відповіді
+        skip: Зсув (лише без курсора)
+
+    Returns:
+        tuple: (рядки сторінки, next_cursor або None для останньої сторінки)
+
+    Raises:
+        InvalidCursorError: Якщо курсор некоректний
+    """
+    query = query.order_by(*(column.desc() if descending else column.asc() for column, descending in sort_key))
+    if cursor:
+        query = query.filter(_after(sort_key, decode_cursor(cursor, sort_key)))
+    elif skip:
+        query = query.offset(skip)
+
+    # One extra row tells whether there is a next page without a COUNT
+    rows = query.add_columns(*(_raw(column) for column, _ in sort_key)).limit(limit + 1).all()
+    next_cursor = encode_cursor(rows[limit - 1][1:]) if len(rows) > limit else None
+    return [row[0] for row in rows[:limit]], next_cursor
@@ -10,7 +10,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import func
 
-from backend.api.routes import documents, schedule, staff, auth, attendance, settings as settings_routes, tabel, dashboard, bulk, telegram
+from backend.api.routes import documents, schedule, staff, auth, attendance, settings as settings_routes, tabel, dashboard, bulk, jobs, telegram
 from backend.api.dependencies import DBSession
 from backend.core.config import get_settings
 from backend.core.logging import setup_logging
@@ -67,6 +67,13 @@ async def lifespan(app: FastAPI):
 
     monitor_task = asyncio.create_task(stale_monitor_loop())
 
+    # Background generation jobs (handlers are registered on import)
+    from backend.services.generation_jobs import job_queue
+    try:
+        job_queue.start(asyncio.get_running_loop())
+    except Exception as e:
+        logging.error(f"Failed to recover generation jobs: {e}")
+
     # Setup Telegram bot webhook if enabled
     if settings.telegram_enabled:
         try:
@@ -108,6 +115,14 @@ async def lifespan(app: FastAPI):
         pass
     logging.info("Stale document monitor stopped")
 
+    job_queue.shutdown()
+
+    from backend.services.pdf_renderer import shutdown_pdf_backend
+    shutdown_pdf_backend()
+
+    from backend.services.tabel_batch_service import shutdown_render_pool
+    shutdown_render_pool()
+
     # Delete Telegram webhook on shutdown
     if settings.telegram_enabled:
         try:
@@ -179,6 +194,7 @@ app.include_router(settings_routes.router, prefix="/api")
 app.include_router(tabel.router, prefix="/api")
 app.include_router(dashboard.router, prefix="/api")
 app.include_router(bulk.router, prefix="/api")
+app.include_router(jobs.router, prefix="/api")
 app.include_router(telegram.router, prefix="/api/telegram", tags=["telegram"])
 
 
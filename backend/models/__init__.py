@@ -18,6 +18,11 @@ from backend.models.settings import SystemSettings, Approvers
 from backend.models.staff_history import StaffHistory
 from backend.models.tabel_approval import TabelApproval
 from backend.models.telegram_link_request import TelegramLinkRequest, LinkRequestStatus
+from backend.models.generation_job import GenerationJob, JobStatus
+from backend.models.blob import StoredBlob
+
+# Повнотекстові індекси (створюються разом з таблицями)
+from backend.models import search  # noqa: F401
 
 __all__ = [
     "Base",
@@ -39,5 +44,8 @@ __all__ = [
     "TabelApproval",
     "TelegramLinkRequest",
     "LinkRequestStatus",
+    "GenerationJob",
+    "JobStatus",
+    "StoredBlob",
 ]
 
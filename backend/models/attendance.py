@@ -4,7 +4,7 @@ from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Date, ForeignKey, Integer, Numeric, String
+from sqlalchemy import Boolean, Date, ForeignKey, Index, Integer, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.models.base import Base, TimestampMixin
@@ -64,6 +64,9 @@ ATTENDANCE_CODES = {
 # Reverse mapping: numeric code -> letter code
 CODE_TO_LETTER = {v: k for k, v in ATTENDANCE_CODES.items()}
 
+# Codes of days actually worked (full, part-time, evening, night, overtime, holiday work)
+WORK_DAY_CODES = ("Р", "РС", "ВЧ", "РН", "НУ", "РВ")
+
 # Weekend days (Saturday=5, Sunday=6)
 WEEKEND_DAYS = {5, 6}
 
@@ -85,6 +88,12 @@ class Attendance(Base, TimestampMixin):
     """
 
     __tablename__ = "attendance"
+    __table_args__ = (
+        # Відмітки працівника за період (перевірки, корекції за день)
+        Index("ix_attendance_staff_date", "staff_id", "date", "is_correction"),
+        # Корегуючий табель за місяць
+        Index("ix_attendance_correction_period", "correction_year", "correction_month", "date"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     staff_id: Mapped[int] = mapped_column(
@@ -176,7 +185,7 @@ class Attendance(Base, TimestampMixin):
     @property
     def is_work_day(self) -> bool:
         """Чи є робочим днем (Р, РС, ВЧ, РН, НУ, РВ)."""
-        return self.code in ("Р", "РС", "ВЧ", "РН", "НУ", "РВ")
+        return self.code in WORK_DAY_CODES
 
     @property
     def is_vacation(self) -> bool:
@@ -0,0 +1,38 @@
+"""Модель файлу в контентно-адресованому сховищі."""
+
+from sqlalchemy import BigInteger, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.models.base import Base, TimestampMixin
+
+
+class StoredBlob(Base, TimestampMixin):
+    """
+    Файл сховища, адресований SHA-256 вмісту (скан, PDF документа).
+
+    Файл лежить у storage_dir/blobs/<aa>/<bb>/<sha256><розширення>;
+    документи посилаються на цей шлях у file_scan_path/file_docx_path.
+    Однаковий вміст зберігається один раз.
+
+    Attributes:
+        sha256: Хеш вмісту (ключ)
+        size: Розмір у байтах
+        extension: Розширення файлу (".pdf", ".jpg", ...)
+        ref_count: Кількість посилань з документів (0 - кандидат на видалення)
+    """
+
+    __tablename__ = "blobs"
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    extension: Mapped[str] = mapped_column(String(10), nullable=False, default="")
+    ref_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        index=True,
+        comment="Кількість посилань з документів",
+    )
+
+    def __repr__(self) -> str:
+        return f"<StoredBlob {self.sha256[:12]}{self.extension} refs={self.ref_count}>"
@@ -3,7 +3,12 @@
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Date, DateTime, Enum as SQLEnum, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy import (
+    BigInteger, Boolean, Date, DateTime, Enum as SQLEnum, ForeignKey, Index, Integer, JSON, String, Text,
+    bindparam, func,
+)
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,6 +38,9 @@ class Document(Base, TimestampMixin):
         editor_content: JSON контент WYSIWYG редактора
         file_docx_path: Шлях до PDF файлу
         file_scan_path: Шлях до скану підписаного документа
+        scan_page_count: Кількість сторінок скану
+        scan_size: Розмір скану в байтах
+        scan_thumbnail_path: Мініатюра першої сторінки скану
         signed_at: Час підписання ректором
         processed_at: Час обробки (додано до табелю)
         rollback_reason: Причина відкату до чернетки
@@ -67,6 +75,17 @@ class Document(Base, TimestampMixin):
     """
 
     __tablename__ = "documents"
+    __table_args__ = (
+        # Документи працівника в статусах (перетини, заблоковані дні, списки)
+        Index("ix_documents_staff_status", "staff_id", "status"),
+        # Застарілі документи: статуси процесу + давно без зміни статусу
+        Index("ix_documents_status_changed", "status", "status_changed_at"),
+        # Відпустки у табелі (перетин з місяцем) і майбутні відпустки на дашборді;
+        # date_end у індексі дозволяє перевірити перетин без читання рядка
+        Index("ix_documents_status_period", "status", "date_start", "date_end"),
+        # Реєстр документів (keyset за created_at, id) і лічильники за день
+        Index("ix_documents_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     staff_id: Mapped[int] = mapped_column(ForeignKey("staff.id", ondelete="RESTRICT"), nullable=False)
@@ -98,9 +117,29 @@ class Document(Base, TimestampMixin):
         nullable=True,
         comment="Rendered HTML content for document preview",
     )
+    rendered_html_fingerprint: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="Відбиток даних, з яких відрендерено rendered_html",
+    )
 
     file_docx_path: Mapped[str | None] = mapped_column(String(500))
     file_scan_path: Mapped[str | None] = mapped_column(String(500))
+    scan_page_count: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Кількість сторінок скану",
+    )
+    scan_size: Mapped[int | None] = mapped_column(
+        BigInteger,
+        nullable=True,
+        comment="Розмір файлу скану в байтах",
+    )
+    scan_thumbnail_path: Mapped[str | None] = mapped_column(
+        String(500),
+        nullable=True,
+        comment="Мініатюра першої сторінки скану",
+    )
     archive_metadata_path: Mapped[str | None] = mapped_column(
         String(500),
         nullable=True,
@@ -344,3 +383,43 @@ class Document(Base, TimestampMixin):
         self.tabel_added_at = None
         self.tabel_added_comment = None
         self.status = DocumentStatus.DRAFT
+
+
+# Статуси, у яких документ може "застаріти" (усі, крім термінальних)
+STALE_MONITORED_STATUSES = (
+    DocumentStatus.DRAFT,
+    DocumentStatus.SIGNED_BY_APPLICANT,
+    DocumentStatus.APPROVED_BY_DISPATCHER,
+    DocumentStatus.SIGNED_DEP_HEAD,
+    DocumentStatus.AGREED,
+    DocumentStatus.SIGNED_RECTOR,
+    DocumentStatus.SCANNED,
+)
+
+
+def stale_age_reference():
+    """Час, від якого рахується застарілість: остання зміна статусу або запису."""
+    return func.coalesce(Document.status_changed_at, Document.updated_at, Document.created_at)
+
+
+def stale_status_condition():
+    """
+    Умова "статус відстежується на застарілість" - та сама, що в ix_documents_stale_age.
+
+    SQLite використовує частковий індекс, лише якщо запит містить ту саму
+    умову, тому статуси вставляються в SQL літералами. Унарний "+" не дає
+    планувальнику обрати для неї ix_documents_status_changed.
+    """
+    status = UnaryExpression(Document.status, operator=operators.custom_op("+"), type_=Document.status.type)
+    return status.in_(bindparam(
+        "stale_statuses", list(STALE_MONITORED_STATUSES), expanding=True, literal_execute=True, unique=True,
+    ))
+
+
+# Застарілі документи за віком (keyset список, лічильник) - лише рядки процесу
+Index(
+    "ix_documents_stale_age",
+    stale_age_reference(),
+    Document.id,
+    sqlite_where=stale_status_condition(),
+)
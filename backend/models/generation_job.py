@@ -0,0 +1,101 @@
+"""Модель фонової задачі генерації документів."""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import JSON, Integer, String, Text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.models.base import Base, TimestampMixin
+
+
+class JobStatus(str, Enum):
+    """Статус фонової задачі."""
+    QUEUED = "queued"        # Очікує на виконання
+    RUNNING = "running"      # Виконується
+    SUCCEEDED = "succeeded"  # Завершена (окремі елементи можуть мати помилки)
+    FAILED = "failed"        # Завершена з помилкою
+
+    @property
+    def is_active(self) -> bool:
+        """Чи задача ще не завершена."""
+        return self in (JobStatus.QUEUED, JobStatus.RUNNING)
+
+
+ACTIVE_JOB_STATUSES = (JobStatus.QUEUED, JobStatus.RUNNING)
+
+
+class GenerationJob(Base, TimestampMixin):
+    """
+    Фонова задача генерації (PDF документа, масова генерація, PDF табеля).
+
+    Задача зберігається в БД, тому її стан доступний після перезапуску
+    сервера, а незавершені задачі ставляться в чергу знову.
+
+    Attributes:
+        id: Унікальний ідентифікатор (job id для /api/jobs/{id})
+        kind: Тип задачі (ключ обробника)
+        status: Статус задачі
+        dedup_key: Ключ дедуплікації (однакові активні задачі не дублюються)
+        params: Параметри задачі
+        progress_done: Кількість оброблених елементів
+        progress_total: Загальна кількість елементів (None - невідомо)
+        results: Часткові результати (по одному на елемент)
+        result: Підсумковий результат
+        error: Текст помилки
+        created_by: Хто створив задачу
+        started_at: Час початку виконання
+        finished_at: Час завершення
+    """
+
+    __tablename__ = "generation_jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    status: Mapped[JobStatus] = mapped_column(
+        SQLEnum(JobStatus),
+        nullable=False,
+        default=JobStatus.QUEUED,
+        index=True,
+    )
+    dedup_key: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+        index=True,
+        comment="Ключ дедуплікації однакових задач",
+    )
+    params: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+    progress_done: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    progress_total: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    results: Mapped[list[Any]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=list,
+        comment="Часткові результати по елементах",
+    )
+    result: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_by: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Стан задачі для API та WebSocket."""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status.value,
+            "progress_done": self.progress_done,
+            "progress_total": self.progress_total,
+            "results": self.results or [],
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    def __repr__(self) -> str:
+        return f"<GenerationJob {self.id}: {self.kind} ({self.status.value})>"
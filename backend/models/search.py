@@ -0,0 +1,128 @@
+"""Повнотекстові індекси SQLite FTS5 для документів і співробітників.
+
+Віртуальні таблиці documents_fts і staff_fts мають rowid, рівний id
+запису, і синхронізуються тригерами. Тригери спрацьовують і для змін з
+desktop додатку, який пише в ту ж БД напряму.
+
+Токенізатор unicode61 приводить до нижнього регістру всі літери Unicode,
+включно з українською кирилицею (вбудований lower() SQLite цього не робить).
+
+Індекси створюються міграцією або разом з таблицями при
+Base.metadata.create_all().
+"""
+
+import logging
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+
+from backend.models.base import Base
+
+logger = logging.getLogger(__name__)
+
+DOCUMENTS_FTS_TABLE = "documents_fts"
+STAFF_FTS_TABLE = "staff_fts"
+FTS_TOKENIZER = "unicode61 remove_diacritics 2"
+
+# Коментарі етапів документа індексуються однією колонкою "comments"
+DOCUMENT_COMMENT_COLUMNS = (
+    "applicant_signed_comment",
+    "approval_comment",
+    "department_head_comment",
+    "approval_order_comment",
+    "rector_comment",
+    "scanned_comment",
+    "tabel_added_comment",
+    "rollback_reason",
+    "stale_explanation",
+)
+
+# Колонки FTS таблиці -> SQL вираз над рядком (prefix: new/old)
+DOCUMENTS_FTS_COLUMNS = {
+    "custom_text": "{row}.custom_text",
+    "editor_content": "{row}.editor_content",
+    "comments": " || ' ' || ".join(f"coalesce({{row}}.{column}, '')" for column in DOCUMENT_COMMENT_COLUMNS),
+}
+STAFF_FTS_COLUMNS = {
+    "pib_nom": "{row}.pib_nom",
+    "pib_dav": "{row}.pib_dav",
+    "position": "{row}.position",
+}
+
+# (FTS таблиця, таблиця-джерело, колонки, колонки-джерела для тригера UPDATE)
+_INDEXES = (
+    (DOCUMENTS_FTS_TABLE, "documents", DOCUMENTS_FTS_COLUMNS, ("custom_text", "editor_content", *DOCUMENT_COMMENT_COLUMNS)),
+    (STAFF_FTS_TABLE, "staff", STAFF_FTS_COLUMNS, ("pib_nom", "pib_dav", "position")),
+)
+
+
+def _insert_sql(fts_table: str, columns: dict[str, str], row: str) -> str:
+    names = ", ".join(columns)
+    values = ", ".join(expr.format(row=row) for expr in columns.values())
+    return f"INSERT INTO {fts_table}(rowid, {names}) VALUES ({row}.id, {values});"
+
+
+def search_index_ddl() -> list[str]:
+    """SQL для створення FTS таблиць і тригерів (ідемпотентний)."""
+    statements = []
+    for fts_table, source, columns, watched in _INDEXES:
+        statements += [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} "
+            f"USING fts5({', '.join(columns)}, tokenize='{FTS_TOKENIZER}')",
+            f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {source} BEGIN "
+            f"{_insert_sql(fts_table, columns, 'new')} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {source} BEGIN "
+            f"DELETE FROM {fts_table} WHERE rowid = old.id; END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {', '.join(watched)} ON {source} BEGIN "
+            f"DELETE FROM {fts_table} WHERE rowid = old.id; "
+            f"{_insert_sql(fts_table, columns, 'new')} END",
+        ]
+    return statements
+
+
+def drop_search_index_ddl() -> list[str]:
+    """SQL для видалення FTS таблиць і тригерів."""
+    statements = []
+    for fts_table, _, _, _ in _INDEXES:
+        statements += [f"DROP TRIGGER IF EXISTS {fts_table}_{suffix}" for suffix in ("ai", "ad", "au")]
+        statements.append(f"DROP TABLE IF EXISTS {fts_table}")
+    return statements
+
+
+def rebuild_search_index(connection: Connection) -> None:
+    """Повністю перебудовує FTS таблиці з даних документів і співробітників."""
+    for fts_table, source, columns, _ in _INDEXES:
+        names = ", ".join(columns)
+        values = ", ".join(expr.format(row=source) for expr in columns.values())
+        connection.execute(text(f"DELETE FROM {fts_table}"))
+        connection.execute(text(
+            f"INSERT INTO {fts_table}(rowid, {names}) SELECT {source}.id, {values} FROM {source}"
+        ))
+
+
+def create_search_index(connection: Connection) -> bool:
+    """
+    Створює FTS таблиці, тригери та заповнює їх.
+
+    Args:
+        connection: З'єднання з SQLite
+
+    Returns:
+        bool: False, якщо SQLite зібрано без FTS5 (пошук працюватиме через LIKE)
+    """
+    try:
+        for statement in search_index_ddl():
+            connection.execute(text(statement))
+    except OperationalError as e:
+        logger.warning(f"FTS5 search index is unavailable: {e}")
+        return False
+    rebuild_search_index(connection)
+    return True
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_index_with_tables(target, connection: Connection, **kw) -> None:
+    """Нові БД (create_all) одразу отримують пошукові індекси."""
+    if connection.dialect.name == "sqlite":
+        create_search_index(connection)
@@ -71,6 +71,29 @@ class SystemSettings(Base):
         except json.JSONDecodeError:
             return setting.value
 
+    @classmethod
+    def get_values(cls, session: Any, keys: list[str] | tuple[str, ...]) -> dict[str, Any]:
+        """
+        Отримує значення кількох налаштувань одним запитом.
+
+        Args:
+            session: Сесія бази даних
+            keys: Ключі налаштувань
+
+        Returns:
+            Словник {ключ: значення} лише для наявних ключів
+        """
+        if not keys:
+            return {}
+
+        values = {}
+        for setting in session.query(cls).filter(cls.key.in_(list(keys))).all():
+            try:
+                values[setting.key] = json.loads(setting.value)
+            except json.JSONDecodeError:
+                values[setting.key] = setting.value
+        return values
+
     @classmethod
     def set_value(cls, session: Any, key: str, value: Any) -> None:
         """
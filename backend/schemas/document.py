@@ -71,6 +71,8 @@ class DocumentResponse(DocumentBase):
     days_count: int
     file_docx_path: str | None
     file_scan_path: str | None
+    scan_page_count: int | None = None
+    scan_size: int | None = None
     created_at: datetime
     updated_at: datetime
     signed_at: datetime | None
@@ -177,6 +179,10 @@ class BulkGenerateRequest(BaseModel):
     date_start: date = Field(..., description="Початок відпустки")
     date_end: date = Field(..., description="Кінець відпустки")
     file_suffix: str = Field(default="", description="Суфікс для назви файлу")
+    render_pdf: bool = Field(default=False, description="Згенерувати PDF файли документів (для великих пакетів - /api/jobs/bulk-generate)")
+    validation_token: str | None = Field(
+        default=None, description="Токен з /bulk/validate (повторна валідація не виконується)"
+    )
 
 
 class StaleResolutionRequest(BaseModel):
@@ -0,0 +1,35 @@
+"""Pydantic схеми для фонових задач генерації."""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class TabelPdfJobRequest(BaseModel):
+    """Запит на генерацію PDF табеля."""
+
+    month: int = Field(..., ge=1, le=12)
+    year: int = Field(..., ge=2020, le=2100)
+    is_correction: bool = False
+    correction_month: int | None = Field(None, ge=1, le=12)
+    correction_year: int | None = Field(None, ge=2020, le=2100)
+    employees_per_page: int = Field(0, ge=0)
+    add_title_page: bool = True
+
+
+class JobResponse(BaseModel):
+    """Стан фонової задачі."""
+
+    id: int
+    kind: str
+    status: str
+    progress_done: int = 0
+    progress_total: int | None = None
+    results: list[dict[str, Any]] = Field(default_factory=list, description="Часткові результати")
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    deduplicated: bool = Field(False, description="Повернуто вже активну задачу замість нової")
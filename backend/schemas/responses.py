@@ -38,6 +38,8 @@ class UploadResponse(BaseModel):
     success: bool
     file_path: str | None = None
     message: str
+    sha256: str | None = None
+    size: int | None = None
 
 
 class ValidationErrorResponse(BaseModel):
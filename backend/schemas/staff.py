@@ -205,6 +205,7 @@ class StaffListResponse(BaseModel):
     """Схема для списку співробітників."""
 
     items: list[StaffResponse]
-    total: int
+    total: int | None
     page: int
     page_size: int
+    next_cursor: str | None = None
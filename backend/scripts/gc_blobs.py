@@ -0,0 +1,69 @@
+"""
+Збирання сміття в контентно-адресованому сховищі файлів.
+
+Перераховує посилання документів на файли сховища (storage/blobs) і видаляє
+файли, на які не посилається жоден документ. Можна запускати періодично.
+
+Використання:
+    python backend/scripts/gc_blobs.py [--dry-run] [--min-age-hours N]
+"""
+
+import argparse
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.core.config import get_settings
+from backend.core.database import SessionLocal
+from backend.services.blob_store import DEFAULT_GC_MIN_AGE, BlobStore
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Головна функція скрипту."""
+    parser = argparse.ArgumentParser(description="Видалення файлів сховища без посилань")
+    parser.add_argument("--dry-run", action="store_true", help="Лише показати, що буде видалено")
+    parser.add_argument(
+        "--min-age-hours",
+        type=float,
+        default=DEFAULT_GC_MIN_AGE.total_seconds() / 3600,
+        help="Не видаляти файли, молодші за N годин",
+    )
+    args = parser.parse_args(argv)
+
+    settings = get_settings()
+    db = SessionLocal()
+    try:
+        print("=" * 60)
+        print("Збирання сміття у сховищі файлів")
+        print("=" * 60)
+        print(f"База даних: {settings.database_url}")
+        print(f"Сховище: {settings.storage_dir}")
+        print()
+
+        report = BlobStore(db).collect_garbage(
+            min_age=timedelta(hours=args.min_age_hours),
+            dry_run=args.dry_run,
+        )
+
+        action = "Буде видалено" if args.dry_run else "Видалено"
+        print(f"Виправлено лічильників посилань: {report.recounted}")
+        for path in report.deleted + report.orphan_files:
+            print(f"  [{'DRY' if args.dry_run else 'DEL'}] {path}")
+        print(f"{action} файлів без посилань: {len(report.deleted)}")
+        print(f"{action} файлів без запису в БД: {len(report.orphan_files)}")
+        print(f"Звільнено: {report.freed_bytes / 1024 / 1024:.1f} MB")
+        return 0
+
+    except Exception as e:
+        print(f"\n[ERROR] Помилка: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""Компактний бінарний формат архівів табелів та документів.
+
+Формат v2 (файли *.vmarc):
+
+    MAGIC (8 байт) | довжина заголовка (4 байти, big-endian) | заголовок | секції
+
+Заголовок - JSON з метаданими архіву та таблицею секцій
+(назва, зсув, довжина). Кожна секція - компактний JSON, стиснутий zlib.
+Секція "main" містить усі поля, крім ледачих (наприклад, raw_data), які
+зберігаються окремо і розпаковуються лише при першому зверненні.
+
+Читач також відкриває старі JSON архіви (v1.0/v1.1).
+"""
+
+import json
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+ARCHIVE_MAGIC = b"VMARCHV2"
+ARCHIVE_FORMAT_VERSION = 2
+ARCHIVE_SUFFIX = ".vmarc"
+LEGACY_ARCHIVE_SUFFIX = ".json"
+
+# Рівень стиснення zlib (6 - стандартний баланс швидкості та розміру)
+COMPRESSION_LEVEL = 6
+
+MAIN_SECTION = "main"
+
+_HEADER_LENGTH = struct.Struct(">I")
+
+
+class ArchiveFormatError(ValueError):
+    """Файл не є коректним архівом."""
+
+
+class ArchiveData(dict):
+    """
+    Дані архіву з ледачими секціями.
+
+    Поводиться як звичайний dict; ледача секція розпаковується при першому
+    доступі (archive["raw_data"], archive.get("raw_data")) і далі
+    зберігається в словнику.
+    """
+
+    def __init__(self, data: dict[str, Any], lazy_sections: dict[str, Callable[[], Any]] | None = None):
+        super().__init__(data)
+        self._lazy_sections = dict(lazy_sections or {})
+
+    def __missing__(self, key: str) -> Any:
+        loader = self._lazy_sections.pop(key, None)
+        if loader is None:
+            raise KeyError(key)
+        value = loader()
+        self[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or key in self._lazy_sections
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    @property
+    def pending_sections(self) -> tuple[str, ...]:
+        """Секції, які ще не були розпаковані."""
+        return tuple(self._lazy_sections)
+
+    def load_all(self) -> dict[str, Any]:
+        """Розпаковує всі ледачі секції та повертає звичайний dict."""
+        for key in list(self._lazy_sections):
+            self[key]
+        return dict(self)
+
+
+def _encode_section(value: Any) -> bytes:
+    """Компактний JSON + zlib."""
+    payload = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(payload, COMPRESSION_LEVEL)
+
+
+def _decode_section(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def write_archive(
+    path: Path,
+    data: dict[str, Any],
+    lazy_sections: Iterable[str] = (),
+    meta: dict[str, Any] | None = None,
+) -> Path:
+    """
+    Атомарно записує архів у форматі v2.
+
+    Args:
+        path: Шлях до файлу архіву
+        data: Дані архіву
+        lazy_sections: Поля верхнього рівня, що зберігаються окремими секціями
+        meta: Невеликі метадані для заголовка (читаються без розпакування)
+
+    Returns:
+        Path: Шлях до записаного архіву
+    """
+    lazy_sections = [name for name in lazy_sections if name in data]
+    main = {key: value for key, value in data.items() if key not in lazy_sections}
+    blobs = [(MAIN_SECTION, _encode_section(main))]
+    blobs += [(name, _encode_section(data[name])) for name in lazy_sections]
+
+    sections = []
+    offset = 0
+    for name, blob in blobs:
+        sections.append({"name": name, "offset": offset, "length": len(blob)})
+        offset += len(blob)
+
+    header = json.dumps({
+        "format": ARCHIVE_FORMAT_VERSION,
+        "codec": "zlib",
+        "meta": meta or {},
+        "sections": sections,
+    }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(ARCHIVE_MAGIC)
+            f.write(_HEADER_LENGTH.pack(len(header)))
+            f.write(header)
+            for _, blob in blobs:
+                f.write(blob)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def _read_header(f) -> tuple[dict[str, Any], int]:
+    """Читає заголовок v2; повертає (заголовок, зсув початку секцій)."""
+    if f.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC:
+        raise ArchiveFormatError("Not a v2 archive")
+    (header_length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+    header = json.loads(f.read(header_length).decode("utf-8"))
+    if header.get("format") != ARCHIVE_FORMAT_VERSION:
+        raise ArchiveFormatError(f"Unsupported archive format: {header.get('format')}")
+    return header, len(ARCHIVE_MAGIC) + _HEADER_LENGTH.size + header_length
+
+
+def is_compact_archive(path: Path) -> bool:
+    """Чи є файл архівом формату v2 (перевіряє сигнатуру)."""
+    with open(path, "rb") as f:
+        return f.read(len(ARCHIVE_MAGIC)) == ARCHIVE_MAGIC
+
+
+def read_archive_meta(path: Path) -> dict[str, Any]:
+    """
+    Читає лише метадані заголовка архіву v2 (без розпакування секцій).
+
+    Args:
+        path: Шлях до архіву
+
+    Returns:
+        dict: Метадані, передані у write_archive(meta=...)
+
+    Raises:
+        ArchiveFormatError: Якщо файл не є архівом v2
+    """
+    with open(path, "rb") as f:
+        header, _ = _read_header(f)
+    return header.get("meta", {})
+
+
+def read_archive(path: Path) -> ArchiveData:
+    """
+    Відкриває архів будь-якої версії.
+
+    Для v2 одразу розпаковується лише секція "main"; решта секцій
+    читається з файлу при першому зверненні. Старі JSON архіви (v1.x)
+    завантажуються повністю.
+
+    Args:
+        path: Шлях до архіву
+
+    Returns:
+        ArchiveData: Дані архіву
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        if f.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC:
+            f.seek(0)
+            return ArchiveData(json.loads(f.read().decode("utf-8")))
+        f.seek(0)
+        header, data_start = _read_header(f)
+        sections = {section["name"]: section for section in header["sections"]}
+        main = sections.pop(MAIN_SECTION)
+        f.seek(data_start + main["offset"])
+        data = _decode_section(f.read(main["length"]))
+
+    def section_loader(section: dict[str, Any]) -> Callable[[], Any]:
+        def load() -> Any:
+            with open(path, "rb") as f:
+                f.seek(data_start + section["offset"])
+                return _decode_section(f.read(section["length"]))
+        return load
+
+    return ArchiveData(data, {name: section_loader(section) for name, section in sections.items()})
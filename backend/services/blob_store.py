@@ -0,0 +1,331 @@
+"""Контентно-адресоване сховище файлів документів.
+
+Скани та PDF зберігаються під іменем SHA-256 вмісту в шардованих
+директоріях storage_dir/blobs/<aa>/<bb>/<sha256><розширення>. Документ
+посилається на файл шляхом (file_scan_path, file_docx_path), тож решта
+коду працює з ним як зі звичайним файлом. Повторне завантаження того
+самого скану або перегенерація PDF з тим самим вмістом не пише нічого
+на диск.
+
+Посилання рахуються в StoredBlob.ref_count при прив'язці файлу до
+документа; збирач сміття (backend/scripts/gc_blobs.py) перераховує їх
+за таблицею документів і видаляє файли без посилань.
+
+Старі файли з шляхами за назвою (storage/<рік>/<місяць>/...) не
+переносяться і обробляються як раніше.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.core.config import get_settings
+from backend.models.blob import StoredBlob
+from backend.models.document import Document
+
+logger = logging.getLogger(__name__)
+
+BLOBS_DIR_NAME = "blobs"
+
+# Колонки документа, що можуть посилатися на файли сховища
+BLOB_REFERENCE_FIELDS = ("file_docx_path", "file_scan_path")
+
+# Файли без посилань молодші за цей вік не видаляються (можуть бути щойно
+# записані, але ще не прив'язані до документа)
+DEFAULT_GC_MIN_AGE = timedelta(hours=1)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+_BLOB_PATH_RE = re.compile(r"([0-9a-f]{2})[\\/]([0-9a-f]{2})[\\/]([0-9a-f]{64})(\.[0-9A-Za-z]+)?$")
+
+
+def blobs_root() -> Path:
+    """Коренева директорія сховища."""
+    return get_settings().storage_dir / BLOBS_DIR_NAME
+
+
+def normalize_extension(extension: str | None) -> str:
+    """".PDF" / "pdf" -> ".pdf"."""
+    extension = (extension or "").strip().lower()
+    if extension and not extension.startswith("."):
+        extension = f".{extension}"
+    return extension
+
+
+def blob_path(sha256: str, extension: str = "", root: Path | None = None) -> Path:
+    """Шлях файлу сховища для хешу."""
+    root = root or blobs_root()
+    return root / sha256[:2] / sha256[2:4] / f"{sha256}{normalize_extension(extension)}"
+
+
+def blob_sha256(path: str | Path | None) -> str | None:
+    """
+    Хеш файлу сховища за шляхом.
+
+    Returns:
+        str | None: None, якщо шлях не вказує на файл сховища
+    """
+    if not path:
+        return None
+    match = _BLOB_PATH_RE.search(str(path))
+    if match is None:
+        return None
+    first, second, sha256, _ = match.groups()
+    if sha256[:2] != first or sha256[2:4] != second:
+        return None
+    return sha256
+
+
+def file_sha256(path: Path) -> tuple[str, int]:
+    """SHA-256 і розмір файлу (читання блоками)."""
+    hasher = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            hasher.update(chunk)
+            size += len(chunk)
+    return hasher.hexdigest(), size
+
+
+def _write_atomic(target: Path, data: bytes) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_name, target)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _copy_atomic(source: Path, target: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(source, temp_name)
+        os.replace(temp_name, target)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+@dataclass
+class GarbageReport:
+    """Результат збирання сміття."""
+    deleted: list[str] = field(default_factory=list)
+    orphan_files: list[str] = field(default_factory=list)
+    freed_bytes: int = 0
+    recounted: int = 0
+
+
+class BlobStore:
+    """Сховище файлів, прив'язане до сесії БД (облік посилань)."""
+
+    def __init__(self, db: Session, root: Path | None = None):
+        self.db = db
+        self.root = root or blobs_root()
+
+    def path(self, blob: StoredBlob) -> Path:
+        """Шлях файлу."""
+        return blob_path(blob.sha256, blob.extension, self.root)
+
+    def _register(self, sha256: str, size: int, extension: str) -> StoredBlob:
+        blob = self.db.get(StoredBlob, sha256)
+        if blob is not None:
+            return blob
+        try:
+            with self.db.begin_nested():
+                blob = StoredBlob(sha256=sha256, size=size, extension=extension, ref_count=0)
+                self.db.add(blob)
+        except IntegrityError:
+            # Той самий вміст щойно зареєстровано в іншій сесії
+            blob = self.db.get(StoredBlob, sha256)
+        return blob
+
+    def put_bytes(self, data: bytes, extension: str) -> StoredBlob:
+        """
+        Зберігає вміст (якщо такого ще немає).
+
+        Args:
+            data: Вміст файлу
+            extension: Розширення (".pdf")
+
+        Returns:
+            StoredBlob: Запис сховища (посилання не додається, див. attach)
+        """
+        sha256 = hashlib.sha256(data).hexdigest()
+        blob = self._register(sha256, len(data), normalize_extension(extension))
+        target = self.path(blob)
+        if not target.exists():
+            _write_atomic(target, data)
+        return blob
+
+    def put_file(
+        self,
+        source: Path,
+        extension: str | None = None,
+        move: bool = False,
+        sha256: str | None = None,
+        size: int | None = None,
+    ) -> StoredBlob:
+        """
+        Зберігає файл (якщо такого вмісту ще немає).
+
+        Args:
+            source: Вихідний файл
+            extension: Розширення (за замовчуванням - розширення source)
+            move: Перемістити файл замість копіювання (source зникає в будь-якому разі)
+            sha256: Вже відомий хеш (наприклад, порахований при завантаженні)
+            size: Вже відомий розмір
+
+        Returns:
+            StoredBlob: Запис сховища (посилання не додається, див. attach)
+        """
+        source = Path(source)
+        if sha256 is None or size is None:
+            sha256, size = file_sha256(source)
+        extension = normalize_extension(source.suffix if extension is None else extension)
+        blob = self._register(sha256, size, extension)
+        target = self.path(blob)
+
+        if target.exists():
+            if move:
+                source.unlink(missing_ok=True)
+        elif move:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(source, target)
+        else:
+            _copy_atomic(source, target)
+        return blob
+
+    def attach(self, document: Document, field_name: str, blob: StoredBlob) -> Path:
+        """
+        Прив'язує файл до документа і оновлює лічильники посилань.
+
+        Попередній файл сховища в цьому полі втрачає посилання; якщо вміст
+        той самий, нічого не змінюється.
+
+        Args:
+            document: Документ
+            field_name: "file_scan_path" або "file_docx_path"
+            blob: Файл сховища
+
+        Returns:
+            Path: Шлях файлу (записаний у поле документа)
+        """
+        if field_name not in BLOB_REFERENCE_FIELDS:
+            raise ValueError(f"Поле {field_name} не посилається на файли")
+        path = self.path(blob)
+        old_sha256 = blob_sha256(getattr(document, field_name))
+        if old_sha256 != blob.sha256:
+            blob.ref_count = StoredBlob.ref_count + 1
+            self._release_sha256(old_sha256)
+        setattr(document, field_name, str(path))
+        self.db.flush()
+        return path
+
+    def release(self, path: str | Path | None) -> None:
+        """Знімає посилання на файл сховища (шляхи поза сховищем ігноруються)."""
+        self._release_sha256(blob_sha256(path))
+        self.db.flush()
+
+    def _release_sha256(self, sha256: str | None) -> None:
+        if sha256 is None:
+            return
+        blob = self.db.get(StoredBlob, sha256)
+        if blob is not None:
+            blob.ref_count = StoredBlob.ref_count - 1
+
+    def recount(self) -> int:
+        """
+        Перераховує посилання за таблицею документів.
+
+        Лічильники змінюються лише через attach/release, тому документи,
+        видалені напряму (каскадом), залишають завищені лічильники.
+
+        Returns:
+            int: Кількість виправлених записів
+        """
+        references: Counter[str] = Counter()
+        columns = [getattr(Document, name) for name in BLOB_REFERENCE_FIELDS]
+        for row in self.db.execute(select(*columns)):
+            for path in row:
+                sha256 = blob_sha256(path)
+                if sha256 is not None:
+                    references[sha256] += 1
+
+        fixed = 0
+        for blob in self.db.scalars(select(StoredBlob)):
+            if blob.ref_count != references[blob.sha256]:
+                blob.ref_count = references[blob.sha256]
+                fixed += 1
+        self.db.commit()
+        return fixed
+
+    def collect_garbage(
+        self,
+        min_age: timedelta = DEFAULT_GC_MIN_AGE,
+        dry_run: bool = False,
+    ) -> GarbageReport:
+        """
+        Видаляє файли сховища без посилань.
+
+        Спочатку перераховує посилання (recount), далі видаляє записи з
+        ref_count == 0 та файли, яких немає в таблиці, старші за min_age.
+
+        Args:
+            min_age: Мінімальний вік файлу без посилань
+            dry_run: Лише звіт, без видалення
+
+        Returns:
+            GarbageReport: Що видалено (або було б видалено)
+        """
+        report = GarbageReport(recounted=self.recount())
+        # updated_at заповнює БД (func.now()), тому й відлік - за годинником БД
+        cutoff = self.db.scalar(select(func.now())) - min_age
+        file_cutoff = datetime.now() - min_age
+
+        unreferenced = self.db.scalars(
+            select(StoredBlob).where(StoredBlob.ref_count <= 0, StoredBlob.updated_at < cutoff)
+        ).all()
+        for blob in unreferenced:
+            path = self.path(blob)
+            report.deleted.append(str(path))
+            report.freed_bytes += blob.size
+            if not dry_run:
+                path.unlink(missing_ok=True)
+                self.db.delete(blob)
+        if not dry_run:
+            self.db.commit()
+
+        if self.root.exists():
+            known = set(self.db.scalars(select(StoredBlob.sha256)))
+            for path in self.root.glob("*/*/*"):
+                sha256 = blob_sha256(path)
+                if sha256 is None or sha256 in known:
+                    continue
+                stat = path.stat()
+                if datetime.fromtimestamp(stat.st_mtime) >= file_cutoff:
+                    continue
+                report.orphan_files.append(str(path))
+                report.freed_bytes += stat.st_size
+                if not dry_run:
+                    path.unlink(missing_ok=True)
+
+        logger.info(
+            f"Blob GC: {len(report.deleted)} unreferenced, {len(report.orphan_files)} orphan files, "
+            f"{report.freed_bytes} bytes{' (dry run)' if dry_run else ''}"
+        )
+        return report
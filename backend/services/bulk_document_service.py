@@ -1,20 +1,32 @@
 """Bulk Document Generation Service."""
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from backend.core.config import get_settings
 from backend.models.document import Document
 from backend.models.settings import Approvers
+from backend.services.blob_store import BLOBS_DIR_NAME, BlobStore
+from backend.services.bulk_validation import validate_batch, validation_key, validation_tokens
+from backend.services.document_render_cache import refresh_rendered_html
 from backend.services.grammar_service import GrammarService
 from backend.services.document_service import DocumentService
+from backend.services.pdf_renderer import render_pdf
 from shared.enums import DocumentType, DocumentStatus
 
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Документів на одну транзакцію при масовому створенні
+DEFAULT_CHUNK_SIZE = 500
 
 # Ukrainian month names
 UKRAINIAN_MONTHS = {
@@ -46,6 +58,45 @@ def _get_ukrainian_month(d: date) -> str:
     return UKRAINIAN_MONTHS.get(d.month, "")
 
 
+@dataclass
+class BulkItemResult:
+    """Результат масового створення для одного співробітника."""
+    staff_id: int
+    pib_nom: str
+    document_id: int | None = None
+    file_path: str | None = None
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and self.document_id is not None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "success": self.success}
+
+
+@dataclass
+class BulkBatchReport:
+    """Звіт масового створення: результат по кожному співробітнику."""
+    items: list[BulkItemResult] = field(default_factory=list)
+    documents: list[Document] = field(default_factory=list, repr=False)
+
+    @property
+    def succeeded(self) -> list[BulkItemResult]:
+        return [item for item in self.items if item.success]
+
+    @property
+    def failed(self) -> list[BulkItemResult]:
+        return [item for item in self.items if not item.success]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "generated_count": len(self.documents),
+            "failed_count": len(self.failed),
+            "items": [item.to_dict() for item in self.items],
+        }
+
+
 class BulkDocumentService:
     """
     Сервіс для масової генерації документів відпусток.
@@ -74,11 +125,18 @@ class BulkDocumentService:
         date_start: date,
         date_end: date,
         signatories: list[dict] | None = None,
-        file_suffix: str = ""
-    ) -> list[Document]:
+        file_suffix: str = "",
+        on_progress: Callable[[Any, Document | None, Exception | None], None] | None = None,
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+    ) -> "BulkBatchReport":
         """
         Генерує документи для списку співробітників.
 
+        Документи вставляються одним INSERT ... RETURNING і одним commit на
+        частину пакета (chunk_size); шляхи файлів обчислюються заздалегідь.
+        Помилка частини пакета не скасовує вже збережені частини.
+        PDF рендеряться окремо - див. render_batch_pdfs().
+
         Args:
             staff_list: Список об'єктів Staff
             doc_type: Тип документа (vacation_paid, vacation_unpaid)
@@ -86,85 +144,138 @@ class BulkDocumentService:
             date_end: Кінець періоду
             signatories: Список погоджувачів (опціонально)
             file_suffix: Суфікс для імені файлу
+            on_progress: Викликається після кожного співробітника
+                (staff, документ або None, помилка або None)
+            chunk_size: Максимум документів на одну транзакцію (None - без обмеження)
 
         Returns:
-            Список створених документів
+            BulkBatchReport: Результат по кожному співробітнику та створені документи
         """
-        documents = []
+        doc_type = DocumentType(doc_type)
         days_count = (date_end - date_start).days + 1
+        payment_period = "перша половина" if date_start.day <= 15 else "друга половина"
+        report = BulkBatchReport()
 
+        # Stage 1: rows and output paths in memory
+        pending: list[tuple[Any, BulkItemResult, dict[str, Any]]] = []
         for staff in staff_list:
+            item = BulkItemResult(staff_id=staff.id, pib_nom=staff.pib_nom)
+            report.items.append(item)
             try:
-                doc = self._create_document(
-                    staff=staff,
-                    doc_type=doc_type,
-                    date_start=date_start,
-                    date_end=date_end,
-                    days_count=days_count,
-                    signatories=signatories,
-                    file_suffix=file_suffix
+                output_path = self._build_output_path(
+                    staff, doc_type, date_start, days_count, DocumentStatus.DRAFT, file_suffix,
                 )
-                documents.append(doc)
             except Exception as e:
-                print(f"Error creating document for {staff.pib_nom}: {e}")
+                item.error = str(e)
+                if on_progress:
+                    on_progress(staff, None, e)
+                continue
+            pending.append((staff, item, {
+                "staff_id": staff.id,
+                "doc_type": doc_type,
+                "date_start": date_start,
+                "date_end": date_end,
+                "days_count": days_count,
+                "payment_period": payment_period,
+                "editor_content": "",  # Will be filled by WYSIWYG
+                # Status stays as DRAFT - will change to SIGNED_BY_APPLICANT when applicant signs
+                "status": DocumentStatus.DRAFT,
+                "created_by": "bulk",
+                "file_docx_path": str(output_path),
+            }))
+
+        # Stage 2: one unit of work per chunk
+        step = chunk_size or len(pending) or 1
+        for offset in range(0, len(pending), step):
+            chunk = pending[offset:offset + step]
+            try:
+                documents = self.db.scalars(
+                    insert(Document).returning(Document, sort_by_parameter_order=True),
+                    [row for _, _, row in chunk],
+                ).all()
+                self.db.commit()
+            except Exception as e:
+                self.db.rollback()
+                logger.error(f"Bulk insert of {len(chunk)} documents failed: {e}")
+                for staff, item, _ in chunk:
+                    item.error = str(e)
+                    if on_progress:
+                        on_progress(staff, None, e)
+                continue
+
+            for (staff, item, row), document in zip(chunk, documents):
+                item.document_id = document.id
+                item.file_path = row["file_docx_path"]
+                report.documents.append(document)
+                if on_progress:
+                    on_progress(staff, document, None)
+
+        for parent in {Path(item.file_path).parent for item in report.items if item.file_path}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        return report
+
+    def render_batch_pdfs(self, report: "BulkBatchReport", max_workers: int | None = None) -> None:
+        """
+        Рендерить PDF створених документів пакета.
 
-        return documents
+        HTML рендериться послідовно з одним контекстом рендерингу на сесію
+        (і зберігається в rendered_html), а перетворення в PDF виконується
+        паралельно пулом pdf_renderer. Помилки записуються в звіт.
 
-    def _create_document(
-        self,
-        staff,
-        doc_type: str,
-        date_start: date,
-        date_end: date,
-        days_count: int,
-        signatories: list[dict] | None,
-        file_suffix: str = ""
-    ) -> Document:
-        """
-        Створює один документ для співробітника.
+        Args:
+            report: Результат generate_batch()
+            max_workers: Кількість одночасних задач PDF (None - за налаштуваннями)
         """
-        # Determine payment period
-        if date_start.day <= 15:
-            payment_period = "перша половина"
-        else:
-            payment_period = "друга половина"
-
-        # Create document
-        doc = Document(
-            staff_id=staff.id,
-            doc_type=doc_type,
-            date_start=date_start,
-            date_end=date_end,
-            days_count=days_count,
-            payment_period=payment_period,
-            editor_content="",  # Will be filled by WYSIWYG
-            status=DocumentStatus.DRAFT,
-            created_by="bulk"
-        )
-
-        self.db.add(doc)
+        items = {item.document_id: item for item in report.items if item.document_id is not None}
+        jobs = []
+        for document in report.documents:
+            try:
+                html = refresh_rendered_html(document, self.db)
+            except Exception as e:
+                items[document.id].error = f"Помилка рендерингу: {e}"
+                continue
+            jobs.append((items[document.id], document, self.doc_service._wrap_html_for_pdf(html)))
         self.db.commit()
-        self.db.refresh(doc)
 
-        # Generate output path
-        output_path = self._get_output_path(doc, staff, file_suffix)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Update document with file path
-        doc.file_docx_path = str(output_path)
-        # Status stays as DRAFT - will change to SIGNED_BY_APPLICANT when applicant signs
+        # PDF з однаковим вмістом зберігаються у сховищі один раз
+        store = BlobStore(self.db, root=self.storage_dir / BLOBS_DIR_NAME)
+        workers = max_workers or max(1, settings.pdf_workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk-pdf") as executor:
+            futures = {
+                executor.submit(render_pdf, html): (item, document)
+                for item, document, html in jobs
+            }
+            for future, (item, document) in futures.items():
+                try:
+                    pdf = future.result()
+                    item.file_path = str(store.attach(document, "file_docx_path", store.put_bytes(pdf, ".pdf")))
+                except Exception as e:
+                    item.error = f"Помилка генерації PDF: {e}"
         self.db.commit()
 
-        return doc
-
     def _get_output_path(self, doc: Document, staff, file_suffix: str = "") -> Path:
         """
         Генерує шлях для збереження файлу.
 
         Формат: storage/{year}/{month}/{status}/{initials} {type} {suffix} {days} днів.pdf
         """
-        year = doc.date_start.year
-        month_ua = _get_ukrainian_month(doc.date_start)
+        return self._build_output_path(
+            staff, doc.doc_type, doc.date_start, doc.days_count, doc.status, file_suffix,
+        )
+
+    def _build_output_path(
+        self,
+        staff,
+        doc_type: DocumentType,
+        date_start: date,
+        days_count: int,
+        status: DocumentStatus,
+        file_suffix: str = "",
+    ) -> Path:
+        """Шлях файлу документа за його полями (до збереження в БД)."""
+        year = date_start.year
+        month_ua = _get_ukrainian_month(date_start)
         # Use document's actual status for folder
         UKRAINIAN_STATUS = {
             DocumentStatus.DRAFT: "чернетки",
@@ -176,13 +287,13 @@ class BulkDocumentService:
             DocumentStatus.SCANNED: "відскановано",
             DocumentStatus.PROCESSED: "оброблені",
         }
-        status_folder = UKRAINIAN_STATUS.get(doc.status, "чернетки")
+        status_folder = UKRAINIAN_STATUS.get(status, "чернетки")
 
         # Format initials
         initials = _format_surname_initials(staff.pib_nom)
 
         # Document type label
-        if doc_type_value := doc.doc_type.value:
+        if doc_type_value := doc_type.value:
             if doc_type_value == "vacation_paid":
                 doc_label = "відпустка"
             elif doc_type_value == "vacation_unpaid":
@@ -194,9 +305,9 @@ class BulkDocumentService:
 
         # Build filename
         if file_suffix:
-            filename = f"{initials} {doc_label} {file_suffix} {doc.days_count} днів.pdf"
+            filename = f"{initials} {doc_label} {file_suffix} {days_count} днів.pdf"
         else:
-            filename = f"{initials} {doc_label} {month_ua} {doc.days_count} днів.pdf"
+            filename = f"{initials} {doc_label} {month_ua} {days_count} днів.pdf"
 
         return self.storage_dir / str(year) / month_ua / status_folder / filename
 
@@ -204,46 +315,38 @@ class BulkDocumentService:
         self,
         staff_list: list,
         date_start: date,
-        date_end: date
+        date_end: date,
+        validation_token: str | None = None,
     ) -> dict[str, list]:
         """
         Перевіряє список співробітників на можливість створення документів.
 
+        Документи та неявки всіх співробітників завантажуються двома запитами
+        (див. bulk_validation). Якщо передано токен з issue_validation_token()
+        для тих самих параметрів, повертається збережений результат.
+
         Returns:
             dict з ключами 'valid' (список staff), 'invalid' (список з причинами)
         """
-        valid = []
-        invalid = []
+        if validation_token:
+            key = validation_key((staff.id for staff in staff_list), date_start, date_end)
+            cached = validation_tokens.consume(validation_token, key, staff_list)
+            if cached is not None:
+                return cached
 
-        for staff in staff_list:
-            reasons = []
-
-            # Check balance for paid vacation
-            doc_type = "vacation_paid"  # Default for bulk
-            if doc_type == "vacation_paid":
-                if staff.vacation_balance < (date_end - date_start).days + 1:
-                    reasons.append(f"Недостатньо балансу: {staff.vacation_balance} днів")
-
-            # Check contract end
-            if date_end > staff.term_end:
-                reasons.append(f"Дата закінчення ({date_end}) пізніше закінчення контракту ({staff.term_end})")
-
-            # Check for overlapping documents
-            for doc in staff.documents:
-                if doc.status in ('draft', 'signed_by_applicant', 'approved_by_dispatcher', 'signed_dep_head', 'agreed', 'signed_rector'):
-                    # Check overlap
-                    if not (date_end < doc.date_start or date_start > doc.date_end):
-                        reasons.append(f"Перетин з існуючим документом #{doc.id}")
-
-            if reasons:
-                invalid.append({
-                    'staff': staff,
-                    'reasons': reasons
-                })
-            else:
-                valid.append(staff)
+        # Bulk створює щорічні оплачувані відпустки, тому баланс перевіряється завжди
+        return validate_batch(self.db, staff_list, date_start, date_end, check_balance=True)
 
-        return {'valid': valid, 'invalid': invalid}
+    def issue_validation_token(
+        self,
+        staff_list: list,
+        date_start: date,
+        date_end: date,
+        result: dict[str, list],
+    ) -> str:
+        """Зберігає результат валідації для наступного generate (див. validate_staff_for_batch)."""
+        key = validation_key((staff.id for staff in staff_list), date_start, date_end)
+        return validation_tokens.issue(key, result)
 
     def get_available_dates(
         self,
@@ -0,0 +1,252 @@
+"""Пакетна валідація масового створення документів.
+
+Активні документи та записи неявок (усі коди, крім робочих) для всіх обраних
+співробітників завантажуються двома запитами, після чого для кожного
+співробітника будується відсортований індекс інтервалів: перевірка
+перетину - бінарний пошук, без завантаження staff.documents.
+
+Результат валідації зберігається в пам'яті процесу під одноразовим
+токеном, тому /bulk/generate не повторює валідацію, якщо отримав токен
+від /bulk/validate з тими ж параметрами.
+"""
+
+import secrets
+import threading
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Generic, Iterable, TypeVar
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.models.attendance import WORK_DAY_CODES, Attendance
+from backend.models.document import Document
+from shared.enums import DocumentStatus
+
+# Статуси документів, з якими не можна перетинатися (документ ще в роботі)
+ACTIVE_DOCUMENT_STATUSES = (
+    DocumentStatus.DRAFT,
+    DocumentStatus.SIGNED_BY_APPLICANT,
+    DocumentStatus.APPROVED_BY_DISPATCHER,
+    DocumentStatus.SIGNED_DEP_HEAD,
+    DocumentStatus.AGREED,
+    DocumentStatus.SIGNED_RECTOR,
+)
+
+# Час життя токена валідації, с
+VALIDATION_TOKEN_TTL = 300
+
+T = TypeVar("T")
+
+
+class IntervalIndex(Generic[T]):
+    """
+    Відсортовані закриті інтервали дат з пошуком перетинів.
+
+    Інтервали сортуються за початком; префіксний максимум кінців дозволяє
+    зупинити пошук, щойно жоден лівіший інтервал не може дістати до запиту.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[date, date, T]] = ()):
+        self._intervals = sorted(intervals, key=lambda interval: interval[0])
+        self._starts = [start for start, _, _ in self._intervals]
+        self._max_ends: list[date] = []
+        for _, end, _ in self._intervals:
+            self._max_ends.append(max(end, self._max_ends[-1]) if self._max_ends else end)
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def overlapping(self, start: date, end: date) -> list[T]:
+        """
+        Значення інтервалів, що перетинаються з [start, end].
+
+        Returns:
+            list: У порядку початку інтервалів
+        """
+        found = []
+        i = bisect_right(self._starts, end) - 1
+        while i >= 0 and self._max_ends[i] >= start:
+            interval_start, interval_end, value = self._intervals[i]
+            if interval_end >= start:
+                found.append(value)
+            i -= 1
+        found.reverse()
+        return found
+
+
+@dataclass
+class StaffIntervals:
+    """Зайняті періоди одного співробітника."""
+    documents: IntervalIndex[Document] = field(default_factory=IntervalIndex)
+    attendance: IntervalIndex[Attendance] = field(default_factory=IntervalIndex)
+
+
+def load_staff_intervals(
+    db: Session,
+    staff_ids: Iterable[int],
+    window_start: date,
+    window_end: date,
+) -> dict[int, StaffIntervals]:
+    """
+    Завантажує зайняті періоди співробітників у вікні дат (два запити).
+
+    Args:
+        db: Сесія БД
+        staff_ids: ID співробітників
+        window_start: Початок вікна (мінімальна дата перевірки)
+        window_end: Кінець вікна (максимальна дата перевірки)
+
+    Returns:
+        dict: staff_id -> StaffIntervals
+    """
+    staff_ids = list(set(staff_ids))
+    documents: dict[int, list] = {staff_id: [] for staff_id in staff_ids}
+    attendance: dict[int, list] = {staff_id: [] for staff_id in staff_ids}
+
+    for doc in db.query(Document).filter(
+        Document.staff_id.in_(staff_ids),
+        Document.status.in_(ACTIVE_DOCUMENT_STATUSES),
+        Document.date_start <= window_end,
+        Document.date_end >= window_start,
+    ):
+        documents[doc.staff_id].append((doc.date_start, doc.date_end, doc))
+
+    for att in db.query(Attendance).filter(
+        Attendance.staff_id.in_(staff_ids),
+        # Робочі коди (Р, РС, ВЧ, ...) не блокують відпустку
+        Attendance.code.notin_(WORK_DAY_CODES),
+        Attendance.date <= window_end,
+        func.coalesce(Attendance.date_end, Attendance.date) >= window_start,
+    ):
+        attendance[att.staff_id].append((att.date, att.date_end or att.date, att))
+
+    return {
+        staff_id: StaffIntervals(IntervalIndex(documents[staff_id]), IntervalIndex(attendance[staff_id]))
+        for staff_id in staff_ids
+    }
+
+
+def staff_rejection_reasons(
+    staff: Any,
+    intervals: StaffIntervals,
+    date_start: date,
+    date_end: date,
+    check_balance: bool = True,
+) -> list[str]:
+    """
+    Причини, з яких співробітнику не можна створити документ на період.
+
+    Args:
+        staff: Співробітник
+        intervals: Його зайняті періоди
+        date_start: Початок періоду
+        date_end: Кінець періоду
+        check_balance: Перевіряти залишок відпустки
+
+    Returns:
+        list[str]: Порожній список - співробітник валідний
+    """
+    reasons = []
+    if check_balance and staff.vacation_balance < (date_end - date_start).days + 1:
+        reasons.append(f"Недостатньо балансу: {staff.vacation_balance} днів")
+
+    if date_end > staff.term_end:
+        reasons.append(f"Дата закінчення ({date_end}) пізніше закінчення контракту ({staff.term_end})")
+
+    for doc in intervals.documents.overlapping(date_start, date_end):
+        reasons.append(f"Перетин з існуючим документом #{doc.id}")
+
+    for att in intervals.attendance.overlapping(date_start, date_end):
+        reasons.append(
+            f"Перетин з записом відвідуваності '{att.code}' від {att.date.strftime('%d.%m.%Y')}"
+        )
+    return reasons
+
+
+def validate_batch(
+    db: Session,
+    staff_list: list,
+    date_start: date,
+    date_end: date,
+    check_balance: bool = True,
+) -> dict[str, list]:
+    """
+    Валідує список співробітників для масового створення документів.
+
+    Returns:
+        dict з ключами 'valid' (список staff), 'invalid' (список {'staff', 'reasons'})
+    """
+    index = load_staff_intervals(db, (staff.id for staff in staff_list), date_start, date_end)
+    valid = []
+    invalid = []
+    for staff in staff_list:
+        reasons = staff_rejection_reasons(staff, index[staff.id], date_start, date_end, check_balance)
+        if reasons:
+            invalid.append({"staff": staff, "reasons": reasons})
+        else:
+            valid.append(staff)
+    return {"valid": valid, "invalid": invalid}
+
+
+def validation_key(staff_ids: Iterable[int], date_start: date, date_end: date) -> tuple:
+    """Параметри, для яких дійсний результат валідації."""
+    return tuple(sorted(set(staff_ids))), date_start, date_end
+
+
+class ValidationTokenStore:
+    """Одноразові токени результатів валідації з коротким часом життя."""
+
+    def __init__(self, ttl: float = VALIDATION_TOKEN_TTL):
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, tuple, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def issue(self, key: tuple, result: dict[str, list]) -> str:
+        """
+        Зберігає результат validate_batch() і повертає токен.
+
+        Зберігаються лише ID співробітників, не об'єкти сесії.
+        """
+        stored = {
+            "valid_ids": [staff.id for staff in result["valid"]],
+            "invalid": [(item["staff"].id, item["reasons"]) for item in result["invalid"]],
+        }
+        token = secrets.token_urlsafe(16)
+        now = time.monotonic()
+        with self._lock:
+            # Прострочені токени видаляються при видачі нових
+            for expired in [t for t, (expires, _, _) in self._entries.items() if expires <= now]:
+                del self._entries[expired]
+            self._entries[token] = (now + self.ttl, key, stored)
+        return token
+
+    def consume(self, token: str, key: tuple, staff_list: list) -> dict[str, list] | None:
+        """
+        Повертає збережений результат для staff_list і анулює токен.
+
+        Returns:
+            dict | None: None, якщо токен невідомий, прострочений або виданий
+            для інших параметрів (тоді потрібна повторна валідація)
+        """
+        with self._lock:
+            entry = self._entries.pop(token, None)
+        if entry is None:
+            return None
+        expires, stored_key, stored = entry
+        if expires <= time.monotonic() or stored_key != key:
+            return None
+
+        by_id = {staff.id: staff for staff in staff_list}
+        return {
+            "valid": [by_id[staff_id] for staff_id in stored["valid_ids"] if staff_id in by_id],
+            "invalid": [
+                {"staff": by_id[staff_id], "reasons": reasons}
+                for staff_id, reasons in stored["invalid"] if staff_id in by_id
+            ],
+        }
+
+
+validation_tokens = ValidationTokenStore()
@@ -0,0 +1,77 @@
+"""Легкі запити для списків документів.
+
+Списки (реєстр документів, списки в Telegram) показують лише короткі
+підсумкові рядки, тому великі текстові/JSON колонки документа відкладаються
+(defer), а працівники завантажуються одним додатковим запитом на сторінку
+(selectinload) замість запиту на кожен рядок.
+
+Великі поля повертаються лише на сторінці документа або коли клієнт явно
+просить їх параметром fields=.
+"""
+
+from typing import Iterable
+
+from sqlalchemy.orm import defer, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from backend.models.document import Document
+
+# Великі колонки, що не завантажуються у списках
+DEFERRED_LIST_COLUMNS = (
+    "rendered_html",
+    "rendered_html_fingerprint",
+    "editor_content",
+    "custom_text",
+    "new_employee_data",
+)
+
+# Додаткові поля списку (fields=...) -> колонки, потрібні для їх побудови
+OPTIONAL_LIST_FIELDS: dict[str, tuple[str, ...]] = {
+    # Рендеринг також використовує custom_text
+    "rendered_html": ("rendered_html", "rendered_html_fingerprint", "custom_text"),
+    "content": ("editor_content", "custom_text"),
+    "new_employee_data": ("new_employee_data",),
+}
+
+
+def parse_list_fields(fields: str | None) -> frozenset[str]:
+    """
+    Розбирає параметр fields (через кому).
+
+    Args:
+        fields: Наприклад "rendered_html,content"
+
+    Returns:
+        frozenset: Запитані додаткові поля
+
+    Raises:
+        ValueError: Якщо поле не підтримується
+    """
+    if not fields:
+        return frozenset()
+    requested = frozenset(field.strip() for field in fields.split(",") if field.strip())
+    unknown = requested - OPTIONAL_LIST_FIELDS.keys()
+    if unknown:
+        raise ValueError(
+            f"Невідомі поля: {', '.join(sorted(unknown))}. "
+            f"Доступні: {', '.join(OPTIONAL_LIST_FIELDS)}"
+        )
+    return requested
+
+
+def document_list_options(fields: Iterable[str] = ()) -> list[LoaderOption]:
+    """
+    Опції запиту для списку документів.
+
+    Args:
+        fields: Додаткові поля (ключі OPTIONAL_LIST_FIELDS), колонки яких
+            треба завантажити одразу
+
+    Returns:
+        list: Опції для Query.options()/Select.options()
+    """
+    loaded = {column for field in fields for column in OPTIONAL_LIST_FIELDS[field]}
+    return [
+        *(defer(getattr(Document, column)) for column in DEFERRED_LIST_COLUMNS if column not in loaded),
+        selectinload(Document.staff),
+    ]
@@ -0,0 +1,188 @@
+"""Кеш відрендереного HTML документів.
+
+rendered_html документа - похідний артефакт: він залежить від полів документа,
+даних працівника, налаштувань і погоджувачів та шаблонів. Відбиток цих даних
+зберігається поруч з HTML (Document.rendered_html_fingerprint), тому список
+документів віддає збережений HTML без рендерингу.
+
+Застарілі записи (змінився працівник, налаштування чи шаблон) рендеряться
+заново, але не записуються в БД: результат тримається в кеші процесу до
+наступного збереження документа, яке оновлює rendered_html.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from backend.services.document_renderer import get_render_context, get_templates_dir, render_document
+
+if TYPE_CHECKING:
+    from backend.models.document import Document
+
+# Збільшується при зміні логіки render_document_html
+RENDER_FINGERPRINT_VERSION = 1
+
+# Максимальна кількість документів у кеші процесу
+DEFAULT_MAX_ENTRIES = 1024
+
+
+def _digest(value: Any) -> str:
+    payload = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def documents_template_version() -> str:
+    """Версія шаблонів документів за mtime/розміром файлів."""
+    templates_dir = get_templates_dir()
+    signature = [
+        (path.relative_to(templates_dir).as_posix(), stat.st_mtime_ns, stat.st_size)
+        for path in sorted(templates_dir.rglob("*.html"))
+        for stat in (path.stat(),)
+    ]
+    return _digest(signature)[:16]
+
+
+def render_context_version(db: Any) -> str:
+    """
+    Версія спільного контексту рендерингу (налаштування, погоджувачі, шаблони).
+
+    Обчислюється зі знімка RenderContext сесії, тому не додає запитів до БД
+    і входить у відбиток кожного документа.
+
+    Args:
+        db: Сесія БД
+
+    Returns:
+        str: Версія контексту
+    """
+    context = get_render_context(db)
+    return _digest([
+        RENDER_FINGERPRINT_VERSION,
+        documents_template_version(),
+        context.settings,
+        context.approvers,
+        context.dept_head,
+    ])[:16]
+
+
+def document_fingerprint(document: "Document", context_version: str) -> str:
+    """
+    Відбиток даних, від яких залежить HTML документа.
+
+    Args:
+        document: Документ
+        context_version: Результат render_context_version()
+
+    Returns:
+        str: SHA-256 у hex
+    """
+    staff = document.staff
+    employment_type = getattr(staff, "employment_type", None) if staff else None
+    return _digest([
+        context_version,
+        document.doc_type.value if document.doc_type else None,
+        document.date_start,
+        document.date_end,
+        document.days_count,
+        document.payment_period,
+        document.custom_text,
+        document.staff_id,
+        staff.pib_nom if staff else None,
+        staff.position if staff else None,
+        getattr(employment_type, "value", employment_type),
+    ])
+
+
+class DocumentRenderCache:
+    """LRU кеш HTML документів процесу: id документа -> (відбиток, HTML)."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, tuple[str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, document_id: int, fingerprint: str) -> str | None:
+        """Повертає HTML, якщо він відповідає відбитку."""
+        with self._lock:
+            entry = self._entries.get(document_id)
+            if entry is None or entry[0] != fingerprint:
+                return None
+            self._entries.move_to_end(document_id)
+            return entry[1]
+
+    def put(self, document_id: int, fingerprint: str, html: str) -> None:
+        """Зберігає HTML документа."""
+        with self._lock:
+            self._entries[document_id] = (fingerprint, html)
+            self._entries.move_to_end(document_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, document_id: int) -> None:
+        """Видаляє документ з кешу."""
+        with self._lock:
+            self._entries.pop(document_id, None)
+
+    def clear(self) -> None:
+        """Очищає кеш."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+document_render_cache = DocumentRenderCache()
+
+
+def get_rendered_html(document: "Document", db: Any, context_version: str | None = None) -> str:
+    """
+    Повертає актуальний HTML документа без запису в БД.
+
+    Порядок: збережений rendered_html (якщо відбиток збігається) -> кеш
+    процесу -> рендеринг (результат кладеться в кеш процесу).
+
+    Args:
+        document: Документ
+        db: Сесія БД
+        context_version: Версія контексту (передається при обробці списку)
+
+    Returns:
+        str: HTML документа
+    """
+    if context_version is None:
+        context_version = render_context_version(db)
+    fingerprint = document_fingerprint(document, context_version)
+
+    if document.rendered_html and document.rendered_html_fingerprint == fingerprint:
+        return document.rendered_html
+
+    cached = document_render_cache.get(document.id, fingerprint)
+    if cached is not None:
+        return cached
+
+    html = render_document(document, db)
+    document_render_cache.put(document.id, fingerprint, html)
+    return html
+
+
+def refresh_rendered_html(document: "Document", db: Any) -> str:
+    """
+    Рендерить документ і зберігає HTML з відбитком у моделі (commit - за викликачем).
+
+    Args:
+        document: Документ
+        db: Сесія БД
+
+    Returns:
+        str: HTML документа
+    """
+    html = render_document(document, db)
+    fingerprint = document_fingerprint(document, render_context_version(db))
+    document.rendered_html = html
+    document.rendered_html_fingerprint = fingerprint
+    if document.id is not None:
+        document_render_cache.put(document.id, fingerprint, html)
+    return html
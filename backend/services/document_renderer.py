@@ -1,16 +1,19 @@
 """Document rendering service using Jinja2 templates from backend/templates/documents."""
 
 import json
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Environment, FileSystemLoader
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from shared.enums import DocumentType
 
 from backend.models.staff import Staff as StaffModel
 from backend.models.settings import Approvers, SystemSettings
 from backend.services.grammar_service import GrammarService
+from backend.services.template_registry import DOCUMENTS_ENV, get_template_registry
 
 if TYPE_CHECKING:
     from backend.models.document import Document
@@ -93,84 +96,76 @@ def get_templates_dir() -> Path:
     raise FileNotFoundError(f"Templates directory not found. Searched: {[str(p) for p in possible_paths]}")
 
 
-def get_settings_from_db(db_session) -> dict:
-    """Get university and rector settings from database."""
-    from backend.models.settings import SystemSettings
-
-    settings = {}
-
-    # University settings
-    settings["university_name"] = SystemSettings.get_value(db_session, "university_name", "")
-    settings["university_name_dative"] = SystemSettings.get_value(db_session, "university_name_dative", "")
+# Settings used when rendering documents (loaded once per RenderContext)
+RENDER_SETTING_DEFAULTS = {
+    "university_name": "",
+    "university_name_dative": "",
+    "rector_name_dative": "",
+    "rector_name_nominative": "",
+    "dept_name": "",
+    "dept_abbr": "",
+    "dept_head_id": None,
+}
+RENDER_SETTING_KEYS = tuple(RENDER_SETTING_DEFAULTS)
 
-    # Rector settings
-    settings["rector_name_dative"] = SystemSettings.get_value(db_session, "rector_name_dative", "")
-    settings["rector_name_nominative"] = SystemSettings.get_value(db_session, "rector_name_nominative", "")
+# Key of the snapshot in Session.info
+_RENDER_CONTEXT_INFO_KEY = "document_render_context"
 
-    # Department settings
-    settings["dept_name"] = SystemSettings.get_value(db_session, "dept_name", "")
-    settings["dept_abbr"] = SystemSettings.get_value(db_session, "dept_abbr", "")
 
-    # Department head
-    settings["dept_head_id"] = SystemSettings.get_value(db_session, "dept_head_id", None)
+@dataclass(frozen=True)
+class RenderContext:
+    """
+    Snapshot of settings, approvers and department head used for rendering.
 
-    return settings
+    Loaded once per request or batch (see get_render_context) so rendering
+    N documents costs a constant number of queries. Treat as read-only.
+    """
 
+    settings: dict[str, Any]
+    # (position_name, full_name_nom, full_name_dav) ordered by order_index
+    approvers: tuple[tuple[str, str | None, str | None], ...] = ()
+    # (pib_nom, position) of the department head, if configured
+    dept_head: tuple[str, str] | None = None
+
+    @property
+    def dept_head_id(self) -> Any:
+        return self.settings.get("dept_head_id")
+
+    def signatories(self, staff: "Staff | None") -> list:
+        """Signatories for a document of the given staff member."""
+        signatories = []
+
+        # 1. Approvers from database (like in builder_tab.py)
+        for position_name, full_name_nom, full_name_dav in self.approvers:
+            signatories.append({
+                "position": position_name,
+                "position_multiline": "", # Can be enhanced if we store multiline position
+                "name": _format_signatory_name(full_name_nom or full_name_dav)
+            })
+
+        # 2. Filter out current staff if they are in the list
+        if staff:
+            staff_name_formatted = _format_signatory_name(staff.pib_nom)
+            signatories = [s for s in signatories if s.get("name") != staff_name_formatted]
+
+        # 3. Add Department Head (if not already in list)
+        if self.dept_head and staff:
+            head_pib, position = self.dept_head
 
-def get_signatories_from_db(db_session, staff, dept_head_id=None) -> list:
-    """Get signatories from database (department head, dean, etc.)."""
-    from backend.models.staff import Staff as StaffModel
-    from backend.models.settings import Approvers, SystemSettings
-    
-    signatories = []
-    
-    # 1. Get Approvers from database (like in builder_tab.py)
-    approvers = (
-        db_session.query(Approvers)
-        .order_by(Approvers.order_index)
-        .all()
-    )
-    
-    for approver in approvers:
-        # Format the signatory name
-        display_name = _format_signatory_name(approver.full_name_nom or approver.full_name_dav)
-        
-        signatories.append({
-            "position": approver.position_name,
-            "position_multiline": "", # Can be enhanced if we store multiline position
-            "name": display_name
-        })
-
-    # 2. Filter out current staff if they are in the list
-    if staff:
-        staff_name_formatted = _format_signatory_name(staff.pib_nom)
-        signatories = [s for s in signatories if s.get("name") != staff_name_formatted]
-
-    # 3. Add Department Head (if not already in list)
-    if not dept_head_id:
-        dept_head_id = SystemSettings.get_value(db_session, "dept_head_id", None)
-    
-    if dept_head_id and staff:
-        dept_head = db_session.query(StaffModel).filter(StaffModel.id == dept_head_id).first()
-        if dept_head:
             # Check if current staff IS the department head
-            is_dept_head = (staff.pib_nom == dept_head.pib_nom)
+            if staff.pib_nom != head_pib:
+                head_name_formatted = _format_signatory_name(head_pib)
 
-            if not is_dept_head:
-                head_name_formatted = _format_signatory_name(dept_head.pib_nom)
-                
                 # Check if already exists in signatories
                 already_exists = any(s.get("name") == head_name_formatted for s in signatories)
-                
+
                 if not already_exists:
-                    # Format position
-                    position = dept_head.position
                     position_multiline = ""
-                    
+
                     # Add department abbreviation logic
-                    dept_abbr = SystemSettings.get_value(db_session, "dept_abbr", "")
-                    dept_name = SystemSettings.get_value(db_session, "dept_name", "") 
-                    
+                    dept_abbr = self.settings.get("dept_abbr", "")
+                    dept_name = self.settings.get("dept_name", "")
+
                     # Logic from builder_tab.py
                     if dept_abbr:
                         if dept_abbr.lower() not in position.lower():
@@ -192,7 +187,100 @@ def get_signatories_from_db(db_session, staff, dept_head_id=None) -> list:
                         "name": head_name_formatted
                     })
 
-    return signatories
+        return signatories
+
+
+def _load_dept_head(db_session, dept_head_id) -> tuple[str, str] | None:
+    if not dept_head_id:
+        return None
+    row = (
+        db_session.query(StaffModel.pib_nom, StaffModel.position)
+        .filter(StaffModel.id == dept_head_id)
+        .first()
+    )
+    return tuple(row) if row else None
+
+
+def load_render_context(db_session) -> RenderContext:
+    """Load a fresh RenderContext (three queries)."""
+    settings = {
+        **RENDER_SETTING_DEFAULTS,
+        **SystemSettings.get_values(db_session, RENDER_SETTING_KEYS),
+    }
+    approvers = (
+        db_session.query(Approvers.position_name, Approvers.full_name_nom, Approvers.full_name_dav)
+        .order_by(Approvers.order_index)
+        .all()
+    )
+    return RenderContext(
+        settings=settings,
+        approvers=tuple(tuple(row) for row in approvers),
+        dept_head=_load_dept_head(db_session, settings["dept_head_id"]),
+    )
+
+
+def get_render_context(db_session) -> RenderContext:
+    """
+    RenderContext shared by everything rendered with this session.
+
+    The snapshot lives in Session.info (a request in the API, a batch in
+    services) and is dropped at the end of the transaction or when settings,
+    approvers or staff are flushed through the session.
+    """
+    context = db_session.info.get(_RENDER_CONTEXT_INFO_KEY)
+    if context is None:
+        context = load_render_context(db_session)
+        db_session.info[_RENDER_CONTEXT_INFO_KEY] = context
+    return context
+
+
+def invalidate_render_context(db_session) -> None:
+    """Drop the session's RenderContext snapshot."""
+    db_session.info.pop(_RENDER_CONTEXT_INFO_KEY, None)
+
+
+_RENDER_CONTEXT_MODELS = (SystemSettings, Approvers, StaffModel)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_render_context_after_flush(session: Session, flush_context) -> None:
+    if _RENDER_CONTEXT_INFO_KEY not in session.info:
+        return
+    if any(
+        isinstance(obj, _RENDER_CONTEXT_MODELS)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        invalidate_render_context(session)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_render_context_at_transaction_end(session: Session) -> None:
+    # The next transaction may see settings changed by another process
+    invalidate_render_context(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_render_context_on_bulk_write(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in _RENDER_CONTEXT_MODELS:
+        invalidate_render_context(orm_execute_state.session)
+
+
+def get_settings_from_db(db_session) -> dict:
+    """Get university and rector settings from database."""
+    return dict(get_render_context(db_session).settings)
+
+
+def get_signatories_from_db(db_session, staff, dept_head_id=None) -> list:
+    """Get signatories from database (department head, dean, etc.)."""
+    context = get_render_context(db_session)
+    if dept_head_id and dept_head_id != context.dept_head_id:
+        context = replace(context, dept_head=_load_dept_head(db_session, dept_head_id))
+    return context.signatories(staff)
+
 
 def _format_signatory_name(full_name: str) -> str:
     """
@@ -231,6 +319,8 @@ def render_document_html(
     db_session: Any = None,
     staff_id: int | None = None,
     employment_type: str | None = None,
+    render_context: RenderContext | None = None,
+    staff: "Staff | None" = None,
 ) -> str:
     """
     Render document HTML using template from backend/templates/documents.
@@ -248,6 +338,8 @@ def render_document_html(
         db_session: Database session to fetch settings (optional)
         staff_id: Staff ID for fetching additional data
         employment_type: Employment type for notes
+        render_context: Settings/approvers snapshot (defaults to the session's one)
+        staff: Staff model, if already loaded (avoids a lookup by staff_id)
 
     Returns:
         Rendered HTML string
@@ -258,12 +350,8 @@ def render_document_html(
     from backend.services.grammar_service import GrammarService
     grammar = GrammarService()
 
-    templates_dir = get_templates_dir()
-
-    jinja_env = Environment(
-        loader=FileSystemLoader(str(templates_dir)),
-        autoescape=True,
-    )
+    # Shared compiled environment (see template_registry)
+    jinja_env = get_template_registry().get_environment(DOCUMENTS_ENV)
 
     # Get template filename from mapping
     template_filename = TEMPLATE_MAP.get(doc_type, DEFAULT_TEMPLATE)
@@ -293,16 +381,18 @@ def render_document_html(
     # Get settings from database if session provided
     db_settings = {}
     db_signatories = []
-    if db_session:
-        db_settings = get_settings_from_db(db_session)
+    if render_context is None and db_session:
+        render_context = get_render_context(db_session)
+    if render_context is not None:
+        db_settings = render_context.settings
 
-        # Get staff from db if we have staff_id
-        db_staff = None
-        if staff_id:
-            db_staff = db_session.query(StaffModel).filter(StaffModel.id == staff_id).first()
+        # Get staff from db if we have staff_id (identity map first)
+        db_staff = staff
+        if db_staff is None and staff_id and db_session:
+            db_staff = db_session.get(StaffModel, staff_id)
 
-        # Get signatories from database
-        db_signatories = get_signatories_from_db(db_session, db_staff, db_settings.get("dept_head_id"))
+        # Signatories from the snapshot
+        db_signatories = render_context.signatories(db_staff)
 
     # Merge signatories: passed in > from database
     final_signatories = signatories if signatories else db_signatories
@@ -521,13 +611,18 @@ def render_document_html(
     return html
 
 
-def render_document(document: "Document", db_session: Any = None) -> str:
+def render_document(
+    document: "Document",
+    db_session: Any = None,
+    render_context: RenderContext | None = None,
+) -> str:
     """
     Render a Document model to HTML.
 
     Args:
         document: Document model instance
         db_session: Database session to fetch settings
+        render_context: Settings/approvers snapshot (defaults to the session's one)
 
     Returns:
         Rendered HTML string
@@ -551,4 +646,6 @@ def render_document(document: "Document", db_session: Any = None) -> str:
         db_session=db_session,
         staff_id=document.staff_id if document else None,
         employment_type=employment_type,
+        render_context=render_context,
+        staff=staff,
     )
@@ -2,10 +2,7 @@
 
 import datetime
 import json
-import os
 import shutil
-import subprocess
-import tempfile
 from datetime import date
 from decimal import Decimal
 from pathlib import Path
@@ -16,8 +13,11 @@ from sqlalchemy.orm import Session
 from backend.core.config import get_settings
 from backend.models.document import Document
 from backend.models.settings import Approvers, SystemSettings
+from backend.services.archive_format import ARCHIVE_SUFFIX, read_archive, write_archive
 from backend.services.attendance_service import AttendanceConflictError, AttendanceLockedError
 from backend.services.grammar_service import GrammarService
+from backend.services.blob_store import BLOBS_DIR_NAME, BlobStore, blob_sha256
+from backend.services.pdf_renderer import render_pdf
 from shared.enums import DocumentStatus, DocumentType
 from shared.exceptions import DocumentGenerationError
 from shared.constants import SETTING_PDF_TERM_EXTENSION_TEMPLATE
@@ -25,9 +25,6 @@ from shared.constants import SETTING_PDF_TERM_EXTENSION_TEMPLATE
 
 settings = get_settings()
 
-# WeasyPrint executable path
-WEASYPRINT_EXE = Path(__file__).parent.parent.parent / 'weasyprint' / 'dist' / 'weasyprint.exe'
-
 # Ukrainian month names
 UKRAINIAN_MONTHS = {
     1: "січень", 2: "лютий", 3: "березень", 4: "квітень",
@@ -137,14 +134,9 @@ class DocumentService:
                         "Зверніться до адміністратора."
                     )
 
-                output_path = self._get_output_path(document)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Копіюємо PDF шаблон
-                import shutil
-                shutil.copy(template_path, output_path)
-
-                document.file_docx_path = str(output_path)
+                # Копіюємо PDF шаблон у сховище (однаковий шаблон зберігається один раз)
+                store = self._blob_store()
+                output_path = store.attach(document, "file_docx_path", store.put_file(Path(template_path)))
                 self.db.commit()
 
                 return output_path
@@ -154,12 +146,8 @@ class DocumentService:
                     "Відсутній контент. Спочатку створіть документ у редакторі."
                 )
 
-            output_path = self._get_output_path(document)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path = self._generate_pdf(document, raw_html)
 
-            self._generate_pdf(document, output_path, raw_html)
-
-            document.file_docx_path = str(output_path)
             # Status stays as DRAFT - will change to SIGNED_BY_APPLICANT when applicant signs
             self.db.commit()
 
@@ -169,8 +157,8 @@ class DocumentService:
             self.db.rollback()
             raise DocumentGenerationError(f"Помилка генерації документа: {e}") from e
 
-    def _generate_pdf(self, document: Document, output_path: Path, raw_html: str | None = None):
-        """Генерує PDF з WYSIWYG контенту."""
+    def _generate_pdf(self, document: Document, raw_html: str | None = None) -> Path:
+        """Генерує PDF з WYSIWYG контенту і зберігає у сховищі файлів."""
         if raw_html:
             html_content = self._wrap_html_for_pdf(raw_html)
         else:
@@ -178,29 +166,32 @@ class DocumentService:
             blocks = editor_data.get('blocks', {})
             html_content = self._build_fallback_html(blocks)
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-            f.write(html_content)
-            html_path = f.name
-
         try:
-            if not os.path.exists(WEASYPRINT_EXE):
-                raise DocumentGenerationError(f"WeasyPrint not found at: {WEASYPRINT_EXE}")
+            return self._store_pdf(document, render_pdf(html_content))
+        finally:
+            debug_html_path = self._get_debug_html_path(document)
+            debug_html_path.parent.mkdir(parents=True, exist_ok=True)
+            debug_html_path.write_text(html_content, encoding='utf-8')
+
+    def _blob_store(self) -> BlobStore:
+        return BlobStore(self.db, root=self.storage_dir / BLOBS_DIR_NAME)
 
-            result = subprocess.run(
-                [WEASYPRINT_EXE, html_path, str(output_path)],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+    def _store_pdf(self, document: Document, pdf: bytes) -> Path:
+        """
+        Зберігає PDF документа у контентно-адресованому сховищі.
 
-            if result.returncode != 0:
-                raise DocumentGenerationError(f"WeasyPrint failed: {result.stderr or 'Unknown error'}")
+        PDF з тим самим вмістом не записується повторно.
 
-        finally:
-            debug_html_path = Path(output_path).parent / f"{Path(output_path).stem}_debug.html"
-            if os.path.exists(html_path):
-                shutil.copy(html_path, debug_html_path)
-                os.remove(html_path)
+        Returns:
+            Path: Шлях до PDF (file_docx_path документа)
+        """
+        store = self._blob_store()
+        return store.attach(document, "file_docx_path", store.put_bytes(pdf, ".pdf"))
+
+    def _get_debug_html_path(self, document: Document, **kwargs) -> Path:
+        """Копія HTML для діагностики (поруч з файлами за назвою, не у сховищі)."""
+        output_path = self._get_output_path(document, **kwargs)
+        return output_path.parent / f"{output_path.stem}_debug.html"
 
     def _wrap_html_for_pdf(self, content_html: str) -> str:
         """Обгортає готовий HTML контент у повний документ з CSS для друку."""
@@ -257,12 +248,8 @@ class DocumentService:
         Returns:
             Path до створеного файлу
         """
-        from jinja2 import Environment, FileSystemLoader
-        from pathlib import Path as FilePath
         from backend.models.settings import SystemSettings
-
-        # Get template directory
-        templates_dir = FilePath(__file__).parent.parent.parent / 'desktop' / 'templates' / 'documents'
+        from backend.services.template_registry import DOCUMENT_FILES_ENV, get_template
 
         # Choose template based on doc type
         if document.doc_type in (
@@ -321,9 +308,8 @@ class DocumentService:
         else:
             template_name = 'vacation_paid.html'  # Default
 
-        # Load template
-        env = Environment(loader=FileSystemLoader(str(templates_dir)))
-        template = env.get_template(template_name)
+        # Load compiled template from the shared registry (desktop/templates/documents)
+        template = get_template(DOCUMENT_FILES_ENV, template_name)
 
         # Get settings from database using SystemSettings (like builder tab)
         university_name = SystemSettings.get_value(self.db, 'university_name', '')
@@ -509,37 +495,16 @@ class DocumentService:
         # Wrap for PDF
         html_content = self._wrap_html_for_pdf(raw_html)
 
-        # Save HTML to temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-            f.write(html_content)
-            html_path = f.name
-
         try:
-            # Get output path
-            output_path = self._get_output_path(document, bulk_mode=bulk_mode)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
             # Generate PDF
-            if not os.path.exists(WEASYPRINT_EXE):
-                raise DocumentGenerationError(f"WeasyPrint not found at: {WEASYPRINT_EXE}")
-
-            result = subprocess.run(
-                [WEASYPRINT_EXE, html_path, str(output_path)],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-
-            if result.returncode != 0:
-                raise DocumentGenerationError(f"WeasyPrint failed: {result.stderr or 'Unknown error'}")
-
-            document.file_docx_path = str(output_path)
+            output_path = self._store_pdf(document, render_pdf(html_content))
             self.db.commit()
 
-            # Save debug HTML copy before cleanup
-            debug_html_path = Path(output_path).parent / f"{Path(output_path).stem}_debug.html"
+            # Save debug HTML copy
+            debug_html_path = self._get_debug_html_path(document, bulk_mode=bulk_mode)
             try:
-                shutil.copy(html_path, debug_html_path)
+                debug_html_path.parent.mkdir(parents=True, exist_ok=True)
+                debug_html_path.write_text(html_content, encoding='utf-8')
             except Exception:
                 pass
 
@@ -548,13 +513,6 @@ class DocumentService:
         except Exception as e:
             self.db.rollback()
             raise DocumentGenerationError(f"Помилка генерації документа з шаблону: {e}") from e
-        finally:
-            # Clean up temp HTML file (debug copy already saved above)
-            try:
-                if 'html_path' in dir() and os.path.exists(html_path):
-                    os.unlink(html_path)
-            except:
-                pass
 
     def _render_html_to_pdf(self, html_content: str, document: Document, creation_date: date = None) -> Path:
         """
@@ -563,7 +521,7 @@ class DocumentService:
         Args:
             html_content: Rendered HTML template
             document: Document object for path determination
-            creation_date: Date of document creation (for folder naming)
+            creation_date: Not used (PDF path is determined by its content)
 
         Returns:
             Path to generated PDF
@@ -571,31 +529,9 @@ class DocumentService:
         # Wrap HTML for PDF
         wrapped_html = self._wrap_html_for_pdf(html_content)
 
-        # Save HTML to temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-            f.write(wrapped_html)
-            html_path = f.name
-
         try:
-            # Get output path using creation date for folder naming
-            output_path = self._get_output_path(document, creation_date)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
             # Generate PDF
-            if not os.path.exists(WEASYPRINT_EXE):
-                raise DocumentGenerationError(f"WeasyPrint not found at: {WEASYPRINT_EXE}")
-
-            result = subprocess.run(
-                [WEASYPRINT_EXE, html_path, str(output_path)],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-
-            if result.returncode != 0:
-                raise DocumentGenerationError(f"WeasyPrint failed: {result.stderr or 'Unknown error'}")
-
-            document.file_docx_path = str(output_path)
+            output_path = self._store_pdf(document, render_pdf(wrapped_html))
             self.db.commit()
 
             return output_path
@@ -603,12 +539,6 @@ class DocumentService:
         except Exception as e:
             self.db.rollback()
             raise DocumentGenerationError(f"Помилка генерації PDF: {e}") from e
-        finally:
-            # Clean up temp HTML file
-            try:
-                os.unlink(html_path)
-            except:
-                pass
 
     def _get_output_path(self, document: Document, creation_date: date = None, bulk_mode: bool = False) -> Path:
         """Генерує шлях для збереження файлу.
@@ -669,9 +599,13 @@ class DocumentService:
     def rollback_to_draft(self, document: Document, reason: str | None = None) -> None:
         """Повертає документ у статус Draft, видаляє старі файли."""
         try:
+            store = self._blob_store()
             if document.file_docx_path:
                 pdf_path = Path(document.file_docx_path)
-                if pdf_path.exists():
+                if blob_sha256(pdf_path):
+                    # Файл сховища може використовуватись іншими документами
+                    store.release(pdf_path)
+                elif pdf_path.exists():
                     pdf_path.unlink()
 
             if document.file_scan_path:
@@ -681,7 +615,11 @@ class DocumentService:
                 timestamp = int(__import__('time').time())
                 new_name = f"{scan_path.stem}_{timestamp}{scan_path.suffix}"
                 obsolete_path = obsolete_dir / new_name
-                if scan_path.exists():
+                if blob_sha256(scan_path):
+                    if scan_path.exists():
+                        shutil.copy2(str(scan_path), str(obsolete_path))
+                    store.release(scan_path)
+                elif scan_path.exists():
                     shutil.move(str(scan_path), str(obsolete_path))
 
             document.status = DocumentStatus.DRAFT
@@ -706,7 +644,8 @@ class DocumentService:
             if document.doc_type.value == "vacation_paid":
                 document.staff.vacation_balance -= document.days_count
 
-            if document.file_scan_path:
+            # Файли сховища не переміщуються (шлях визначає вміст)
+            if document.file_scan_path and not blob_sha256(document.file_scan_path):
                 scan_path = Path(document.file_scan_path)
                 processed_dir = self._get_output_path(document).parent
                 processed_path = processed_dir / scan_path.name
@@ -728,7 +667,8 @@ class DocumentService:
         document.applicant_signed_comment = comment
         
         # Move file from draft folder to signed_by_applicant folder
-        if document.file_docx_path:
+        # (файли сховища не переміщуються)
+        if document.file_docx_path and not blob_sha256(document.file_docx_path):
             old_path = Path(document.file_docx_path)
             if old_path.exists():
                 new_path = self._get_output_path(document)
@@ -863,15 +803,9 @@ class DocumentService:
         if file_path:
             scan_path = Path(file_path)
             if scan_path.exists():
-                output_dir = self._get_output_path(document).parent / "scans"
-                output_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Copy file with standardized name
-                new_filename = f"scan_{document.id}_{scan_path.name}"
-                new_path = output_dir / new_filename
-                
-                shutil.copy2(str(scan_path), str(new_path))
-                document.file_scan_path = str(new_path)
+                # Копія у сховищі (повторний той самий скан не дублюється)
+                store = self._blob_store()
+                store.attach(document, "file_scan_path", store.put_file(scan_path))
         
         # Create archive snapshot with staff/approver data
         try:
@@ -946,7 +880,7 @@ class DocumentService:
 
 def save_document_archive(document: Document, db: Session) -> Path:
     """
-    Зберігає архів документа у JSON форматі при скануванні.
+    Зберігає архів документа при скануванні (стиснутий формат v2, див. archive_format).
     
     Архів містить знімок усіх даних, потрібних для відтворення документа:
     - Дані співробітника (ПІБ, посада, ступінь)
@@ -1007,7 +941,7 @@ def save_document_archive(document: Document, db: Session) -> Path:
     
     # Build archive data
     archive_data = {
-        "version": "1.0",
+        "version": "2.0",
         "archived_at": datetime.datetime.utcnow().isoformat(),
         "document_id": document.id,
         "document_type": document.doc_type.value,
@@ -1036,12 +970,19 @@ def save_document_archive(document: Document, db: Session) -> Path:
     
     # Generate filename based on document
     surname = staff.pib_nom.split()[0] if staff.pib_nom else "unknown"
-    filename = f"doc_{document.id}_{surname}_archive.json"
+    filename = f"doc_{document.id}_{surname}_archive{ARCHIVE_SUFFIX}"
     filepath = storage_dir / filename
     
-    # Save archive
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(archive_data, f, ensure_ascii=False, indent=2)
+    # Save compressed archive; rendered HTML is decoded only when displayed
+    write_archive(
+        filepath, archive_data,
+        lazy_sections=("rendered_html",),
+        meta={
+            "document_id": document.id,
+            "document_type": archive_data["document_type"],
+            "archived_at": archive_data["archived_at"],
+        },
+    )
     
     return filepath
 
@@ -1051,15 +992,12 @@ def reconstruct_document_from_archive(archive_path: Path) -> dict:
     Відновлює дані документа з архіву.
     
     Args:
-        archive_path: Шлях до JSON архіву
+        archive_path: Шлях до архіву (v2 або JSON v1.0)
         
     Returns:
-        dict: Словник з усіма даними для відтворення документа
+        ArchiveData: Словник з усіма даними для відтворення документа
     """
-    with open(archive_path, 'r', encoding='utf-8') as f:
-        archive_data = json.load(f)
-    
-    return archive_data
+    return read_archive(archive_path)
 
 
 def get_document_context_for_display(document: Document, db: Session) -> dict:
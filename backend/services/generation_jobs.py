@@ -0,0 +1,228 @@
+"""Обробники фонових задач генерації та функції постановки їх у чергу.
+
+- document_pdf: PDF одного документа (dedup за id документа)
+- bulk_generate: масове створення документів (dedup за параметрами)
+- tabel_pdf: PDF табеля з титульною сторінкою (dedup за місяцем табеля;
+  для погодженого місяця тіло PDF береться з кешу архіву)
+- scan_thumbnail: мініатюра і метадані завантаженого скану (dedup за файлом скану)
+"""
+
+import hashlib
+import json
+import shutil
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from backend.models.document import Document
+from backend.models.generation_job import GenerationJob
+from backend.models.settings import SystemSettings
+from backend.models.staff import Staff
+from backend.services.grammar_service import GrammarService
+from backend.services.job_service import JobContext, job_handler, job_queue
+from backend.services.template_registry import DESKTOP_TEMPLATES_DIR
+from shared.exceptions import DocumentNotFoundError
+
+DOCUMENT_PDF_JOB = "document_pdf"
+BULK_GENERATE_JOB = "bulk_generate"
+TABEL_PDF_JOB = "tabel_pdf"
+SCAN_THUMBNAIL_JOB = "scan_thumbnail"
+
+
+@lru_cache
+def _grammar() -> GrammarService:
+    return GrammarService()
+
+
+def _params_key(kind: str, params: dict[str, Any]) -> str:
+    payload = json.dumps(params, ensure_ascii=False, sort_keys=True, default=str)
+    return f"{kind}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]}"
+
+
+@job_handler(DOCUMENT_PDF_JOB)
+def run_document_pdf(ctx: JobContext) -> dict[str, Any]:
+    """Генерує PDF документа з його актуального HTML."""
+    from backend.services.document_render_cache import get_rendered_html
+    from backend.services.document_service import DocumentService
+
+    document_id = ctx.params["document_id"]
+    document = ctx.db.get(Document, document_id)
+    if document is None:
+        raise DocumentNotFoundError(f"Документ {document_id} не знайдено")
+
+    ctx.set_total(1)
+    raw_html = get_rendered_html(document, ctx.db)
+    path = DocumentService(ctx.db, _grammar()).generate_document(document, raw_html)
+    ctx.advance({"document_id": document_id, "file_path": str(path)})
+    return {"document_id": document_id, "file_path": str(path)}
+
+
+@job_handler(BULK_GENERATE_JOB)
+def run_bulk_generate(ctx: JobContext) -> dict[str, Any]:
+    """Масове створення документів з прогресом по кожному співробітнику."""
+    from backend.services.bulk_document_service import BulkDocumentService
+
+    params = ctx.params
+    date_start = date.fromisoformat(params["date_start"])
+    date_end = date.fromisoformat(params["date_end"])
+    staff_list = ctx.db.query(Staff).filter(Staff.id.in_(params["staff_ids"])).all()
+    ctx.set_total(len(staff_list))
+
+    service = BulkDocumentService(ctx.db, _grammar())
+    validation = service.validate_staff_for_batch(
+        staff_list, date_start, date_end, validation_token=params.get("validation_token"),
+    )
+    for item in validation["invalid"]:
+        ctx.advance({"staff_id": item["staff"].id}, error="; ".join(item["reasons"]))
+
+    def on_progress(staff, document, error):
+        ctx.advance(
+            {"staff_id": staff.id, "document_id": document.id if document else None},
+            error=str(error) if error else None,
+        )
+
+    report = service.generate_batch(
+        staff_list=validation["valid"],
+        doc_type=params["doc_type"],
+        date_start=date_start,
+        date_end=date_end,
+        file_suffix=params.get("file_suffix", ""),
+        on_progress=on_progress,
+    )
+    if params.get("render_pdf"):
+        service.render_batch_pdfs(report)
+    return {
+        "generated_count": len(report.documents),
+        "document_ids": [document.id for document in report.documents],
+        "failed": [item.to_dict() for item in report.failed],
+    }
+
+
+@job_handler(TABEL_PDF_JOB)
+def run_tabel_pdf(ctx: JobContext) -> dict[str, Any]:
+    """PDF табеля: HTML -> PDF у пулі рендерингу, злиття з титульною сторінкою."""
+    from backend.services.pdf_renderer import write_pdf
+    from backend.services.tabel_render_cache import get_tabel_pdf_path
+    from backend.services.tabel_service import (
+        DEFAULT_EDRPOU_CODE,
+        DEFAULT_INSTITUTION_NAME,
+        _wrap_tabel_html_for_pdf,
+        find_approved_tabel_archive,
+        generate_tabel_with_title,
+        merge_pdfs,
+    )
+
+    params = ctx.params
+    is_correction = params.get("is_correction", False)
+    add_title_page = params.get("add_title_page", True)
+    employees_per_page = params.get("employees_per_page", 0)
+    ctx.set_total(3 if add_title_page else 2)
+
+    # Погоджений місяць: тіло PDF - з кешу архіву (архів без розбиття на сторінки)
+    archive_path = None
+    if not employees_per_page:
+        archive_path = find_approved_tabel_archive(
+            params["month"], params["year"],
+            is_correction=is_correction,
+            correction_month=params.get("correction_month"),
+            correction_year=params.get("correction_year"),
+        )
+
+    html, final_path, title_pdf_path = generate_tabel_with_title(
+        month=params["month"],
+        year=params["year"],
+        institution_name=SystemSettings.get_value(ctx.db, "institution_name", DEFAULT_INSTITUTION_NAME),
+        edrpou_code=SystemSettings.get_value(ctx.db, "edrpou_code", DEFAULT_EDRPOU_CODE),
+        employees_per_page=employees_per_page,
+        is_correction=is_correction,
+        correction_month=params.get("correction_month"),
+        correction_year=params.get("correction_year"),
+        add_title_page=add_title_page,
+        generate_html=archive_path is None,
+    )
+    ctx.advance({"step": "html"})
+
+    body_path = final_path.with_name(f"body_{final_path.name}")
+    if archive_path is not None:
+        shutil.copyfile(get_tabel_pdf_path(archive_path), body_path)
+        ctx.advance({"step": "pdf", "cached": True})
+    else:
+        # sheet.css підключається відносно директорії шаблону
+        template_dir = DESKTOP_TEMPLATES_DIR / ("tabel_corection" if is_correction else "tabel")
+        write_pdf(_wrap_tabel_html_for_pdf(html), body_path, base_url=template_dir.as_uri())
+        ctx.advance({"step": "pdf"})
+
+    if title_pdf_path is not None:
+        merge_pdfs([title_pdf_path, body_path], final_path)
+        body_path.unlink(missing_ok=True)
+        title_pdf_path.unlink(missing_ok=True)
+        ctx.advance({"step": "merge"})
+    else:
+        body_path.replace(final_path)
+    return {"file_path": str(final_path)}
+
+
+@job_handler(SCAN_THUMBNAIL_JOB)
+def run_scan_thumbnail(ctx: JobContext) -> dict[str, Any]:
+    """Кількість сторінок, розмір і мініатюра першої сторінки скану."""
+    from backend.services.scan_thumbnails import extract_scan_info
+
+    document_id = ctx.params["document_id"]
+    document = ctx.db.get(Document, document_id)
+    if document is None:
+        raise DocumentNotFoundError(f"Документ {document_id} не знайдено")
+    if not document.file_scan_path:
+        raise DocumentNotFoundError(f"Документ {document_id} не має скану")
+
+    ctx.set_total(1)
+    info = extract_scan_info(Path(document.file_scan_path))
+    document.scan_page_count = info.page_count
+    document.scan_size = info.size
+    document.scan_thumbnail_path = str(info.thumbnail_path) if info.thumbnail_path else None
+    ctx.advance({"document_id": document_id})
+    return {
+        "document_id": document_id,
+        "page_count": info.page_count,
+        "size": info.size,
+        "thumbnail_path": document.scan_thumbnail_path,
+    }
+
+
+def submit_document_pdf(db: Session, document_id: int, created_by: str | None = None) -> tuple[GenerationJob, bool]:
+    """Ставить в чергу генерацію PDF документа."""
+    return job_queue.submit(
+        db, DOCUMENT_PDF_JOB, {"document_id": document_id},
+        dedup_key=f"{DOCUMENT_PDF_JOB}:{document_id}", created_by=created_by,
+    )
+
+
+def submit_bulk_generate(db: Session, params: dict[str, Any], created_by: str | None = None) -> tuple[GenerationJob, bool]:
+    """Ставить в чергу масове створення документів (params - BulkGenerateRequest у JSON)."""
+    params = {**params, "staff_ids": sorted(params["staff_ids"])}
+    # Токен валідації одноразовий і не впливає на результат задачі
+    dedup_params = {k: v for k, v in params.items() if k != "validation_token"}
+    return job_queue.submit(
+        db, BULK_GENERATE_JOB, params,
+        dedup_key=_params_key(BULK_GENERATE_JOB, dedup_params), created_by=created_by,
+    )
+
+
+def submit_scan_thumbnail(db: Session, document: Document) -> tuple[GenerationJob, bool]:
+    """Ставить в чергу обробку щойно завантаженого скану документа."""
+    params = {"document_id": document.id}
+    dedup_params = {**params, "file_scan_path": document.file_scan_path}
+    return job_queue.submit(
+        db, SCAN_THUMBNAIL_JOB, params,
+        dedup_key=_params_key(SCAN_THUMBNAIL_JOB, dedup_params),
+    )
+
+
+def submit_tabel_pdf(db: Session, params: dict[str, Any], created_by: str | None = None) -> tuple[GenerationJob, bool]:
+    """Ставить в чергу генерацію PDF табеля."""
+    return job_queue.submit(
+        db, TABEL_PDF_JOB, params,
+        dedup_key=_params_key(TABEL_PDF_JOB, params), created_by=created_by,
+    )
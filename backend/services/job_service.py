@@ -0,0 +1,243 @@
+"""Локальна черга фонових задач генерації.
+
+Задачі (GenerationJob) зберігаються в БД і виконуються пулом потоків
+процесу сервера; важкий рендеринг PDF всередині задачі йде через пул
+процесів pdf_renderer. Викликач отримує job id одразу, а стан задачі
+доступний через /api/jobs/{id} і розсилається по WebSocket (/ws) як
+повідомлення типу "job_updated".
+
+Обробники задач реєструються декоратором @job_handler("kind")
+(див. backend.services.generation_jobs).
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.core.config import get_settings
+from backend.core.database import SessionLocal
+from backend.core.websocket import WebSocketMessage, manager
+from backend.models.generation_job import ACTIVE_JOB_STATUSES, GenerationJob, JobStatus
+
+logger = logging.getLogger(__name__)
+
+# Тип WebSocket повідомлення про зміну задачі
+JOB_MESSAGE_TYPE = "job_updated"
+
+
+class JobContext:
+    """Контекст виконання задачі: сесія БД, параметри та звіт про прогрес."""
+
+    def __init__(self, queue: "JobQueue", db: Session, job: GenerationJob):
+        self.queue = queue
+        self.db = db
+        self.job = job
+        self.params: dict[str, Any] = dict(job.params or {})
+
+    def set_total(self, total: int) -> None:
+        """Встановлює кількість елементів задачі."""
+        self.job.progress_total = total
+        self.db.commit()
+        self.queue.publish(self.job)
+
+    def advance(self, item: dict[str, Any] | None = None, error: str | None = None) -> None:
+        """
+        Позначає ще один елемент обробленим і зберігає його частковий результат.
+
+        Args:
+            item: Результат елемента (наприклад {"document_id": 5})
+            error: Помилка елемента (задача продовжується)
+        """
+        entry = dict(item or {})
+        if error is not None:
+            entry["error"] = error
+        self.job.progress_done += 1
+        # JSON колонка відстежує лише присвоєння, тому список створюється заново
+        self.job.results = [*(self.job.results or []), entry]
+        self.db.commit()
+        self.queue.publish(self.job, item=entry)
+
+
+JobHandler = Callable[[JobContext], dict[str, Any] | None]
+
+_handlers: dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """Реєструє обробник задач типу kind."""
+    def decorator(func: JobHandler) -> JobHandler:
+        _handlers[kind] = func
+        return func
+    return decorator
+
+
+def get_job_handler(kind: str) -> JobHandler:
+    """
+    Повертає обробник задачі.
+
+    Raises:
+        ValueError: Якщо тип задачі невідомий
+    """
+    try:
+        return _handlers[kind]
+    except KeyError:
+        raise ValueError(f"Невідомий тип задачі: {kind}") from None
+
+
+class JobQueue:
+    """Черга задач: збереження в БД, дедуплікація і виконання пулом потоків."""
+
+    def __init__(self, session_factory: sessionmaker = SessionLocal, workers: int = 2):
+        self.session_factory = session_factory
+        self.workers = workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Перевірка дубліката і створення задачі мають бути атомарними
+        self._submit_lock = threading.Lock()
+        self._executor_lock = threading.Lock()
+
+    def start(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """
+        Запускає чергу і повертає в неї незавершені задачі.
+
+        Args:
+            loop: Event loop сервера для розсилки прогресу по WebSocket
+        """
+        self._loop = loop
+        self.recover()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Зупиняє пул (задачі в черзі залишаються в БД до наступного запуску)."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+            return self._executor
+
+    def submit(
+        self,
+        db: Session,
+        kind: str,
+        params: dict[str, Any],
+        dedup_key: str | None = None,
+        created_by: str | None = None,
+    ) -> tuple[GenerationJob, bool]:
+        """
+        Ставить задачу в чергу.
+
+        Якщо активна задача з тим самим dedup_key вже є, нова не створюється.
+
+        Args:
+            db: Сесія БД
+            kind: Тип задачі
+            params: Параметри (JSON)
+            dedup_key: Ключ дедуплікації
+            created_by: Хто створив задачу
+
+        Returns:
+            tuple: (задача, True якщо створено нову)
+
+        Raises:
+            ValueError: Якщо тип задачі невідомий
+        """
+        get_job_handler(kind)
+        with self._submit_lock:
+            if dedup_key is not None:
+                existing = db.query(GenerationJob).filter(
+                    GenerationJob.dedup_key == dedup_key,
+                    GenerationJob.status.in_(ACTIVE_JOB_STATUSES),
+                ).order_by(GenerationJob.id.desc()).first()
+                if existing is not None:
+                    return existing, False
+
+            job = GenerationJob(
+                kind=kind,
+                params=params,
+                dedup_key=dedup_key,
+                created_by=created_by,
+                status=JobStatus.QUEUED,
+            )
+            db.add(job)
+            db.commit()
+
+        self.publish(job)
+        self._get_executor().submit(self._run, job.id)
+        return job, True
+
+    def recover(self) -> int:
+        """
+        Повертає в чергу задачі, не завершені до зупинки сервера.
+
+        Returns:
+            int: Кількість задач
+        """
+        with self.session_factory() as db:
+            jobs = db.query(GenerationJob).filter(
+                GenerationJob.status.in_(ACTIVE_JOB_STATUSES),
+            ).order_by(GenerationJob.id).all()
+            for job in jobs:
+                job.status = JobStatus.QUEUED
+            db.commit()
+            job_ids = [job.id for job in jobs]
+
+        for job_id in job_ids:
+            self._get_executor().submit(self._run, job_id)
+        if job_ids:
+            logger.info(f"Requeued {len(job_ids)} unfinished generation jobs")
+        return len(job_ids)
+
+    def _run(self, job_id: int) -> None:
+        with self.session_factory() as db:
+            job = db.get(GenerationJob, job_id)
+            if job is None or job.status != JobStatus.QUEUED:
+                return
+
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.now()
+            job.progress_done = 0
+            job.results = []
+            db.commit()
+            self.publish(job)
+
+            try:
+                result = get_job_handler(job.kind)(JobContext(self, db, job))
+            except Exception as e:
+                logger.exception(f"Generation job {job_id} ({job.kind}) failed")
+                db.rollback()
+                job.status = JobStatus.FAILED
+                job.error = str(e)
+            else:
+                job.status = JobStatus.SUCCEEDED
+                job.result = result
+            job.finished_at = datetime.now()
+            db.commit()
+            self.publish(job)
+
+    def publish(self, job: GenerationJob, item: dict[str, Any] | None = None) -> None:
+        """
+        Розсилає стан задачі по WebSocket.
+
+        Повідомлення не містить усіх часткових результатів, лише останній
+        (item); повний список повертає /api/jobs/{id}.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        data = job.to_dict()
+        data.pop("results")
+        data["item"] = item
+        message = WebSocketMessage(type=JOB_MESSAGE_TYPE, data=data)
+        asyncio.run_coroutine_threadsafe(manager.broadcast(message), loop)
+
+
+job_queue = JobQueue(workers=get_settings().job_workers)
@@ -0,0 +1,283 @@
+"""Рендеринг PDF з HTML.
+
+Основний бекенд - пул довгоживучих процесів з WeasyPrint Python API:
+кожен процес один раз імпортує WeasyPrint і завантажує шрифти, далі
+отримує HTML рядком і повертає байти PDF. Пакетна генерація документів
+не запускає новий процес на кожен документ.
+
+Якщо пакет weasyprint не встановлено (або він не працює, наприклад немає
+Pango), використовується standalone weasyprint.exe, як раніше.
+"""
+
+import importlib.util
+import logging
+from abc import ABC, abstractmethod
+import multiprocessing
+import os
+import subprocess
+import tempfile
+import threading
+from multiprocessing import TimeoutError as PoolTimeoutError
+from pathlib import Path
+from typing import Callable
+
+from backend.core.config import get_settings
+from shared.exceptions import DocumentGenerationError
+
+logger = logging.getLogger(__name__)
+
+# Standalone WeasyPrint (запасний варіант)
+WEASYPRINT_EXE = Path(__file__).parent.parent.parent / 'weasyprint' / 'dist' / 'weasyprint.exe'
+
+# HTML для прогріву процесу (імпорт, шрифти, базовий CSS)
+_WARMUP_HTML = '<html><body><p style="font-family: \'Times New Roman\'">Прогрів</p></body></html>'
+
+
+class PdfQueueFullError(DocumentGenerationError):
+    """Черга рендерингу PDF переповнена."""
+
+
+class PdfRenderTimeoutError(DocumentGenerationError):
+    """Рендеринг PDF перевищив ліміт часу."""
+
+
+def weasyprint_available() -> bool:
+    """Чи встановлено пакет weasyprint (директорія weasyprint/ з exe - не пакет)."""
+    spec = importlib.util.find_spec("weasyprint")
+    return spec is not None and spec.origin is not None
+
+
+def render_with_weasyprint(html: str, base_url: str | None = None) -> bytes:
+    """Рендерить PDF через WeasyPrint API (виконується в процесі пулу)."""
+    from weasyprint import HTML
+
+    return HTML(string=html, base_url=base_url).write_pdf()
+
+
+def _warm_up_worker() -> None:
+    """Ініціалізатор процесу пулу: платить ціну старту WeasyPrint один раз."""
+    try:
+        render_with_weasyprint(_WARMUP_HTML)
+    except Exception:
+        # Помилка повториться в першій задачі і перемкне рендеринг на exe
+        pass
+
+
+class PdfBackend(ABC):
+    """Бекенд рендерингу: HTML рядок -> байти PDF."""
+
+    name = "base"
+
+    @abstractmethod
+    def render(self, html: str, base_url: str | None = None) -> bytes:
+        """Рендерить HTML у PDF."""
+
+    def close(self) -> None:
+        """Звільняє ресурси бекенда."""
+
+
+class WeasyPrintExeBackend(PdfBackend):
+    """Запуск weasyprint.exe на кожен документ через тимчасові файли."""
+
+    name = "exe"
+
+    def __init__(self, exe_path: Path = WEASYPRINT_EXE, timeout: float | None = None):
+        self.exe_path = exe_path
+        self.timeout = timeout
+
+    def render(self, html: str, base_url: str | None = None) -> bytes:
+        if not os.path.exists(self.exe_path):
+            raise DocumentGenerationError(f"WeasyPrint not found at: {self.exe_path}")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_path = Path(temp_dir) / "document.html"
+            pdf_path = Path(temp_dir) / "document.pdf"
+            html_path.write_text(html, encoding="utf-8")
+            command = [str(self.exe_path), str(html_path), str(pdf_path)]
+            if base_url:
+                command[1:1] = ["--base-url", base_url]
+
+            try:
+                result = subprocess.run(
+                    command, capture_output=True, text=True, check=False, timeout=self.timeout,
+                )
+            except subprocess.TimeoutExpired as e:
+                raise PdfRenderTimeoutError(f"WeasyPrint timed out after {self.timeout} s") from e
+
+            if result.returncode != 0:
+                raise DocumentGenerationError(f"WeasyPrint failed: {result.stderr or 'Unknown error'}")
+            return pdf_path.read_bytes()
+
+
+class WeasyPrintPoolBackend(PdfBackend):
+    """
+    Пул прогрітих процесів з обмеженою чергою і лімітом часу на задачу.
+
+    Задача, що перевищила ліміт, не може бути перервана окремо, тому пул
+    перезапускається (задачі, що виконувались паралельно, отримують помилку).
+    """
+
+    name = "pool"
+
+    def __init__(
+        self,
+        workers: int = 2,
+        queue_size: int = 32,
+        timeout: float = 60.0,
+        queue_timeout: float | None = None,
+        render_func: Callable[[str, str | None], bytes] = render_with_weasyprint,
+        initializer: Callable[[], None] | None = _warm_up_worker,
+    ):
+        """
+        Args:
+            workers: Кількість процесів
+            queue_size: Скільки задач може чекати на вільний процес
+            timeout: Ліміт часу рендерингу одного документа, с
+            queue_timeout: Скільки чекати місця в черзі (None - як timeout)
+            render_func: Функція рендерингу (виконується в процесі пулу)
+            initializer: Ініціалізатор процесу
+        """
+        self.workers = workers
+        self.timeout = timeout
+        self.queue_timeout = timeout if queue_timeout is None else queue_timeout
+        self.render_func = render_func
+        self.initializer = initializer
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                # spawn: однакова поведінка на Windows і Linux, без fork потоків сервера
+                context = multiprocessing.get_context("spawn")
+                self._pool = context.Pool(self.workers, initializer=self.initializer)
+            return self._pool
+
+    def _restart(self, pool) -> None:
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.terminate()
+
+    def render(self, html: str, base_url: str | None = None) -> bytes:
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise PdfQueueFullError("Черга генерації PDF переповнена, спробуйте пізніше")
+        try:
+            pool = self._get_pool()
+            result = pool.apply_async(self.render_func, (html, base_url))
+            try:
+                return result.get(self.timeout)
+            except PoolTimeoutError as e:
+                logger.warning(f"PDF rendering timed out after {self.timeout} s, restarting pool")
+                self._restart(pool)
+                raise PdfRenderTimeoutError(f"Рендеринг PDF перевищив {self.timeout} с") from e
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+class FallbackPdfBackend(PdfBackend):
+    """Пул процесів, а якщо WeasyPrint у ньому не запускається - weasyprint.exe."""
+
+    def __init__(self, primary: PdfBackend, fallback: PdfBackend):
+        self.primary = primary
+        self.fallback = fallback
+        self._use_fallback = False
+
+    @property
+    def name(self) -> str:
+        return self.fallback.name if self._use_fallback else self.primary.name
+
+    def render(self, html: str, base_url: str | None = None) -> bytes:
+        if not self._use_fallback:
+            try:
+                return self.primary.render(html, base_url)
+            except (ImportError, OSError) as e:
+                # Пакет є, але не імпортується (наприклад, немає Pango/GTK)
+                logger.warning(f"WeasyPrint API is unavailable ({e}), falling back to weasyprint.exe")
+                self._use_fallback = True
+                self.primary.close()
+        return self.fallback.render(html, base_url)
+
+    def close(self) -> None:
+        self.primary.close()
+        self.fallback.close()
+
+
+_backend: PdfBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def create_pdf_backend() -> PdfBackend:
+    """Створює бекенд за налаштуваннями та наявністю WeasyPrint."""
+    settings = get_settings()
+    exe_backend = WeasyPrintExeBackend(timeout=settings.pdf_job_timeout)
+    if settings.pdf_workers <= 0 or not weasyprint_available():
+        return exe_backend
+    pool_backend = WeasyPrintPoolBackend(
+        workers=settings.pdf_workers,
+        queue_size=settings.pdf_queue_size,
+        timeout=settings.pdf_job_timeout,
+    )
+    return FallbackPdfBackend(pool_backend, exe_backend)
+
+
+def get_pdf_backend() -> PdfBackend:
+    """Повертає спільний бекенд процесу (створюється при першому виклику)."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = create_pdf_backend()
+            logger.info(f"PDF rendering backend: {_backend.name}")
+        return _backend
+
+
+def shutdown_pdf_backend() -> None:
+    """Зупиняє процеси пулу (при завершенні додатку)."""
+    global _backend
+    with _backend_lock:
+        backend, _backend = _backend, None
+    if backend is not None:
+        backend.close()
+
+
+def render_pdf(html: str, base_url: str | None = None) -> bytes:
+    """
+    Рендерить HTML у PDF.
+
+    Args:
+        html: Повний HTML документ
+        base_url: Базовий URL для відносних посилань (CSS, зображення)
+
+    Returns:
+        bytes: Вміст PDF
+
+    Raises:
+        DocumentGenerationError: Помилка рендерингу (PdfQueueFullError,
+            PdfRenderTimeoutError - переповнена черга, перевищено час)
+    """
+    return get_pdf_backend().render(html, base_url)
+
+
+def write_pdf(html: str, output_path: Path, base_url: str | None = None) -> Path:
+    """
+    Рендерить HTML у PDF і записує у файл.
+
+    Args:
+        html: Повний HTML документ
+        output_path: Шлях до PDF
+        base_url: Базовий URL для відносних посилань
+
+    Returns:
+        Path: output_path
+    """
+    output_path = Path(output_path)
+    output_path.write_bytes(render_pdf(html, base_url))
+    return output_path
@@ -0,0 +1,165 @@
+"""Мініатюри та метадані сканів документів.
+
+Після завантаження скану фонова задача (scan_thumbnail, див.
+generation_jobs) рахує кількість сторінок і розмір файлу та рендерить
+мініатюру першої сторінки. Списки документів показують мініатюру замість
+повного PDF/зображення.
+
+Мініатюри адресуються хешем скану (storage_dir/thumbnails/<aa>/<sha256>-<ширина>.<формат>),
+тому однаковий скан рендериться один раз, а відповідь можна кешувати
+назавжди (URL містить версію - хеш).
+
+Рендеринг потребує Pillow (та pypdfium2 для PDF); без них записуються
+лише кількість сторінок і розмір.
+"""
+
+import importlib.util
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+from backend.core.config import get_settings
+from backend.services.blob_store import blob_sha256, file_sha256
+
+logger = logging.getLogger(__name__)
+
+THUMBNAILS_DIR_NAME = "thumbnails"
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
+# Формат мініатюри -> media type
+THUMBNAIL_MEDIA_TYPES = {".webp": "image/webp", ".png": "image/png"}
+
+
+@dataclass
+class ScanInfo:
+    """Метадані скану."""
+    page_count: int | None
+    size: int
+    thumbnail_path: Path | None = None
+
+
+def _module_available(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def thumbnails_root() -> Path:
+    """Директорія мініатюр."""
+    return get_settings().storage_dir / THUMBNAILS_DIR_NAME
+
+
+def count_pages(path: Path) -> int | None:
+    """
+    Кількість сторінок скану.
+
+    Returns:
+        int | None: 1 для зображень, None якщо PDF не читається
+    """
+    if path.suffix.lower() in IMAGE_EXTENSIONS:
+        return 1
+    try:
+        from pypdf import PdfReader
+
+        return len(PdfReader(path).pages)
+    except Exception as e:
+        logger.warning(f"Cannot read page count of {path}: {e}")
+        return None
+
+
+def _first_page_image(path: Path):
+    """Перша сторінка скану як PIL.Image (None - рендеринг недоступний)."""
+    if path.suffix.lower() in IMAGE_EXTENSIONS:
+        from PIL import Image
+
+        with Image.open(path) as image:
+            image.load()
+            return image.convert("RGB")
+
+    if not _module_available("pypdfium2"):
+        return None
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(path)
+    try:
+        page = pdf[0]
+        width = page.get_width()
+        # Рендеринг одразу близько до потрібної ширини (точки PDF -> пікселі)
+        scale = max(get_settings().thumbnail_width * 2 / width, 0.1) if width else 1
+        return page.render(scale=scale).to_pil().convert("RGB")
+    finally:
+        pdf.close()
+
+
+def render_thumbnail(path: Path, sha256: str, root: Path | None = None, width: int | None = None) -> Path | None:
+    """
+    Рендерить мініатюру першої сторінки (якщо ще немає).
+
+    Args:
+        path: Файл скану
+        sha256: Хеш вмісту скану (ім'я мініатюри)
+        root: Директорія мініатюр
+        width: Ширина мініатюри, px
+
+    Returns:
+        Path | None: Шлях до мініатюри або None, якщо Pillow/pypdfium2 недоступні
+    """
+    if not _module_available("PIL"):
+        return None
+    from PIL import features
+
+    root = root or thumbnails_root()
+    width = width or get_settings().thumbnail_width
+    extension = ".webp" if features.check("webp") else ".png"
+    target = root / sha256[:2] / f"{sha256}-{width}{extension}"
+    if target.exists():
+        return target
+
+    image = _first_page_image(path)
+    if image is None:
+        return None
+    image.thumbnail((width, width * 2))
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp = target.with_name(f".tmp-{target.name}")
+    image.save(temp, format=extension[1:].upper())
+    temp.replace(target)
+    return target
+
+
+def extract_scan_info(path: Path, root: Path | None = None) -> ScanInfo:
+    """
+    Метадані та мініатюра скану.
+
+    Raises:
+        FileNotFoundError: Якщо файлу скану немає
+    """
+    path = Path(path)
+    sha256 = blob_sha256(path)
+    if sha256 is None:
+        # Старі файли поза сховищем
+        sha256, size = file_sha256(path)
+    else:
+        size = path.stat().st_size
+    return ScanInfo(
+        page_count=count_pages(path),
+        size=size,
+        thumbnail_path=render_thumbnail(path, sha256, root),
+    )
+
+
+def reset_scan_info(document, size: int | None = None) -> None:
+    """Скидає метадані попереднього скану (новий обробляється у фоні)."""
+    document.scan_page_count = None
+    document.scan_size = size
+    document.scan_thumbnail_path = None
+
+
+def thumbnail_version(thumbnail_path: str | Path) -> str:
+    """Версія мініатюри для URL і ETag (хеш скану)."""
+    return Path(thumbnail_path).stem.split("-")[0][:16]
+
+
+def thumbnail_url(document_id: int, thumbnail_path: str | None) -> str | None:
+    """URL мініатюри документа (з версією, тому кешується назавжди)."""
+    if not thumbnail_path:
+        return None
+    return f"/api/documents/{document_id}/thumbnail?v={thumbnail_version(thumbnail_path)}"
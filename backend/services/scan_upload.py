@@ -0,0 +1,142 @@
+"""Потокове приймання сканів документів.
+
+Файл з запиту читається блоками фіксованого розміру і пишеться у тимчасовий
+файл у сховищі, паралельно рахується SHA-256. Розмір перевіряється на
+кожному блоці, тому завеликий файл відхиляється, не будучи прочитаним до
+кінця. Готовий файл атомарно (os.replace) переміщується на місце або у
+сховище файлів (blob_store), де однаковий вміст зберігається один раз.
+
+Уся робота з диском виконується в пулі потоків, event loop не блокується.
+"""
+
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from backend.core.config import get_settings
+from backend.models.blob import StoredBlob
+from backend.services.blob_store import BlobStore
+from shared.exceptions import ValidationError
+
+# Піддиректорія сховища для незавершених завантажень (та сама файлова
+# система, що й місце призначення, інакше os.replace не атомарний)
+INCOMING_DIR_NAME = ".incoming"
+
+
+class ScanTooLargeError(ValidationError):
+    """Скан перевищує допустимий розмір."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        super().__init__(f"Файл завеликий. Максимум: {max_size / 1024 / 1024:.1f} MB")
+
+
+@dataclass
+class StagedScan:
+    """Завантажений у тимчасовий файл скан."""
+    temp_path: Path
+    sha256: str
+    size: int
+
+    async def commit(self, destination: Path) -> Path:
+        """
+        Атомарно переміщує скан на місце (існуючий файл замінюється).
+
+        Returns:
+            Path: destination
+        """
+        await run_in_threadpool(_move_into_place, self.temp_path, destination)
+        return destination
+
+    async def commit_to_store(self, store: BlobStore, extension: str | None = None) -> StoredBlob:
+        """
+        Переміщує скан у контентно-адресоване сховище.
+
+        Якщо такий вміст уже є, тимчасовий файл просто видаляється.
+
+        Returns:
+            StoredBlob: Запис сховища (див. BlobStore.attach)
+        """
+        return await run_in_threadpool(
+            store.put_file, self.temp_path, extension, move=True, sha256=self.sha256, size=self.size,
+        )
+
+    async def discard(self) -> None:
+        """Видаляє тимчасовий файл (якщо скан не знадобився)."""
+        await run_in_threadpool(self.temp_path.unlink, missing_ok=True)
+
+
+def incoming_dir() -> Path:
+    """Директорія тимчасових файлів завантаження."""
+    return get_settings().storage_dir / "scans" / INCOMING_DIR_NAME
+
+
+def _open_temp_file(directory: Path, suffix: str):
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, name = tempfile.mkstemp(dir=directory, suffix=suffix)
+    return os.fdopen(fd, "wb"), Path(name)
+
+
+def _write_chunk(handle, hasher, chunk: bytes) -> None:
+    hasher.update(chunk)
+    handle.write(chunk)
+
+
+def _move_into_place(source: Path, destination: Path) -> None:
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(source, destination)
+
+
+async def stage_upload(
+    upload: UploadFile,
+    max_size: int | None = None,
+    chunk_size: int | None = None,
+    directory: Path | None = None,
+) -> StagedScan:
+    """
+    Зберігає файл з запиту у тимчасовий файл блоками.
+
+    Args:
+        upload: Файл з multipart запиту
+        max_size: Максимальний розмір, байт (за замовчуванням settings.scan_max_size)
+        chunk_size: Розмір блоку читання, байт
+        directory: Директорія тимчасових файлів (за замовчуванням incoming_dir())
+
+    Returns:
+        StagedScan: Тимчасовий файл, SHA-256 і розмір
+
+    Raises:
+        ScanTooLargeError: Якщо файл більший за max_size
+    """
+    settings = get_settings()
+    max_size = settings.scan_max_size if max_size is None else max_size
+    chunk_size = chunk_size or settings.upload_chunk_size
+    directory = directory or incoming_dir()
+
+    # Starlette знає розмір multipart частини - відхиляємо ще до читання
+    if upload.size is not None and upload.size > max_size:
+        raise ScanTooLargeError(max_size)
+
+    suffix = Path(upload.filename or "").suffix.lower()
+    handle, temp_path = await run_in_threadpool(_open_temp_file, directory, suffix)
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        try:
+            while chunk := await upload.read(chunk_size):
+                size += len(chunk)
+                if size > max_size:
+                    raise ScanTooLargeError(max_size)
+                await run_in_threadpool(_write_chunk, handle, hasher, chunk)
+        finally:
+            await run_in_threadpool(handle.close)
+    except BaseException:
+        await run_in_threadpool(temp_path.unlink, missing_ok=True)
+        raise
+
+    return StagedScan(temp_path=temp_path, sha256=hasher.hexdigest(), size=size)
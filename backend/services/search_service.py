@@ -0,0 +1,149 @@
+"""Пошук документів і співробітників через FTS5 індекси.
+
+Рядок пошуку розбивається на слова, кожне шукається як префікс
+("іван" знаходить "Іванов", "ІВАНЕНКО"), слова об'єднуються через AND.
+Регістр кирилиці не враховується (див. backend.models.search).
+
+Якщо індексів немає (інша СУБД або SQLite без FTS5), пошук виконується
+як раніше через ILIKE.
+"""
+
+import re
+from typing import Iterable, TypeVar
+
+from sqlalchemy import Float, Integer, false, or_, select, text
+from sqlalchemy.orm import Session
+
+from backend.models.document import Document
+from backend.models.search import DOCUMENTS_FTS_TABLE, STAFF_FTS_TABLE
+from backend.models.staff import Staff
+
+QueryT = TypeVar("QueryT")
+
+# Колонки за замовчуванням для запасного пошуку через ILIKE
+DOCUMENT_FALLBACK_COLUMNS = ("custom_text", "editor_content")
+
+_WORD_RE = re.compile(r"\w+")
+
+# URL БД, у яких індекси вже знайдено
+_indexed_databases: set[str] = set()
+
+
+def fts_match_expression(query_text: str, columns: Iterable[str] | None = None) -> str | None:
+    """
+    Будує вираз MATCH з рядка пошуку користувача.
+
+    Args:
+        query_text: Рядок пошуку
+        columns: Колонки FTS таблиці (None - усі)
+
+    Returns:
+        str | None: Вираз або None, якщо в рядку немає жодного слова
+    """
+    words = _WORD_RE.findall(query_text)
+    if not words:
+        return None
+    terms = " ".join(f'"{word}"*' for word in words)
+    if columns:
+        return f"{{{' '.join(columns)}}} : ({terms})"
+    return terms
+
+
+def has_search_index(db: Session) -> bool:
+    """Чи є в БД FTS індекси (перевіряється один раз на БД)."""
+    bind = db.get_bind()
+    if bind.dialect.name != "sqlite":
+        return False
+    key = str(bind.url)
+    if key in _indexed_databases:
+        return True
+    found = db.execute(
+        text("SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name IN (:documents, :staff)"),
+        {"documents": DOCUMENTS_FTS_TABLE, "staff": STAFF_FTS_TABLE},
+    ).scalar() == 2
+    if found:
+        _indexed_databases.add(key)
+    return found
+
+
+def _fts_matches(fts_table: str, expression: str):
+    """Підзапит (id, score) рядків, що відповідають виразу; менший score - краще."""
+    return (
+        text(f"SELECT rowid AS id, bm25({fts_table}) AS score FROM {fts_table} WHERE {fts_table} MATCH :match")
+        .bindparams(match=expression)
+        .columns(id=Integer, score=Float)
+        .subquery()
+    )
+
+
+def _apply_search(
+    query: QueryT,
+    db: Session,
+    query_text: str,
+    model,
+    fts_table: str,
+    columns: Iterable[str] | None,
+    fallback_columns: Iterable[str],
+    ranked: bool,
+) -> QueryT:
+    if not has_search_index(db):
+        pattern = f"%{query_text}%"
+        return query.filter(or_(*(getattr(model, column).ilike(pattern) for column in fallback_columns)))
+
+    expression = fts_match_expression(query_text, columns)
+    if expression is None:
+        return query.filter(false())
+    matches = _fts_matches(fts_table, expression)
+    if ranked:
+        return query.join(matches, model.id == matches.c.id).order_by(matches.c.score)
+    return query.filter(model.id.in_(select(matches.c.id)))
+
+
+def apply_document_search(
+    query: QueryT,
+    db: Session,
+    query_text: str,
+    columns: Iterable[str] | None = None,
+    ranked: bool = False,
+) -> QueryT:
+    """
+    Фільтрує запит документів за повнотекстовим пошуком.
+
+    Args:
+        query: Query або Select по Document
+        db: Сесія БД
+        query_text: Рядок пошуку
+        columns: Колонки documents_fts (custom_text, editor_content, comments); None - усі
+        ranked: Сортувати за релевантністю (перед іншими сортуваннями)
+
+    Returns:
+        Запит з умовою пошуку
+    """
+    return _apply_search(
+        query, db, query_text, Document, DOCUMENTS_FTS_TABLE,
+        columns, DOCUMENT_FALLBACK_COLUMNS, ranked,
+    )
+
+
+def apply_staff_search(
+    query: QueryT,
+    db: Session,
+    query_text: str,
+    columns: Iterable[str] = ("pib_nom",),
+    ranked: bool = False,
+) -> QueryT:
+    """
+    Фільтрує запит співробітників за повнотекстовим пошуком.
+
+    Args:
+        query: Query або Select по Staff
+        db: Сесія БД
+        query_text: Рядок пошуку
+        columns: Колонки staff_fts (pib_nom, pib_dav, position)
+        ranked: Сортувати за релевантністю (перед іншими сортуваннями)
+
+    Returns:
+        Запит з умовою пошуку
+    """
+    columns = tuple(columns)
+    return _apply_search(query, db, query_text, Staff, STAFF_FTS_TABLE, columns, columns, ranked)
@@ -2,14 +2,26 @@
 
 Відстежує документи, статус яких не змінювався більше 1 дня,
 та управляє сповіщеннями про застарілі документи.
+
+Умова застарілості обчислюється в SQL за частковим індексом
+ix_documents_stale_age (лише документи в процесі, впорядковані за віком),
+тому список і лічильник не залежать від кількості оброблених документів,
+а сторінка читається з індексу без сортування. Лічильники сповіщень
+оновлюються одним UPDATE.
 """
 
 from datetime import datetime, timedelta
 from typing import Literal
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, select, update
+from sqlalchemy.orm import Query, Session
 
-from backend.models.document import Document
+from backend.models.document import (
+    STALE_MONITORED_STATUSES,
+    Document,
+    stale_age_reference,
+    stale_status_condition,
+)
 from shared.enums import DocumentStatus
 
 
@@ -20,15 +32,19 @@ class StaleDocumentService:
     MAX_NOTIFICATIONS = 3     # Notifications before requiring action
 
     # Statuses that should be monitored (exclude terminal states)
-    MONITORED_STATUSES = [
-        DocumentStatus.DRAFT,
-        DocumentStatus.SIGNED_BY_APPLICANT,
-        DocumentStatus.APPROVED_BY_DISPATCHER,
-        DocumentStatus.SIGNED_DEP_HEAD,
-        DocumentStatus.AGREED,
-        DocumentStatus.SIGNED_RECTOR,
-        DocumentStatus.SCANNED,
-    ]
+    MONITORED_STATUSES = list(STALE_MONITORED_STATUSES)
+
+    # Вікові групи списку застарілих документів: ключ -> (від, до) днів
+    AGE_BUCKETS = {
+        "1-3": (1, 3),
+        "3-7": (3, 7),
+        "7-30": (7, 30),
+        "30+": (30, None),
+    }
+
+    # Порядок списку: найдовше без руху першими (порядок ix_documents_stale_age)
+    AGE_REFERENCE = stale_age_reference()
+    SORT_KEY = ((AGE_REFERENCE, False), (Document.id, False))
 
     @classmethod
     def is_document_stale(cls, doc: Document) -> bool:
@@ -55,8 +71,72 @@ class StaleDocumentService:
         if not check_time:
             return False
 
-        threshold = datetime.now() - timedelta(days=cls.STALE_THRESHOLD_DAYS)
-        return check_time < threshold
+        return check_time < cls.stale_threshold()
+
+    @classmethod
+    def stale_threshold(cls) -> datetime:
+        """Документи, статус яких не змінювався з цього моменту, застарілі."""
+        return datetime.now() - timedelta(days=cls.STALE_THRESHOLD_DAYS)
+
+    @classmethod
+    def stale_filter(cls, threshold: datetime | None = None, since: datetime | None = None):
+        """
+        SQL умова застарілості (те саме, що is_document_stale).
+
+        Вік - status_changed_at, а для документів, статус яких ще не
+        змінювався, updated_at/created_at; умова читається діапазоном
+        з ix_documents_stale_age.
+
+        Args:
+            threshold: Межа застарілості (за замовчуванням stale_threshold())
+            since: Нижня межа часу останньої зміни (для вікових груп)
+        """
+        threshold = threshold or cls.stale_threshold()
+        conditions = [stale_status_condition(), cls.AGE_REFERENCE < threshold]
+        if since is not None:
+            conditions.append(cls.AGE_REFERENCE >= since)
+        return and_(*conditions)
+
+    @classmethod
+    def stale_query(
+        cls,
+        db: Session,
+        status: DocumentStatus | None = None,
+        staff_id: int | None = None,
+        age_bucket: str | None = None,
+    ) -> Query:
+        """
+        Запит застарілих документів з фільтрами (без сортування).
+
+        Args:
+            db: Сесія бази даних
+            status: Лише документи з цим статусом
+            staff_id: Лише документи працівника
+            age_bucket: Вікова група (ключ AGE_BUCKETS)
+
+        Returns:
+            Query: Запит для paginate() з SORT_KEY
+
+        Raises:
+            ValueError: Якщо вікова група невідома
+        """
+        threshold = cls.stale_threshold()
+        since = None
+        if age_bucket is not None:
+            if age_bucket not in cls.AGE_BUCKETS:
+                raise ValueError(f"Невідома вікова група: {age_bucket}")
+            min_days, max_days = cls.AGE_BUCKETS[age_bucket]
+            now = datetime.now()
+            threshold = min(threshold, now - timedelta(days=min_days))
+            if max_days is not None:
+                since = now - timedelta(days=max_days)
+
+        query = db.query(Document).filter(cls.stale_filter(threshold, since))
+        if status is not None:
+            query = query.filter(Document.status == status)
+        if staff_id is not None:
+            query = query.filter(Document.staff_id == staff_id)
+        return query
 
     @classmethod
     def get_stale_documents(cls, db: Session) -> list[Document]:
@@ -66,22 +146,7 @@ class StaleDocumentService:
         Returns documents where status hasn't changed for STALE_THRESHOLD_DAYS
         and are not in terminal status.
         """
-        threshold = datetime.now() - timedelta(days=cls.STALE_THRESHOLD_DAYS)
-
-        # Query documents in monitored statuses
-        query = db.query(Document).filter(
-            Document.status.in_(cls.MONITORED_STATUSES),
-            # We don't filter by explanation IS NULL anymore.
-        )
-
-        # Filter by status_changed_at or updated_at
-        stale_docs = []
-        for doc in query.all():
-            check_time = doc.status_changed_at or doc.updated_at or doc.created_at
-            if check_time and check_time < threshold:
-                stale_docs.append(doc)
-
-        return stale_docs
+        return db.query(Document).filter(cls.stale_filter()).order_by(Document.id).all()
 
     @classmethod
     def get_documents_requiring_action(cls, db: Session) -> list[Document]:
@@ -101,39 +166,59 @@ class StaleDocumentService:
         
         Returns summary of notifications sent.
         """
-        stale_docs = cls.get_stale_documents(db)
+        rows = db.execute(
+            select(
+                Document.id,
+                Document.staff_id,
+                Document.doc_type,
+                Document.status,
+                Document.stale_notification_count,
+                Document.stale_lock_count,
+            ).where(cls.stale_filter()).order_by(Document.id)
+        ).all()
         notified = []
         requires_action = []
 
-        for doc in stale_docs:
+        for row in rows:
             # Only increment if below MAX to prevent runaway counts (e.g. 10/3)
-            if doc.stale_notification_count < cls.MAX_NOTIFICATIONS:
-                doc.stale_notification_count += 1
-            
+            count = row.stale_notification_count
+            if count < cls.MAX_NOTIFICATIONS:
+                count += 1
+
             # If it reached MAX (or was already there), it requires action
-            if doc.stale_notification_count >= cls.MAX_NOTIFICATIONS:
+            if count >= cls.MAX_NOTIFICATIONS:
                 requires_action.append({
-                    "id": doc.id,
-                    "staff_id": doc.staff_id,
-                    "doc_type": doc.doc_type.value if doc.doc_type else None,
-                    "status": doc.status.value if doc.status else None,
-                    "notification_count": doc.stale_notification_count,
-                    "stale_lock_count": doc.stale_lock_count,
+                    "id": row.id,
+                    "staff_id": row.staff_id,
+                    "doc_type": row.doc_type.value if row.doc_type else None,
+                    "status": row.status.value if row.status else None,
+                    "notification_count": count,
+                    "stale_lock_count": row.stale_lock_count,
                 })
             else:
                 notified.append({
-                    "id": doc.id,
-                    "staff_id": doc.staff_id,
-                    "doc_type": doc.doc_type.value if doc.doc_type else None,
-                    "status": doc.status.value if doc.status else None,
-                    "notification_count": doc.stale_notification_count,
+                    "id": row.id,
+                    "staff_id": row.staff_id,
+                    "doc_type": row.doc_type.value if row.doc_type else None,
+                    "status": row.status.value if row.status else None,
+                    "notification_count": count,
                 })
 
+        if rows:
+            # Один UPDATE для всіх застарілих документів
+            db.execute(
+                update(Document)
+                .where(
+                    Document.id.in_([row.id for row in rows]),
+                    Document.stale_notification_count < cls.MAX_NOTIFICATIONS,
+                )
+                .values(stale_notification_count=Document.stale_notification_count + 1)
+            )
         db.commit()
 
         return {
             "checked_at": datetime.now().isoformat(),
-            "total_stale": len(stale_docs),
+            "total_stale": len(rows),
             "notified": notified,
             "requires_action": requires_action,
         }
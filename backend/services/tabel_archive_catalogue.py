@@ -0,0 +1,183 @@
+"""Каталог архівів табелів.
+
+Зберігає метадані архівів (місяць, рік, корекція, номер, погодження, час
+архівування) у файлі-маніфесті поруч з архівами, тому список архівів
+будується без читання самих архівів з raw_data. Для нових архівів (v2)
+метадані при переіндексації беруться із заголовка файлу.
+
+Маніфест записується атомарно (тимчасовий файл + os.replace). Архіви,
+додані, змінені чи видалені поза програмою (або іншим процесом), виявляються
+дешевим скануванням mtime/розміру файлів і переіндексуються.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from backend.services.archive_format import (
+    ARCHIVE_SUFFIX,
+    LEGACY_ARCHIVE_SUFFIX,
+    is_compact_archive,
+    read_archive_meta,
+)
+
+logger = logging.getLogger(__name__)
+
+# Ім'я маніфесту (не *.json, щоб не сприйматися як архів)
+CATALOGUE_FILENAME = "catalogue.index"
+CATALOGUE_VERSION = 1
+
+# Поля архіву, що зберігаються в каталозі
+CATALOGUE_FIELDS = (
+    "month",
+    "year",
+    "is_correction",
+    "correction_month",
+    "correction_year",
+    "correction_sequence",
+    "is_approved",
+    "archived_at",
+)
+
+_lock = threading.Lock()
+
+
+def _file_signature(stat: os.stat_result) -> list[int]:
+    """Відбиток файлу для виявлення змін: [mtime_ns, розмір]."""
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def catalogue_entry(archive_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Витягує метадані архіву для каталогу.
+
+    Args:
+        archive_data: Повні дані архіву
+
+    Returns:
+        dict: Метадані архіву
+
+    Raises:
+        KeyError: Якщо в архіві немає місяця або року
+    """
+    entry = {field: archive_data.get(field) for field in CATALOGUE_FIELDS}
+    entry["month"] = archive_data["month"]
+    entry["year"] = archive_data["year"]
+    entry["is_correction"] = bool(entry["is_correction"])
+    entry["is_approved"] = bool(entry["is_approved"])
+    return entry
+
+
+def _read_archive_metadata(path: Path) -> dict[str, Any]:
+    """Метадані архіву: заголовок для v2, повний JSON лише для старих архівів."""
+    if is_compact_archive(path):
+        return read_archive_meta(path)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_manifest(archive_dir: Path) -> dict[str, dict[str, Any]]:
+    """Читає маніфест; пошкоджений або застарілий маніфест ігнорується."""
+    try:
+        with open(archive_dir / CATALOGUE_FILENAME, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == CATALOGUE_VERSION:
+            return manifest.get("archives", {})
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, OSError, AttributeError) as e:
+        logger.warning(f"Archive catalogue is unreadable, rebuilding: {e}")
+    return {}
+
+
+def _write_manifest(archive_dir: Path, archives: dict[str, dict[str, Any]]) -> None:
+    """Атомарно записує маніфест."""
+    fd, tmp_path = tempfile.mkstemp(dir=archive_dir, prefix=".catalogue-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": CATALOGUE_VERSION, "archives": archives}, f, ensure_ascii=False)
+        os.replace(tmp_path, archive_dir / CATALOGUE_FILENAME)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def record_archive(archive_path: Path, archive_data: dict[str, Any]) -> None:
+    """
+    Додає або оновлює архів у каталозі (викликається після збереження архіву).
+
+    Args:
+        archive_path: Шлях до збереженого архіву
+        archive_data: Дані збереженого архіву
+    """
+    archive_dir = archive_path.parent
+    with _lock:
+        archives = _read_manifest(archive_dir)
+        archives[archive_path.name] = {
+            **catalogue_entry(archive_data),
+            "signature": _file_signature(archive_path.stat()),
+        }
+        _write_manifest(archive_dir, archives)
+
+
+def load_catalogue(archive_dir: Path) -> list[dict[str, Any]]:
+    """
+    Повертає метадані всіх архівів директорії.
+
+    Перевіряє лише mtime/розмір файлів; архіви читаються тільки якщо вони нові
+    або змінилися, після чого маніфест оновлюється.
+
+    Args:
+        archive_dir: Директорія з архівами
+
+    Returns:
+        list[dict]: Метадані архівів з ключем "path"
+    """
+    if not archive_dir.exists():
+        return []
+
+    with _lock:
+        archives = _read_manifest(archive_dir)
+        on_disk = {
+            entry.name: entry.stat()
+            for entry in os.scandir(archive_dir)
+            if entry.is_file()
+            and not entry.name.startswith(".")
+            and entry.name.endswith((ARCHIVE_SUFFIX, LEGACY_ARCHIVE_SUFFIX))
+        }
+
+        changed = False
+        for name in list(archives):
+            if name not in on_disk:
+                del archives[name]
+                changed = True
+
+        for name, stat in on_disk.items():
+            signature = _file_signature(stat)
+            cached = archives.get(name)
+            if cached is not None and cached.get("signature") == signature:
+                continue
+            try:
+                entry = catalogue_entry(_read_archive_metadata(archive_dir / name))
+            except (ValueError, KeyError, TypeError, OSError) as e:
+                logger.warning(f"Failed to read archive {archive_dir / name}: {e}")
+                # Remember the broken file so it is not re-read until it changes
+                entry = {"invalid": True}
+            archives[name] = {**entry, "signature": signature}
+            changed = True
+
+        if changed:
+            try:
+                _write_manifest(archive_dir, archives)
+            except OSError as e:
+                logger.warning(f"Failed to update archive catalogue: {e}")
+
+    return [
+        {**entry, "path": archive_dir / name}
+        for name, entry in archives.items()
+        if not entry.get("invalid")
+    ]
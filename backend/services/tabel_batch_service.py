@@ -0,0 +1,216 @@
+"""Пакетна генерація табелів (наприклад, закриття року: 12 місяців + корекції).
+
+Дані всіх табелів завантажуються в основному процесі через одну сесію БД
+(налаштування - один раз на пакет), а рендеринг сторінок розподіляється
+між процесами спільного ProcessPoolExecutor.
+
+Пул один на процес сервера (створюється при першому пакеті, зупиняється
+при завершенні додатку), тому паралельні пакети не множать процеси і не
+платять за їх запуск. Кількість сторінок "у польоті" обмежена, тому пакет
+не тримає в пам'яті контексти всіх сторінок одночасно.
+"""
+
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from typing import Any, NamedTuple
+
+from backend.core.database import get_db_context
+from backend.services.tabel_service import (
+    DEFAULT_EDRPOU_CODE,
+    DEFAULT_INSTITUTION_NAME,
+    PAGE_SEPARATOR_HTML,
+    iter_tabel_page_contexts,
+    load_tabel_settings,
+    render_tabel_page,
+)
+
+logger = logging.getLogger(__name__)
+
+# Максимальна кількість табелів в одному пакеті (рік основних + рік корекцій)
+MAX_BATCH_TARGETS = 24
+
+# Кількість процесів рендерингу за замовчуванням
+DEFAULT_MAX_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+
+# Скільки сторінок на один процес може чекати в черзі
+MAX_PENDING_PAGES_PER_WORKER = 2
+
+_render_pool: ProcessPoolExecutor | None = None
+_render_pool_lock = threading.Lock()
+
+
+class TabelTarget(NamedTuple):
+    """Табель у пакеті."""
+    month: int
+    year: int
+    is_correction: bool = False
+    correction_month: int | None = None
+    correction_year: int | None = None
+
+    @property
+    def label(self) -> str:
+        """Ключ табеля, наприклад "2025-03" або "2025-03/correction-2025-02"."""
+        label = f"{self.year:04d}-{self.month:02d}"
+        if self.is_correction:
+            # Без місяця/року корекції (некоректний запит) - лише позначка
+            if self.correction_year is None or self.correction_month is None:
+                return f"{label}/correction"
+            label += f"/correction-{self.correction_year:04d}-{self.correction_month:02d}"
+        return label
+
+
+@dataclass
+class TabelBatchResult:
+    """Результат генерації одного табеля пакета."""
+    target: TabelTarget
+    html: str | None = None
+    page_count: int = 0
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        """Перетворює результат у словник для API відповіді."""
+        return {
+            "key": self.target.label,
+            **self.target._asdict(),
+            "html": self.html,
+            "page_count": self.page_count,
+            "error": self.error,
+        }
+
+
+def _render_page_job(template_data: dict[str, Any], is_correction: bool) -> str:
+    """Точка входу процесу рендерингу (має бути на рівні модуля для pickle)."""
+    return render_tabel_page(template_data, is_correction)
+
+
+def _portable_context(template_data: dict[str, Any]) -> dict[str, Any]:
+    """Копія контексту сторінки без рядків матриці (не потрібні шаблону)."""
+    return {
+        **template_data,
+        "employees": [
+            {key: value for key, value in emp.items() if key != "month_row"}
+            for emp in template_data["employees"]
+        ],
+    }
+
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """Повертає спільний пул рендерингу (створюється при першому виклику)."""
+    global _render_pool
+    with _render_pool_lock:
+        # Пул, процес якого впав (BrokenProcessPool), більше не приймає задач
+        if _render_pool is None or getattr(_render_pool, "_broken", False):
+            if _render_pool is not None:
+                _render_pool.shutdown(wait=False, cancel_futures=True)
+            # spawn: дочірні процеси не успадковують з'єднання БД та потоки сервера
+            _render_pool = ProcessPoolExecutor(max_workers=DEFAULT_MAX_WORKERS, mp_context=get_context("spawn"))
+        return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """Зупиняє процеси пулу (при завершенні додатку)."""
+    global _render_pool
+    with _render_pool_lock:
+        pool, _render_pool = _render_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def generate_tabel_batch(
+    targets: list[TabelTarget],
+    institution_name: str = DEFAULT_INSTITUTION_NAME,
+    edrpou_code: str = DEFAULT_EDRPOU_CODE,
+    employees_per_page: int = 0,
+    max_workers: int | None = None,
+) -> dict[TabelTarget, TabelBatchResult]:
+    """
+    Генерує HTML кількох табелів з паралельним рендерингом сторінок.
+
+    Args:
+        targets: Табелі для генерації (дублікати ігноруються)
+        institution_name: Назва установи
+        edrpou_code: Код ЄДРПОУ
+        employees_per_page: Кількість працівників на сторінці (0 = без обмеження)
+        max_workers: Скільки процесів спільного пулу може зайняти пакет
+            (1 - рендеринг у поточному процесі)
+
+    Returns:
+        dict: TabelTarget -> TabelBatchResult у порядку targets
+
+    Raises:
+        ValueError: Якщо пакет порожній або перевищує MAX_BATCH_TARGETS
+    """
+    targets = list(dict.fromkeys(TabelTarget(*target) for target in targets))
+    if not targets:
+        raise ValueError("Пакет не містить жодного табеля")
+    if len(targets) > MAX_BATCH_TARGETS:
+        raise ValueError(f"Пакет не може містити більше {MAX_BATCH_TARGETS} табелів")
+
+    max_workers = DEFAULT_MAX_WORKERS if max_workers is None else max(1, max_workers)
+    results = {target: TabelBatchResult(target) for target in targets}
+    pages: dict[TabelTarget, list[str | None]] = {target: [] for target in targets}
+
+    executor = get_render_pool() if max_workers > 1 else None
+    max_pending = min(max_workers, DEFAULT_MAX_WORKERS) * MAX_PENDING_PAGES_PER_WORKER
+    pending: deque[tuple[TabelTarget, int, Future]] = deque()
+
+    def collect(target: TabelTarget, index: int, future: Future) -> None:
+        try:
+            pages[target][index] = future.result()
+        except Exception as e:
+            logger.exception(f"Error rendering tabel page {target.label} #{index + 1}")
+            results[target].error = str(e)
+
+    logger.info(f"Starting tabel batch: {len(targets)} targets, {max_workers} workers")
+    try:
+        with get_db_context() as db:
+            tabel_settings = load_tabel_settings(db)
+            for target in targets:
+                try:
+                    page_contexts = iter_tabel_page_contexts(
+                        month=target.month,
+                        year=target.year,
+                        institution_name=institution_name,
+                        edrpou_code=edrpou_code,
+                        employees_per_page=employees_per_page,
+                        is_correction=target.is_correction,
+                        correction_month=target.correction_month,
+                        correction_year=target.correction_year,
+                        db=db,
+                        tabel_settings=tabel_settings,
+                    )
+                    for index, template_data in enumerate(page_contexts):
+                        pages[target].append(None)
+                        if executor is None:
+                            pages[target][index] = render_tabel_page(template_data, target.is_correction)
+                            continue
+                        future = executor.submit(
+                            _render_page_job, _portable_context(template_data), target.is_correction,
+                        )
+                        pending.append((target, index, future))
+                        # Bound memory: wait for the oldest page before queueing more
+                        while len(pending) >= max_pending:
+                            collect(*pending.popleft())
+                except Exception as e:
+                    logger.exception(f"Error generating tabel {target.label}")
+                    results[target].error = str(e)
+                    db.rollback()
+
+        while pending:
+            collect(*pending.popleft())
+    finally:
+        # Пул спільний: скасовуються лише сторінки цього пакета
+        for _, _, future in pending:
+            future.cancel()
+
+    for target, result in results.items():
+        if result.error is None:
+            result.html = PAGE_SEPARATOR_HTML.join(pages[target])
+            result.page_count = len(pages[target])
+
+    return results
@@ -0,0 +1,165 @@
+"""Кеш обчислених рядків табеля по працівниках.
+
+Зберігає EmployeeData за ключем (staff_id, місяць, рік, режим корекції),
+тому повторна генерація табеля перераховує лише тих працівників, чиї дані
+змінилися.
+
+Інвалідація:
+- SQLAlchemy події after_flush для Attendance, Document (відпустки), Staff
+  та ключів SystemSettings, що впливають на табель (у межах процесу);
+- відбиток вихідних даних (кількість та час оновлення записів), який
+  перевіряється при кожному читанні, тому зміни з іншого процесу
+  (desktop та API сервер працюють окремо) теж виявляються.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from backend.models import Attendance, Document, DocumentType, Staff, SystemSettings
+
+logger = logging.getLogger(__name__)
+
+# Максимальна кількість рядків у кеші (LRU)
+DEFAULT_MAX_ENTRIES = 10000
+
+# Типи документів, що потрапляють у табель
+TABEL_DOCUMENT_TYPES = (DocumentType.VACATION_PAID, DocumentType.VACATION_UNPAID)
+
+# Ключі налаштувань, зміна яких скидає весь кеш
+TABEL_CACHE_SETTINGS_KEYS = frozenset({
+    "tabel_hours_calc_positions",
+    "tabel_work_hours_per_day",
+    "tabel_limit_hours_calc",
+})
+
+
+class TabelCacheKey(NamedTuple):
+    """Ключ рядка табеля в кеші."""
+    staff_id: int
+    month: int
+    year: int
+    is_correction: bool
+    correction_month: int | None
+    correction_year: int | None
+
+
+class TabelEmployeeCache:
+    """
+    Потокобезпечний LRU кеш EmployeeData по працівниках.
+
+    Кожен запис зберігається разом з відбитком вихідних даних; get()
+    повертає запис лише якщо відбиток збігається з поточним.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._entries: OrderedDict[TabelCacheKey, tuple[Hashable, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: TabelCacheKey, fingerprint: Hashable) -> Any | None:
+        """Повертає збережений рядок або None, якщо його немає чи він застарів."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != fingerprint:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: TabelCacheKey, fingerprint: Hashable, value: Any) -> None:
+        """Зберігає рядок разом з відбитком вихідних даних."""
+        with self._lock:
+            self._entries[key] = (fingerprint, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_staff(self, staff_ids: set[int]) -> None:
+        """Видаляє всі рядки вказаних працівників (усі місяці та режими)."""
+        if not staff_ids:
+            return
+        with self._lock:
+            for key in [k for k in self._entries if k.staff_id in staff_ids]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Повністю очищає кеш."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Кеш процесу
+tabel_employee_cache = TabelEmployeeCache()
+
+
+def _loaded_value(obj: Any, attr: str) -> Any:
+    """Значення атрибута без звернення до БД (для видалених/прострочених об'єктів)."""
+    state = inspect(obj)
+    if attr in state.dict:
+        return state.dict[attr]
+    return state.committed_state.get(attr)
+
+
+def _affected_staff_ids(session: Session) -> tuple[set[int], bool]:
+    """
+    Визначає працівників, чиї рядки табеля змінилися у сесії.
+
+    Returns:
+        tuple: (staff_ids, чи треба скинути весь кеш)
+    """
+    staff_ids: set[int] = set()
+    invalidate_all = False
+
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, (Attendance, Document)):
+            if isinstance(obj, Document):
+                # Also catch documents whose type changed away from a vacation
+                history = inspect(obj).attrs.doc_type.history
+                doc_types = {_loaded_value(obj, "doc_type"), *(history.deleted or ())}
+                if not doc_types & set(TABEL_DOCUMENT_TYPES) and None not in doc_types:
+                    continue
+            staff_id = _loaded_value(obj, "staff_id")
+            if staff_id is None:
+                invalidate_all = True
+            else:
+                staff_ids.add(staff_id)
+        elif isinstance(obj, Staff):
+            staff_id = _loaded_value(obj, "id")
+            if staff_id is not None:
+                staff_ids.add(staff_id)
+        elif isinstance(obj, SystemSettings):
+            if _loaded_value(obj, "key") in TABEL_CACHE_SETTINGS_KEYS:
+                invalidate_all = True
+
+    return staff_ids, invalidate_all
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_after_flush(session: Session, flush_context) -> None:
+    """Скидає рядки табеля працівників, змінених у цьому flush."""
+    staff_ids, invalidate_all = _affected_staff_ids(session)
+    if invalidate_all:
+        tabel_employee_cache.clear()
+    elif staff_ids:
+        tabel_employee_cache.invalidate_staff(staff_ids)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_on_bulk_write(orm_execute_state) -> None:
+    """Bulk UPDATE/DELETE обходять flush, тому скидають весь кеш."""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in (Attendance, Document, Staff, SystemSettings):
+        tabel_employee_cache.clear()
@@ -0,0 +1,438 @@
+"""Рушій класифікації днів табеля.
+
+Розфарбовує діапазони відвідуваності та відпусток працівника у масив
+із 31 слоту за один прохід. Статуси днів, кількість робочих днів по
+половинах місяця, надурочні години та підсумки відсутностей виводяться
+з цього масиву, тому вартість становить O(днів + записів), а не
+O(днів × записів).
+
+Для всього підрозділу рядки збираються у матрицю працівник × день
+(DepartmentMonthMatrix) з малими цілими кодами та годинами у NumPy
+масивах; підсумки працівників, половин місяця, стовпців днів та сторінок
+обчислюються векторними редукціями.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Iterable
+
+import numpy as np
+
+from backend.models import ATTENDANCE_CODES, Attendance, Document, DocumentStatus, DocumentType, WEEKEND_DAYS
+
+# Максимальна кількість днів у місяці (ширина сітки табеля)
+MAX_MONTH_DAYS = 31
+
+# Останній день першої половини місяця
+FIRST_HALF_DAYS = 15
+
+# Код робочого дня
+WORK_DAY_CODE = "Р"
+
+# Код відвідуваності -> поле AbsenceTotals (без суфікса половини місяця)
+ABSENCE_CODE_FIELDS = {
+    "В": "vacation_8_10", "Д": "vacation_8_10",  # Відпустки оплачувані (щорічна основна та додаткова)
+    "Ч": "vacation_11_15", "ТВ": "vacation_11_15", "Н": "vacation_11_15",  # Інші оплачувані відпустки
+    "ДО": "vacation_11_15", "ВП": "vacation_11_15",
+    "ДД": "vacation_18",  # Догляд за дитиною до 6 років
+    "НБ": "vacation_19", "ДБ": "vacation_19", "НА": "vacation_19", "БЗ": "vacation_19",  # Без збереження
+    "ВД": "business_trip",  # Відрядження
+    "РС": "part_time", "НД": "part_time",  # Неповний робочий день
+    "НП": "temp_transfer",  # Тимчасовий перевод на інше підприємство
+    "П": "idle",  # Простої
+    "ПР": "absenteeism",  # Прогули
+    "С": "strike",  # Страйк
+    "ТН": "temp_disability", "НН": "temp_disability",  # Тимчасова непрацездатність
+    "НЗ": "unexcused", "ІВ": "unexcused", "І": "unexcused", "ІН": "unexcused",  # Неявки різних типів
+}
+
+# Тип документа відпустки -> код дня у табелі
+VACATION_DOC_CODES = {
+    DocumentType.VACATION_PAID: "В",  # Оплачувана відпустка
+    DocumentType.VACATION_UNPAID: "НА",  # Відпустка без збереження зарплати за згодою
+}
+
+# Тип документа відпустки -> поле AbsenceTotals
+VACATION_DOC_FIELDS = {
+    DocumentType.VACATION_PAID: "vacation_8_10",
+    DocumentType.VACATION_UNPAID: "vacation_19",
+}
+
+# Код відвідуваності з годинами -> назва підсумку (надурочні, нічні, вечірні, вихідні)
+OVERTIME_CODE_FIELDS = {
+    "НУ": "overtime",
+    "РН": "night",
+    "ВЧ": "evening",
+    "РВ": "weekend",
+}
+
+
+# Поля AbsenceTotals (без суфікса половини місяця) у порядку стовпців матриці
+ABSENCE_FIELDS = (
+    "vacation_8_10",
+    "vacation_11_15",
+    "vacation_18",
+    "vacation_19",
+    "business_trip",
+    "part_time",
+    "temp_transfer",
+    "idle",
+    "absenteeism",
+    "strike",
+    "temp_disability",
+    "unexcused",
+)
+
+# Словник кодів матриці: індекс 0 - порожній день
+DAY_CODE_VOCABULARY = ("", WORK_DAY_CODE) + tuple(
+    code for code in ATTENDANCE_CODES if code != WORK_DAY_CODE
+)
+DAY_CODE_INDEX = {code: i for i, code in enumerate(DAY_CODE_VOCABULARY)}
+
+# Індекс для кодів поза словником (непорожній день)
+OTHER_CODE_INDEX = 255
+
+# Індекси кодів НУ/РН/ВЧ/РВ у порядку OVERTIME_CODE_FIELDS
+OVERTIME_CODE_INDEXES = tuple(DAY_CODE_INDEX[code] for code in OVERTIME_CODE_FIELDS)
+
+
+@dataclass
+class MonthGrid:
+    """Класифікація днів місяця для одного працівника (31 слот)."""
+    days_in_month: int
+    codes: list[str] = field(default_factory=lambda: [""] * MAX_MONTH_DAYS)
+    hours: list[float] = field(default_factory=lambda: [0.0] * MAX_MONTH_DAYS)
+    from_attendance: list[bool] = field(default_factory=lambda: [False] * MAX_MONTH_DAYS)
+    weekend: list[bool] = field(default_factory=lambda: [False] * MAX_MONTH_DAYS)
+    disabled: list[bool] = field(default_factory=lambda: [False] * MAX_MONTH_DAYS)
+    strikethrough: list[bool] = field(default_factory=lambda: [False] * MAX_MONTH_DAYS)
+    absence: dict[str, int] = field(default_factory=dict)  # Поля AbsenceTotals з суфіксами _1/_2
+
+    def work_days(self) -> tuple[int, int]:
+        """Кількість робочих днів ("Р") у першій та другій половині місяця."""
+        first = sum(1 for code in self.codes[:FIRST_HALF_DAYS] if code == WORK_DAY_CODE)
+        second = sum(1 for code in self.codes[FIRST_HALF_DAYS:self.days_in_month] if code == WORK_DAY_CODE)
+        return first, second
+
+    def overtime_totals(self) -> dict[str, float]:
+        """Суми годин для НУ/РН/ВЧ/РВ по половинах місяця (first_half_*/second_half_*)."""
+        totals = {
+            f"{half}_{name}": 0
+            for half in ("first_half", "second_half")
+            for name in OVERTIME_CODE_FIELDS.values()
+        }
+        for i in range(self.days_in_month):
+            name = OVERTIME_CODE_FIELDS.get(self.codes[i])
+            if name:
+                half = "first_half" if i < FIRST_HALF_DAYS else "second_half"
+                totals[f"{half}_{name}"] += self.hours[i]
+        return totals
+
+
+def _find_free(parent: list[int], i: int) -> int:
+    """Повертає перший вільний слот >= i (union-find зі стисненням шляху)."""
+    root = i
+    while parent[root] != root:
+        root = parent[root]
+    while parent[i] != root:
+        parent[i], i = root, parent[i]
+    return root
+
+
+def _clip_range(start: date, end: date, month_start: date, days_in_month: int) -> tuple[int, int]:
+    """Обрізає діапазон дат до місяця і повертає індекси слотів (включно)."""
+    return max((start - month_start).days, 0), min((end - month_start).days, days_in_month - 1)
+
+
+def classify_month(
+    month_start: date,
+    days_in_month: int,
+    term_start: date,
+    term_end: date,
+    attendance_records: Iterable[Attendance],
+    vacations: Iterable[Document],
+    weekends: set[int] = WEEKEND_DAYS,
+    is_correction: bool = False,
+    is_new_employee: bool = False,
+) -> MonthGrid:
+    """
+    Класифікує всі дні місяця для працівника за один прохід.
+
+    Пріоритети (як у tabel_service.get_day_status):
+    - Дні поза контрактом: порожні, закреслені (у корегуючому - лише до початку)
+    - Записи відвідуваності: перший запис, що покриває день
+    - Вихідні дні: порожньо
+    - Відпустки з документів: "В" / "НА"
+    - Інші дні: "Р" (у корегуючому - лише для нових працівників)
+
+    Кожен слот фарбується щонайбільше один раз: зайняті слоти пропускаються
+    через union-find, тому вартість O(днів + записів).
+
+    Args:
+        month_start: Перший день місяця
+        days_in_month: Кількість днів у місяці
+        term_start: Початок контракту
+        term_end: Кінець контракту
+        attendance_records: Записи відвідуваності (у порядку пріоритету)
+        vacations: Документи відпусток (у порядку пріоритету)
+        weekends: Множина вихідних днів тижня
+        is_correction: True якщо це корегуючий табель
+        is_new_employee: True для нового працівника в корегуючому табелі
+
+    Returns:
+        MonthGrid: Класифікація днів
+    """
+    attendance_records = list(attendance_records)
+    vacations = list(vacations)
+    grid = MonthGrid(days_in_month=days_in_month)
+    n = days_in_month
+
+    # Contract bounds (correction mode only strikes through days BEFORE contract start)
+    first_active = max((term_start - month_start).days, 0)
+    last_active = n - 1 if is_correction else min((term_end - month_start).days, n - 1)
+    strike_disabled = is_new_employee if is_correction else True
+
+    first_weekday = month_start.weekday()
+    attendance_parent = list(range(n + 1))
+    for i in range(n):
+        if i < first_active or i > last_active:
+            grid.disabled[i] = True
+            grid.strikethrough[i] = strike_disabled
+            attendance_parent[i] = i + 1
+        elif (first_weekday + i) % 7 in weekends:
+            grid.weekend[i] = True
+
+    # Attendance pass: first record covering a day wins
+    for record in attendance_records:
+        start, end = _clip_range(record.date, record.date_end or record.date, month_start, n)
+        if start > end:
+            continue
+        hours_val = float(record.hours) if record.hours else 0
+        i = _find_free(attendance_parent, start)
+        while i <= end:
+            grid.codes[i] = record.code
+            grid.hours[i] = hours_val
+            grid.from_attendance[i] = True
+            attendance_parent[i] = i + 1
+            i = _find_free(attendance_parent, i + 1)
+
+    # Vacation pass: only free working days (not weekends, not attendance)
+    vacation_parent = [i + 1 if grid.weekend[i] else j for i, j in enumerate(attendance_parent[:n])] + [n]
+    for vacation in vacations:
+        code = VACATION_DOC_CODES.get(vacation.doc_type)
+        if code is None:
+            continue
+        start, end = _clip_range(vacation.date_start, vacation.date_end, month_start, n)
+        if start > end:
+            continue
+        i = _find_free(vacation_parent, start)
+        while i <= end:
+            grid.codes[i] = code
+            vacation_parent[i] = i + 1
+            i = _find_free(vacation_parent, i + 1)
+
+    # Remaining working days
+    default_code = WORK_DAY_CODE if (not is_correction or is_new_employee) else ""
+    i = _find_free(vacation_parent, 0)
+    while i < n:
+        grid.codes[i] = default_code
+        vacation_parent[i] = i + 1
+        i = _find_free(vacation_parent, i + 1)
+
+    grid.absence = count_absence_days(
+        attendance_records, vacations, month_start, month_start.replace(day=n)
+    )
+    return grid
+
+
+def count_absence_days(
+    attendance_records: Iterable[Attendance],
+    vacations: Iterable[Document],
+    month_start: date,
+    month_end: date,
+) -> dict[str, int]:
+    """
+    Рахує календарні дні відсутностей по половинах місяця.
+
+    Кожен запис додає +1/-1 у різницевий масив свого поля, префіксна сума
+    дає покриття по днях. Семантика збігається з попереднім поденним
+    підрахунком: враховуються всі дні запису в межах місяця, включно з
+    вихідними та перекриттями.
+
+    Args:
+        attendance_records: Записи відвідуваності
+        vacations: Документи відпусток (враховуються лише оброблені)
+        month_start: Початок місяця
+        month_end: Кінець місяця
+
+    Returns:
+        dict: {"<поле>_1": днів, "<поле>_2": днів} лише для ненульових полів
+    """
+    n = (month_end - month_start).days + 1
+    diffs: dict[str, list[int]] = {}
+
+    def add_range(field_base: str, start: date, end: date) -> None:
+        first, last = _clip_range(start, end, month_start, n)
+        if first > last:
+            return
+        diff = diffs.setdefault(field_base, [0] * (n + 1))
+        diff[first] += 1
+        diff[last + 1] -= 1
+
+    for record in attendance_records:
+        field_base = ABSENCE_CODE_FIELDS.get(record.code)
+        if field_base:
+            add_range(field_base, record.date, record.date_end or record.date)
+
+    for vacation in vacations:
+        field_base = VACATION_DOC_FIELDS.get(vacation.doc_type)
+        if field_base and vacation.status == DocumentStatus.PROCESSED:
+            add_range(field_base, vacation.date_start, vacation.date_end or vacation.date_start)
+
+    counts: dict[str, int] = {}
+    for field_base, diff in diffs.items():
+        running = first_half = second_half = 0
+        for i in range(n):
+            running += diff[i]
+            if i < FIRST_HALF_DAYS:
+                first_half += running
+            else:
+                second_half += running
+        counts[f"{field_base}_1"] = first_half
+        counts[f"{field_base}_2"] = second_half
+    return counts
+
+
+def encode_day_codes(codes: list[str]) -> np.ndarray:
+    """Перетворює літерні коди днів на масив малих цілих кодів (uint8)."""
+    return np.fromiter(
+        (DAY_CODE_INDEX.get(code, OTHER_CODE_INDEX) for code in codes),
+        dtype=np.uint8,
+        count=len(codes),
+    )
+
+
+@dataclass
+class EmployeeMonthRow:
+    """Числовий рядок матриці місяця для одного працівника."""
+    codes: np.ndarray  # (31,) uint8 - коди днів
+    hours: np.ndarray  # (31,) float64 - години з відвідуваності
+    absence: np.ndarray  # (len(ABSENCE_FIELDS), 2) int32 - відсутності по половинах
+    work_minutes: int = 0  # Хвилини роботи за місяць (0 якщо години не рахуються)
+
+    @classmethod
+    def from_grid(cls, grid: MonthGrid, work_minutes: int = 0) -> "EmployeeMonthRow":
+        """Будує рядок з класифікації місяця."""
+        absence = np.array(
+            [
+                (grid.absence.get(f"{name}_1", 0), grid.absence.get(f"{name}_2", 0))
+                for name in ABSENCE_FIELDS
+            ],
+            dtype=np.int32,
+        )
+        return cls(
+            codes=encode_day_codes(grid.codes),
+            hours=np.asarray(grid.hours, dtype=np.float64),
+            absence=absence,
+            work_minutes=work_minutes,
+        )
+
+
+@dataclass
+class DepartmentMonthMatrix:
+    """Матриця працівник × день для підрозділу за місяць."""
+    days_in_month: int
+    codes: np.ndarray  # (S, 31) uint8
+    hours: np.ndarray  # (S, 31) float64
+    absence: np.ndarray  # (S, len(ABSENCE_FIELDS), 2) int32
+    work_minutes: np.ndarray  # (S,) int64
+
+    @classmethod
+    def from_rows(cls, rows: list[EmployeeMonthRow], days_in_month: int) -> "DepartmentMonthMatrix":
+        """Збирає матрицю з рядків працівників."""
+        if not rows:
+            return cls(
+                days_in_month=days_in_month,
+                codes=np.zeros((0, MAX_MONTH_DAYS), dtype=np.uint8),
+                hours=np.zeros((0, MAX_MONTH_DAYS), dtype=np.float64),
+                absence=np.zeros((0, len(ABSENCE_FIELDS), 2), dtype=np.int32),
+                work_minutes=np.zeros(0, dtype=np.int64),
+            )
+        return cls(
+            days_in_month=days_in_month,
+            codes=np.stack([row.codes for row in rows]),
+            hours=np.stack([row.hours for row in rows]),
+            absence=np.stack([row.absence for row in rows]),
+            work_minutes=np.fromiter((row.work_minutes for row in rows), dtype=np.int64, count=len(rows)),
+        )
+
+    def __len__(self) -> int:
+        return self.codes.shape[0]
+
+    def slice(self, start: int, stop: int) -> "DepartmentMonthMatrix":
+        """Підматриця для сторінки (без копіювання)."""
+        return DepartmentMonthMatrix(
+            days_in_month=self.days_in_month,
+            codes=self.codes[start:stop],
+            hours=self.hours[start:stop],
+            absence=self.absence[start:stop],
+            work_minutes=self.work_minutes[start:stop],
+        )
+
+    def _half_sums(self, values: np.ndarray) -> np.ndarray:
+        """Суми по першій та другій половині місяця для кожного рядка -> (S, 2)."""
+        return np.stack(
+            [
+                values[:, :FIRST_HALF_DAYS].sum(axis=1),
+                values[:, FIRST_HALF_DAYS:self.days_in_month].sum(axis=1),
+            ],
+            axis=1,
+        )
+
+    def work_days(self) -> np.ndarray:
+        """Кількість робочих днів ("Р") по половинах місяця -> (S, 2)."""
+        return self._half_sums(self.codes == DAY_CODE_INDEX[WORK_DAY_CODE])
+
+    def overtime_hours(self) -> np.ndarray:
+        """Години НУ/РН/ВЧ/РВ по половинах місяця -> (S, 4, 2)."""
+        return np.stack(
+            [
+                self._half_sums(np.where(self.codes == code_index, self.hours, 0.0))
+                for code_index in OVERTIME_CODE_INDEXES
+            ],
+            axis=1,
+        )
+
+    def day_counts(self) -> np.ndarray:
+        """Кількість непорожніх днів у кожному стовпці -> (31,)."""
+        return np.count_nonzero(self.codes, axis=0)
+
+    def active_days(self) -> np.ndarray:
+        """Індекси днів місяця, що мають хоча б один непорожній код."""
+        return np.flatnonzero(self.day_counts()[:self.days_in_month])
+
+    def totals(self) -> dict:
+        """
+        Підсумки по всіх рядках матриці (для сторінки або табеля).
+
+        Returns:
+            dict: work_days, work_minutes, days, absence ({поле_1/_2: int}),
+                overtime/night/evening/weekend (суми цілих годин по половинах)
+        """
+        # Overtime totals count whole hours per employee and half, as printed in rows
+        overtime = np.trunc(self.overtime_hours()).sum(axis=(0, 2))
+        absence = self.absence.sum(axis=0)
+        absence_totals = {}
+        for i, name in enumerate(ABSENCE_FIELDS):
+            absence_totals[f"{name}_1"] = int(absence[i, 0])
+            absence_totals[f"{name}_2"] = int(absence[i, 1])
+
+        totals = {
+            "work_days": int(self.work_days().sum()),
+            "work_minutes": int(self.work_minutes.sum()),
+            "days": self.day_counts().tolist(),
+            "absence": absence_totals,
+        }
+        for i, name in enumerate(OVERTIME_CODE_FIELDS.values()):
+            totals[name] = int(overtime[i])
+        return totals
@@ -0,0 +1,202 @@
+"""Незмінний кеш відрендерених архівних табелів.
+
+Архів погодженого табеля більше не змінюється, тому його HTML і PDF
+кешуються на диску за ключем "хеш архіву + версія шаблонів" (обидва
+заповнюються при погодженні). Експорт PDF погодженого місяця (desktop,
+задача tabel_pdf) бере готовий файл з кешу.
+Відкриття історичного табеля - це читання файлу; ключ також
+використовується як ETag.
+
+Зміна файлу архіву або шаблонів дає новий ключ, тому старі записи ніколи
+не повертаються застарілими (їх можна просто видалити).
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+from backend.services.archive_format import is_compact_archive, read_archive, read_archive_meta
+from backend.services.template_registry import DESKTOP_TEMPLATES_DIR
+
+logger = logging.getLogger(__name__)
+
+# Піддиректорія кешу поруч з архівами (tabel/archive/render_cache)
+RENDER_CACHE_DIRNAME = "render_cache"
+
+# Збільшується при зміні логіки reconstruct_tabel_html_from_archive
+RENDER_CACHE_VERSION = 1
+
+# Шаблони, від яких залежить HTML архівного табеля
+RENDER_TEMPLATE_FILES = (
+    DESKTOP_TEMPLATES_DIR / "tabel" / "tabel_template.html",
+    DESKTOP_TEMPLATES_DIR / "tabel_corection" / "tabel_template.html",
+)
+
+# Розмір блоку при хешуванні архіву
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# (шлях, mtime_ns, розмір) -> хеш архіву
+_archive_hashes: dict[tuple[str, int, int], str] = {}
+_hash_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def template_version() -> str:
+    """Версія шаблонів: хеш вмісту файлів шаблонів і RENDER_CACHE_VERSION."""
+    digest = hashlib.sha256(f"render-cache-v{RENDER_CACHE_VERSION}".encode())
+    for path in RENDER_TEMPLATE_FILES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def archive_hash(archive_path: Path) -> str:
+    """
+    Хеш вмісту архіву (запам'ятовується за mtime/розміром файлу).
+
+    Args:
+        archive_path: Шлях до архіву
+
+    Returns:
+        str: SHA-256 у hex
+    """
+    stat = archive_path.stat()
+    memo_key = (str(archive_path), stat.st_mtime_ns, stat.st_size)
+    with _hash_lock:
+        cached = _archive_hashes.get(memo_key)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    with open(archive_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    value = digest.hexdigest()
+    with _hash_lock:
+        _archive_hashes[memo_key] = value
+    return value
+
+
+def render_cache_key(archive_path: Path) -> str:
+    """Ключ кешу (та ETag): хеш архіву + версія шаблонів."""
+    return f"{archive_hash(archive_path)}-{template_version()}"
+
+
+def _cache_path(archive_path: Path, key: str, suffix: str, cache_dir: Path | None) -> Path:
+    return (cache_dir or archive_path.parent / RENDER_CACHE_DIRNAME) / f"{key}{suffix}"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Записує файл кешу через тимчасовий файл."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def get_cached_tabel_html(archive_path: Path, cache_dir: Path | None = None) -> tuple[str, str]:
+    """
+    Повертає HTML архівного табеля з кешу, рендерить його лише при першому зверненні.
+
+    Args:
+        archive_path: Шлях до архіву
+        cache_dir: Директорія кешу (за замовчуванням render_cache поруч з архівом)
+
+    Returns:
+        tuple: (html, etag)
+    """
+    from backend.services.tabel_service import reconstruct_tabel_html_from_archive
+
+    key = render_cache_key(archive_path)
+    path = _cache_path(archive_path, key, ".html", cache_dir)
+    try:
+        return path.read_text(encoding="utf-8"), key
+    except FileNotFoundError:
+        pass
+
+    html = reconstruct_tabel_html_from_archive(read_archive(archive_path))
+    try:
+        _write_atomic(path, html.encode("utf-8"))
+    except OSError as e:
+        logger.warning(f"Failed to write tabel render cache {path}: {e}")
+    return html, key
+
+
+def warm_tabel_render_cache(archive_path: Path, cache_dir: Path | None = None) -> str:
+    """
+    Заповнює кеш HTML і PDF для щойно збереженого погодженого архіву.
+
+    Помилка рендерингу PDF (наприклад, WeasyPrint недоступний) не заважає
+    кешу HTML - PDF буде відрендерено при першому експорті.
+
+    Returns:
+        str: Ключ кешу (ETag)
+    """
+    _, key = get_cached_tabel_html(archive_path, cache_dir)
+    try:
+        get_tabel_pdf_path(archive_path, cache_dir)
+    except Exception as e:
+        logger.warning(f"Failed to render cached tabel PDF for {archive_path}: {e}")
+    return key
+
+
+def get_cached_tabel_pdf(archive_path: Path, cache_dir: Path | None = None) -> bytes | None:
+    """Повертає збережений PDF архівного табеля або None."""
+    path = _cache_path(archive_path, render_cache_key(archive_path), ".pdf", cache_dir)
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def store_tabel_pdf(archive_path: Path, pdf_bytes: bytes, cache_dir: Path | None = None) -> Path:
+    """
+    Зберігає PDF архівного табеля в кеші.
+
+    Args:
+        archive_path: Шлях до архіву
+        pdf_bytes: Вміст PDF
+        cache_dir: Директорія кешу
+
+    Returns:
+        Path: Шлях до файлу кешу
+    """
+    path = _cache_path(archive_path, render_cache_key(archive_path), ".pdf", cache_dir)
+    _write_atomic(path, pdf_bytes)
+    return path
+
+
+def _is_correction_archive(archive_path: Path) -> bool:
+    if is_compact_archive(archive_path):
+        return bool(read_archive_meta(archive_path).get("is_correction"))
+    return bool(read_archive(archive_path).get("is_correction"))
+
+
+def get_tabel_pdf_path(archive_path: Path, cache_dir: Path | None = None) -> Path:
+    """
+    Повертає PDF архівного табеля з кешу, рендерить його лише при першому зверненні.
+
+    Args:
+        archive_path: Шлях до архіву
+        cache_dir: Директорія кешу
+
+    Returns:
+        Path: Файл PDF у кеші (без титульної сторінки)
+
+    Raises:
+        DocumentGenerationError: Якщо рендеринг PDF не вдався
+    """
+    from backend.services.pdf_renderer import render_pdf
+    from backend.services.tabel_service import _wrap_tabel_html_for_pdf
+
+    path = _cache_path(archive_path, render_cache_key(archive_path), ".pdf", cache_dir)
+    if path.exists():
+        return path
+
+    html, _ = get_cached_tabel_html(archive_path, cache_dir)
+    # sheet.css підключається відносно директорії шаблону
+    template_dir = DESKTOP_TEMPLATES_DIR / ("tabel_corection" if _is_correction_archive(archive_path) else "tabel")
+    pdf_bytes = render_pdf(_wrap_tabel_html_for_pdf(html), base_url=template_dir.as_uri())
+    return store_tabel_pdf(archive_path, pdf_bytes, cache_dir)
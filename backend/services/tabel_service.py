@@ -1,21 +1,23 @@
 """Сервіс для генерації табеля обліку робочого часу."""
 
 import calendar
-import decimal
+import hashlib
 import logging
 import os
 import shutil
 import subprocess
 import tempfile
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
-from jinja2 import Environment, FileSystemLoader
+import numpy as np
+from jinja2 import Environment
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func, or_
 
 from backend.core.database import get_db_context
 from backend.models import (
@@ -30,6 +32,32 @@ from backend.models import (
     WorkScheduleType,
 )
 
+from backend.services.tabel_engine import (
+    ABSENCE_FIELDS,
+    MAX_MONTH_DAYS,
+    OVERTIME_CODE_FIELDS,
+    WORK_DAY_CODE,
+    DepartmentMonthMatrix,
+    EmployeeMonthRow,
+    MonthGrid,
+    classify_month,
+    count_absence_days,
+    encode_day_codes,
+)
+from backend.services.archive_format import (
+    ARCHIVE_SUFFIX,
+    LEGACY_ARCHIVE_SUFFIX,
+    read_archive,
+    write_archive,
+)
+from backend.services.tabel_archive_catalogue import catalogue_entry, load_catalogue, record_archive
+from backend.services.tabel_cache import TabelCacheKey, tabel_employee_cache
+from backend.services.tabel_render_cache import warm_tabel_render_cache
+from backend.services.template_registry import (
+    TABEL_CORRECTION_ENV,
+    TABEL_ENV,
+    get_template_registry,
+)
 from shared.enums import get_position_label
 
 # WeasyPrint executable path
@@ -71,6 +99,9 @@ DEFAULT_EDRPOU_CODE = "02065502"
 # Standard work hours per day
 STANDARD_WORK_HOURS = 8.0
 
+# Роздільник сторінок у попередньому перегляді (прихований при друку)
+PAGE_SEPARATOR_HTML = '\n<div class="page-separator"></div>\n'
+
 
 @dataclass
 class DayStatus:
@@ -216,6 +247,8 @@ class EmployeeData:
     days: list[DayStatus] = field(default_factory=list)  # Статус днів (1-31)
     totals: dict[str, Any] = field(default_factory=dict)  # Підсумки
     absence: AbsenceTotals = field(default_factory=AbsenceTotals)  # Відсутності
+    staff_id: int = 0  # ID працівника
+    month_row: EmployeeMonthRow | None = field(default=None, repr=False)  # Рядок матриці місяця
 
 
 @dataclass
@@ -227,18 +260,430 @@ class TabelTotals:
     absence: AbsenceTotals = field(default_factory=AbsenceTotals)  # Загальні відсутності
 
 
+# Ключі SystemSettings, що впливають на розрахунок табеля
+TABEL_SETTINGS_KEYS = (
+    "tabel_hours_calc_positions",
+    "tabel_work_hours_per_day",
+    "tabel_limit_hours_calc",
+    "tabel_show_monthly_totals",
+    "hr_signature_id",
+    "department_name",
+)
+
+
+@dataclass
+class TabelSettings:
+    """Налаштування табеля, завантажені один раз на генерацію."""
+    hours_calc_positions: list[str] = field(default_factory=list)  # Посади з розрахунком годин
+    work_hours_per_day: float = STANDARD_WORK_HOURS  # Годин на робочий день
+    limit_hours_calc: bool = False  # Рахувати години лише для посад зі списку
+    show_monthly_totals: bool = True  # Показувати підсумки за місяць
+    hr_signature_id: Any = None  # Працівник кадрової служби (ID або "custom:ПІБ")
+    department_name: str = ""  # Назва підрозділу
+
+
+@dataclass
+class TabelSourceData:
+    """Вихідні дані табеля, згруповані за staff_id."""
+    attendance_by_staff: dict[int, list[Attendance]] = field(default_factory=dict)
+    vacations_by_staff: dict[int, list[Document]] = field(default_factory=dict)
+
+
+def _parse_bool_setting(raw: Any) -> bool:
+    """Перетворює значення налаштування на bool (підтримує "true"/"1"/"yes")."""
+    if isinstance(raw, str):
+        return raw.lower() in ("true", "1", "yes")
+    return bool(raw)
+
+
+def _parse_hours_calc_positions(raw: Any) -> list[str]:
+    """Розбирає список посад (JSON рядок або список)."""
+    try:
+        if isinstance(raw, str):
+            import json
+            parsed = json.loads(raw)
+            return parsed if isinstance(parsed, list) else []
+        if isinstance(raw, list):
+            return raw
+    except Exception as e:
+        logger.warning(f"Error parsing positions list: {e}, raw value: {raw}")
+    return []
+
+
+def _parse_work_hours_per_day(raw: Any) -> float:
+    """Розбирає кількість годин на день ("8" або "8:15")."""
+    try:
+        hours_str = str(raw).strip()
+        if ':' in hours_str:
+            # Parse "8:15" format to decimal hours (8.25)
+            parts = hours_str.split(':')
+            hours = int(parts[0])
+            minutes = int(parts[1]) if len(parts) > 1 else 0
+            return hours + minutes / 60
+        return float(hours_str) if hours_str else STANDARD_WORK_HOURS
+    except (ValueError, TypeError):
+        return STANDARD_WORK_HOURS
+
+
+def load_tabel_settings(db) -> TabelSettings:
+    """
+    Завантажує всі налаштування табеля одним запитом.
+
+    Args:
+        db: Сесія бази даних
+
+    Returns:
+        TabelSettings: Налаштування табеля
+    """
+    raw = SystemSettings.get_values(db, TABEL_SETTINGS_KEYS)
+    return TabelSettings(
+        hours_calc_positions=_parse_hours_calc_positions(raw.get("tabel_hours_calc_positions", [])),
+        work_hours_per_day=_parse_work_hours_per_day(raw.get("tabel_work_hours_per_day", "8")),
+        limit_hours_calc=_parse_bool_setting(raw.get("tabel_limit_hours_calc", False)),
+        show_monthly_totals=_parse_bool_setting(raw.get("tabel_show_monthly_totals", True)),
+        hr_signature_id=raw.get("hr_signature_id"),
+        department_name=raw.get("department_name", ""),
+    )
+
+
+def load_tabel_source_data(
+    db,
+    staff_ids: set[int] | list[int],
+    month_start: date,
+    month_end: date,
+    is_correction: bool = False,
+    correction_month: int | None = None,
+    correction_year: int | None = None,
+    include_vacations: bool = True,
+    attendance_records: list[Attendance] | None = None,
+) -> TabelSourceData:
+    """
+    Завантажує відвідуваність та відпустки для всіх працівників місяця.
+
+    Виконує фіксовану кількість запитів (не більше двох) незалежно від
+    кількості працівників і групує результат за staff_id у пам'яті.
+
+    Args:
+        db: Сесія бази даних
+        staff_ids: ID працівників табеля
+        month_start: Початок місяця
+        month_end: Кінець місяця
+        is_correction: True для корегуючого табеля
+        correction_month: Місяць, що коригується
+        correction_year: Рік, що коригується
+        include_vacations: False для заблокованих місяців (відпустки не показуються)
+        attendance_records: Вже завантажені записи відвідуваності (пропускає запит)
+
+    Returns:
+        TabelSourceData: Дані, згруповані за staff_id
+    """
+    staff_ids = set(staff_ids)
+    source = TabelSourceData()
+    if not staff_ids:
+        return source
+
+    if attendance_records is None:
+        query = db.query(Attendance).filter(
+            Attendance.date >= month_start,
+            Attendance.date <= month_end,
+        )
+        if is_correction:
+            query = query.filter(
+                Attendance.is_correction == True,
+                Attendance.correction_month == correction_month,
+                Attendance.correction_year == correction_year,
+            )
+        else:
+            query = query.filter(Attendance.is_correction == False)
+        attendance_records = query.order_by(Attendance.date, Attendance.id).all()
+
+    for att in attendance_records:
+        if att.staff_id in staff_ids:
+            source.attendance_by_staff.setdefault(att.staff_id, []).append(att)
+
+    if include_vacations:
+        vacations = db.query(Document).filter(
+            Document.doc_type.in_([
+                DocumentType.VACATION_PAID,
+                DocumentType.VACATION_UNPAID
+            ]),
+            Document.status == DocumentStatus.PROCESSED,
+            Document.date_end >= month_start,
+            Document.date_start <= month_end,
+        ).order_by(Document.date_start, Document.id).all()
+        for vacation in vacations:
+            if vacation.staff_id in staff_ids:
+                source.vacations_by_staff.setdefault(vacation.staff_id, []).append(vacation)
+
+    return source
+
+
+# Роздільник рядків вмісту в group_concat (не зустрічається в кодах і датах)
+_CONTENT_SEPARATOR = ";"
+
+
+def _attendance_content_sql():
+    """Вміст запису відвідуваності як рядок для group_concat (формат - як у _attendance_content)."""
+    return func.printf(
+        "%d|%s|%s|%s|%.2f",
+        Attendance.id,
+        Attendance.date,
+        func.coalesce(Attendance.date_end, ""),
+        Attendance.code,
+        Attendance.hours,
+    )
+
+
+def _attendance_content(att: Attendance) -> str:
+    """Вміст вже завантаженого запису відвідуваності у форматі _attendance_content_sql."""
+    date_end = att.date_end.isoformat() if att.date_end else ""
+    return f"{att.id}|{att.date.isoformat()}|{date_end}|{att.code}|{float(att.hours or 0):.2f}"
+
+
+def _vacation_content_sql():
+    """Вміст документа відпустки як рядок для group_concat."""
+    return func.printf(
+        "%d|%s|%s|%s|%d|%s",
+        Document.id,
+        Document.doc_type,
+        Document.date_start,
+        Document.date_end,
+        Document.days_count,
+        Document.status,
+    )
+
+
+def _content_digest(contents: str | list[str] | None) -> str | None:
+    """
+    Хеш вмісту записів працівника.
+
+    Порядок рядків у group_concat не гарантований, тому рядки сортуються
+    перед хешуванням.
+    """
+    if not contents:
+        return None
+    if isinstance(contents, str):
+        contents = contents.split(_CONTENT_SEPARATOR)
+    payload = "\n".join(sorted(contents)).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
+
+
+def _record_fingerprint(count: int, max_updated: Any, max_id: Any, id_sum: Any, contents: Any = None) -> tuple:
+    """Нормалізує агрегати записів у порівнюваний відбиток."""
+    return (
+        int(count or 0),
+        str(max_updated) if max_updated else None,
+        int(max_id or 0),
+        int(id_sum or 0),
+        _content_digest(contents),
+    )
+
+
+def load_tabel_fingerprints(
+    db,
+    staff_ids: set[int] | list[int],
+    month_start: date,
+    month_end: date,
+    is_correction: bool = False,
+    correction_month: int | None = None,
+    correction_year: int | None = None,
+    include_vacations: bool = True,
+    attendance_records: list[Attendance] | None = None,
+) -> dict[int, tuple]:
+    """
+    Обчислює відбитки вихідних даних табеля по працівниках.
+
+    Використовує ті самі фільтри, що й load_tabel_source_data, але повертає
+    лише агрегати (кількість, останнє оновлення, max/сума id, хеш вмісту
+    записів) з GROUP BY, тому перевірка кешу не завантажує самі записи.
+    updated_at має секундну точність, тому зміни коду, годин чи дат у межах
+    однієї секунди ловить саме хеш вмісту.
+
+    Args:
+        db: Сесія бази даних
+        staff_ids: ID працівників табеля
+        month_start: Початок місяця
+        month_end: Кінець місяця
+        is_correction: True для корегуючого табеля
+        correction_month: Місяць, що коригується
+        correction_year: Рік, що коригується
+        include_vacations: False для заблокованих місяців
+        attendance_records: Вже завантажені записи відвідуваності (пропускає запит)
+
+    Returns:
+        dict: staff_id -> (відбиток відвідуваності, відбиток відпусток)
+    """
+    staff_ids = set(staff_ids)
+    if not staff_ids:
+        return {}
+
+    attendance_fp: dict[int, tuple] = {}
+    if attendance_records is None:
+        query = db.query(
+            Attendance.staff_id,
+            func.count(Attendance.id),
+            func.max(Attendance.updated_at),
+            func.max(Attendance.id),
+            func.sum(Attendance.id),
+            func.group_concat(_attendance_content_sql(), _CONTENT_SEPARATOR),
+        ).filter(
+            Attendance.date >= month_start,
+            Attendance.date <= month_end,
+        )
+        if is_correction:
+            query = query.filter(
+                Attendance.is_correction == True,
+                Attendance.correction_month == correction_month,
+                Attendance.correction_year == correction_year,
+            )
+        else:
+            query = query.filter(Attendance.is_correction == False)
+        for staff_id, *aggregates in query.group_by(Attendance.staff_id):
+            if staff_id in staff_ids:
+                attendance_fp[staff_id] = _record_fingerprint(*aggregates)
+    else:
+        grouped: dict[int, list[Attendance]] = {}
+        for att in attendance_records:
+            if att.staff_id in staff_ids:
+                grouped.setdefault(att.staff_id, []).append(att)
+        for staff_id, records in grouped.items():
+            attendance_fp[staff_id] = _record_fingerprint(
+                len(records),
+                max(att.updated_at for att in records),
+                max(att.id for att in records),
+                sum(att.id for att in records),
+                [_attendance_content(att) for att in records],
+            )
+
+    vacation_fp: dict[int, tuple] = {}
+    if include_vacations:
+        query = db.query(
+            Document.staff_id,
+            func.count(Document.id),
+            func.max(Document.updated_at),
+            func.max(Document.id),
+            func.sum(Document.id),
+            func.group_concat(_vacation_content_sql(), _CONTENT_SEPARATOR),
+        ).filter(
+            Document.doc_type.in_([
+                DocumentType.VACATION_PAID,
+                DocumentType.VACATION_UNPAID
+            ]),
+            Document.status == DocumentStatus.PROCESSED,
+            Document.date_end >= month_start,
+            Document.date_start <= month_end,
+        )
+        for staff_id, *aggregates in query.group_by(Document.staff_id):
+            if staff_id in staff_ids:
+                vacation_fp[staff_id] = _record_fingerprint(*aggregates)
+
+    return {
+        staff_id: (attendance_fp.get(staff_id), vacation_fp.get(staff_id))
+        for staff_id in staff_ids
+    }
+
+
+def _build_employees_cached(
+    db,
+    staff_list: list[Staff],
+    month: int,
+    year: int,
+    month_start: date,
+    month_end: date,
+    month_days: int,
+    tabel_settings: TabelSettings,
+    is_correction: bool = False,
+    correction_month: int | None = None,
+    correction_year: int | None = None,
+    include_vacations: bool = True,
+    attendance_records: list[Attendance] | None = None,
+    new_staff_ids: set[int] | None = None,
+) -> list[EmployeeData]:
+    """
+    Будує рядки табеля, перераховуючи лише працівників зі зміненими даними.
+
+    Для кожного працівника порівнює відбиток вихідних даних з кешем
+    (tabel_employee_cache); записи відвідуваності та відпусток завантажуються
+    і класифікуються тільки для тих, кого в кеші немає або чиї дані змінилися.
+
+    Returns:
+        list[EmployeeData]: Рядки у порядку staff_list
+    """
+    new_staff_ids = new_staff_ids or set()
+    staff_ids = [staff.id for staff in staff_list]
+    fingerprints = load_tabel_fingerprints(
+        db, staff_ids, month_start, month_end,
+        is_correction=is_correction,
+        correction_month=correction_month,
+        correction_year=correction_year,
+        include_vacations=include_vacations,
+        attendance_records=attendance_records,
+    )
+    settings_fp = (
+        tuple(tabel_settings.hours_calc_positions),
+        tabel_settings.work_hours_per_day,
+        tabel_settings.limit_hours_calc,
+    )
+
+    cached: dict[int, EmployeeData] = {}
+    missing: list[tuple[Staff, TabelCacheKey, tuple]] = []
+    for staff in staff_list:
+        key = TabelCacheKey(staff.id, month, year, is_correction, correction_month, correction_year)
+        fingerprint = (
+            settings_fp,
+            include_vacations,
+            staff.id in new_staff_ids,
+            str(staff.updated_at),
+            fingerprints.get(staff.id),
+        )
+        emp = tabel_employee_cache.get(key, fingerprint)
+        if emp is None:
+            missing.append((staff, key, fingerprint))
+        else:
+            cached[staff.id] = emp
+
+    if missing:
+        source = load_tabel_source_data(
+            db, [staff.id for staff, _, _ in missing], month_start, month_end,
+            is_correction=is_correction,
+            correction_month=correction_month,
+            correction_year=correction_year,
+            include_vacations=include_vacations,
+            attendance_records=attendance_records,
+        )
+        classified = [
+            _classify_employee(
+                staff, month_start, month_days,
+                source.attendance_by_staff.get(staff.id, []),
+                source.vacations_by_staff.get(staff.id, []),
+                tabel_settings,
+                is_correction=is_correction,
+                is_new_employee=staff.id in new_staff_ids,
+            )
+            for staff, _, _ in missing
+        ]
+        built = build_employees_data(classified, month_days, tabel_settings)
+        for (staff, key, fingerprint), emp in zip(missing, built):
+            tabel_employee_cache.put(key, fingerprint, emp)
+            cached[staff.id] = emp
+
+    return [cached[staff.id] for staff in staff_list]
+
+
 def get_jinja_env() -> Environment:
-    """Get Jinja2 environment with template loader."""
-    # Templates are in desktop/templates/tabel/
-    template_dir = Path(__file__).parent.parent.parent / "desktop" / "templates" / "tabel"
-    return Environment(loader=FileSystemLoader(str(template_dir)))
+    """Get the shared Jinja2 environment for tabel templates (desktop/templates/tabel/)."""
+    return get_template_registry().get_environment(TABEL_ENV)
 
 
 def get_jinja_env_correction() -> Environment:
-    """Get Jinja2 environment with template loader for correction tabel."""
-    # Templates are in desktop/templates/tabel_corection/
-    template_dir = Path(__file__).parent.parent.parent / "desktop" / "templates" / "tabel_corection"
-    return Environment(loader=FileSystemLoader(str(template_dir)))
+    """Get the shared Jinja2 environment for correction tabel (desktop/templates/tabel_corection/)."""
+    return get_template_registry().get_environment(TABEL_CORRECTION_ENV)
+
+
+def get_tabel_template(is_correction: bool = False):
+    """Get the compiled tabel template (resolved once per process)."""
+    env_name = TABEL_CORRECTION_ENV if is_correction else TABEL_ENV
+    return get_template_registry().get_template(env_name, "tabel_template.html")
 
 
 def format_hours_decimal(hours: Decimal) -> str:
@@ -268,6 +713,9 @@ def get_day_status(
     """
     Визначає статус дня для працівника.
 
+    Для побудови всього місяця використовується tabel_engine.classify_month,
+    що класифікує всі дні за один прохід з тими самими пріоритетами.
+
     Логіка:
     - Дні перед початком контракту: закреслені, порожні
     - Дні після закінчення контракту: закреслені, порожні
@@ -379,77 +827,7 @@ def calculate_absence_totals(
     Returns:
         AbsenceTotals: Підсумки відсутностей
     """
-    totals = AbsenceTotals()
-
-    def add_to_half(field_base: str, record_date: date):
-        """Додає 1 до відповідного поля залежно від половини місяця."""
-        suffix = "_1" if record_date.day <= 15 else "_2"
-        field_name = field_base + suffix
-        current = getattr(totals, field_name, 0)
-        setattr(totals, field_name, current + 1)
-
-    # Count from attendance records
-    from datetime import timedelta
-    
-    for record in attendance_records:
-        code = record.code
-        
-        # Determine range to count (clip to current month)
-        rec_start = max(record.date, month_start)
-        rec_end = min(record.date_end or record.date, month_end)
-        
-        current = rec_start
-        while current <= rec_end:
-            # Skip if out of range (already handled by min/max but safety check)
-            if current < month_start or current > month_end:
-                current += timedelta(days=1)
-                continue
-
-            if code in ("В", "Д"):  # Відпустки оплачувані (щорічна основна та додаткова)
-                add_to_half("vacation_8_10", current)
-            elif code in ("Ч", "ТВ", "Н", "ДО", "ВП"):  # Інші оплачувані відпустки
-                add_to_half("vacation_11_15", current)
-            elif code == "ДД":  # Догляд за дитиною до 6 років
-                add_to_half("vacation_18", current)
-            elif code in ("НБ", "ДБ", "НА", "БЗ"):  # Відпустка без збереження зарплати
-                add_to_half("vacation_19", current)
-            elif code == "ВД":  # Відрядження
-                add_to_half("business_trip", current)
-            elif code in ("РС", "НД"):  # Неповний робочий день
-                add_to_half("part_time", current)
-            elif code == "НП":  # Тимчасовий перевод на інше підприємство
-                add_to_half("temp_transfer", current)
-            elif code == "П":  # Простої
-                add_to_half("idle", current)
-            elif code == "ПР":  # Прогули
-                add_to_half("absenteeism", current)
-            elif code == "С":  # Страйк
-                add_to_half("strike", current)
-            elif code in ("ТН", "НН"):  # Тимчасова непрацездатність
-                add_to_half("temp_disability", current)
-            elif code in ("НЗ", "ІВ", "І", "ІН"):  # Неявки різних типів
-                add_to_half("unexcused", current)
-            
-            current += timedelta(days=1)
-
-    # Count from vacation documents
-    from datetime import timedelta
-    for vacation in vacations:
-        if vacation.status == DocumentStatus.PROCESSED:
-            # Iterate through each day of the vacation
-            vac_start = max(vacation.date_start, month_start)
-            vac_end = min(vacation.date_end or vacation.date_start, month_end)
-            current = vac_start
-            max_days = 366  # Safety limit to prevent infinite loops
-            day_count = 0
-            while current <= vac_end and day_count < max_days:
-                if vacation.doc_type == DocumentType.VACATION_PAID:
-                    add_to_half("vacation_8_10", current)
-                elif vacation.doc_type == DocumentType.VACATION_UNPAID:
-                    add_to_half("vacation_19", current)
-                current += timedelta(days=1)
-                day_count += 1
-    return totals
+    return AbsenceTotals(**count_absence_days(attendance_records, vacations, month_start, month_end))
 
 
 def format_short_name(full_name: str) -> str:
@@ -462,6 +840,134 @@ def format_short_name(full_name: str) -> str:
     return full_name
 
 
+def _classify_employee(
+    staff: Staff,
+    month_start: date,
+    days_in_month: int,
+    attendance_records: list[Attendance],
+    vacations: list[Document],
+    tabel_settings: TabelSettings,
+    is_correction: bool = False,
+    is_new_employee: bool = False,
+) -> tuple[Staff, MonthGrid, bool, Any]:
+    """
+    Класифікує місяць працівника та визначає параметри розрахунку годин.
+
+    Returns:
+        tuple: (staff, grid, is_hours_calc, hours_to_use або None якщо години не рахуються)
+    """
+    # Check if employee position is in the list for hours calculation
+    is_hours_calc = staff.position in tabel_settings.hours_calc_positions if staff.position else False
+
+    # Classify the whole month in one pass (attendance and vacation ranges painted into slots)
+    grid = classify_month(
+        month_start, days_in_month, staff.term_start, staff.term_end,
+        attendance_records, vacations,
+        is_correction=is_correction,
+        is_new_employee=is_new_employee,
+    )
+
+    # Calculate total hours using settings value for configured positions
+    # If limit_hours_calc is ON, only calculate hours for employees in the positions list
+    hours_to_use = None
+    if not tabel_settings.limit_hours_calc or is_hours_calc:
+        hours_to_use = tabel_settings.work_hours_per_day if is_hours_calc else (staff.daily_work_hours or 8)
+
+    return staff, grid, is_hours_calc, hours_to_use
+
+
+def build_employees_data(
+    classified: list[tuple[Staff, MonthGrid, bool, Any]],
+    days_in_month: int,
+    tabel_settings: TabelSettings,
+) -> list[EmployeeData]:
+    """
+    Будує дані працівників з класифікацій місяця.
+
+    Рядки всіх працівників збираються в одну DepartmentMonthMatrix, робочі дні
+    та надурочні години по половинах місяця обчислюються векторно, а тут лише
+    форматуються для шаблону.
+
+    Args:
+        classified: Результати _classify_employee
+        days_in_month: Кількість днів у місяці
+        tabel_settings: Налаштування табеля
+
+    Returns:
+        list[EmployeeData]: Дані працівників у тому ж порядку
+    """
+    rows = [EmployeeMonthRow.from_grid(grid) for _, grid, _, _ in classified]
+    matrix = DepartmentMonthMatrix.from_rows(rows, days_in_month)
+    work_days = matrix.work_days().tolist()
+    overtime = matrix.overtime_hours().tolist()
+
+    employees = []
+    for i, (staff, grid, is_hours_calc, hours_to_use) in enumerate(classified):
+        # For employees in hours calculation list, show actual hours instead of "Р"
+        work_day_hours = ""
+        if is_hours_calc:
+            # Calculate hours based on rate (ставка)
+            staff_rate = float(staff.rate) if staff.rate else 1.0
+            work_day_hours = format_hours_decimal(tabel_settings.work_hours_per_day * staff_rate)
+
+        # Build day statuses (padded to 31 days for template)
+        days = []
+        for day in range(MAX_MONTH_DAYS):
+            code = grid.codes[day]
+            if code == WORK_DAY_CODE and is_hours_calc:
+                hours_str = work_day_hours
+            elif grid.from_attendance[day] and grid.hours[day] > 0:
+                # Include hours for overtime types, show blank if 0
+                hours_str = str(grid.hours[day])
+            else:
+                hours_str = ""
+            days.append(DayStatus(
+                code=code,
+                hours=hours_str,
+                weekend=grid.weekend[day],
+                disabled=grid.disabled[day],
+                strikethrough=grid.strikethrough[day],
+            ))
+
+        work_days_first_half, work_days_second_half = work_days[i]
+        total_work_days = work_days_first_half + work_days_second_half
+        if hours_to_use is not None:
+            first_half_hours = format_hours_decimal(hours_to_use * work_days_first_half)
+            second_half_hours = format_hours_decimal(hours_to_use * work_days_second_half)
+            total_hours = format_hours_decimal(hours_to_use * total_work_days)
+            rows[i].work_minutes = int(float(hours_to_use * total_work_days) * 60)
+        else:
+            # Leave hours blank for employees not in the positions list
+            first_half_hours = ''
+            second_half_hours = ''
+            total_hours = ''
+
+        totals = {
+            'work_days': total_work_days if total_work_days > 0 else '',
+            'work_hours': total_hours,
+            'first_half_work_days': work_days_first_half if work_days_first_half > 0 else '',
+            'first_half_work_hours': first_half_hours,
+            'second_half_work_days': work_days_second_half if work_days_second_half > 0 else '',
+            'second_half_work_hours': second_half_hours,
+        }
+        for j, name in enumerate(OVERTIME_CODE_FIELDS.values()):
+            totals[f'first_half_{name}'] = overtime[i][j][0] or ''
+            totals[f'second_half_{name}'] = overtime[i][j][1] or ''
+
+        employees.append(EmployeeData(
+            pib=format_short_name(staff.pib_nom),
+            position=get_position_label(staff.position).lower() if staff.position else "",
+            rate=str(staff.rate).replace('.', ',') if staff.rate else None,
+            days=days,
+            totals=totals,
+            absence=AbsenceTotals(**grid.absence),
+            staff_id=staff.id or 0,
+            month_row=rows[i],
+        ))
+
+    return employees
+
+
 def get_employee_data(
     staff: Staff,
     month: int,
@@ -471,6 +977,7 @@ def get_employee_data(
     db=None,
     is_correction: bool = False,
     is_new_employee: bool = False,
+    tabel_settings: TabelSettings | None = None,
 ) -> EmployeeData:
     """
     Збирає дані працівника для табеля.
@@ -483,180 +990,106 @@ def get_employee_data(
         vacations: Список документів відпусток
         db: Опціонально - база даних для отримання налаштувань
         is_correction: True якщо це корегуючий табель
+        is_new_employee: True для нового працівника в корегуючому табелі
+        tabel_settings: Налаштування табеля (якщо None - читаються з db)
 
     Returns:
         EmployeeData: Дані працівника
     """
     _, days_in_month = calendar.monthrange(year, month)
-    month_start = date(year, month, 1)
-    month_end = date(year, month, days_in_month)
 
-    # Get settings for hours calculation
-    hours_calc_positions = []
-    work_hours_per_day = 8  # Default
+    # Settings for hours calculation (loaded once per tabel by the caller)
+    if tabel_settings is None:
+        tabel_settings = load_tabel_settings(db) if db else TabelSettings()
 
-    if db:
-        # Get positions list (handle both JSON string and list)
-        positions_raw = SystemSettings.get_value(db, "tabel_hours_calc_positions", [])
-        try:
-            if isinstance(positions_raw, str):
-                import json
-                hours_calc_positions = json.loads(positions_raw)
-            elif isinstance(positions_raw, list):
-                hours_calc_positions = positions_raw
-            else:
-                hours_calc_positions = []
-        except Exception as e:
-            logger.warning(f"Error parsing positions list: {e}, raw value: {positions_raw}")
-            hours_calc_positions = []
+    classified = _classify_employee(
+        staff, date(year, month, 1), days_in_month,
+        attendance_records, vacations, tabel_settings,
+        is_correction=is_correction,
+        is_new_employee=is_new_employee,
+    )
+    return build_employees_data([classified], days_in_month, tabel_settings)[0]
 
-        # Get work hours per day (handle both "8" and "8:15" formats)
-        hours_raw = SystemSettings.get_value(db, "tabel_work_hours_per_day", "8")
-        try:
-            hours_str = str(hours_raw).strip()
-            if ':' in hours_str:
-                # Parse "8:15" format to decimal hours (8.25)
-                parts = hours_str.split(':')
-                hours = int(parts[0])
-                minutes = int(parts[1]) if len(parts) > 1 else 0
-                work_hours_per_day = hours + minutes / 60
-            else:
-                work_hours_per_day = float(hours_str) if hours_str else 8.0
-        except (ValueError, TypeError):
-            work_hours_per_day = 8.0
 
-    # Check if employee position is in the list for hours calculation
-    is_hours_calc = staff.position in hours_calc_positions if staff.position else False
-
-    # Build day statuses
-    days = []
-    work_days_first_half = 0
-    work_days_second_half = 0
-
-    # Overtime counters for first half
-    first_half_overtime = 0
-    first_half_night = 0
-    first_half_evening = 0
-    first_half_weekend = 0
-
-    # Overtime counters for second half
-    second_half_overtime = 0
-    second_half_night = 0
-    second_half_evening = 0
-    second_half_weekend = 0
-
-    for day in range(1, days_in_month + 1):
-        current_date = date(year, month, day)
-        day_status = get_day_status(
-            current_date, staff, attendance_records, vacations,
-            is_correction=is_correction, 
-            show_work_days=not is_correction,
-            is_new_employee=is_new_employee
-        )
-        days.append(day_status)
-
-        if day_status.code == "Р":
-            # For employees in hours calculation list, show actual hours instead of "Р"
-            if is_hours_calc:
-                # Calculate hours based on rate (ставка)
-                staff_rate = float(staff.rate) if staff.rate else 1.0
-                hours_for_day = work_hours_per_day * staff_rate
-                day_status.hours = format_hours_decimal(hours_for_day)
-            # Count work days for totals (regardless of display)
-            if day <= 15:
-                work_days_first_half += 1
-            else:
-                work_days_second_half += 1
+def _month_row_from_employee(emp: EmployeeData) -> EmployeeMonthRow:
+    """Відновлює числовий рядок матриці з даних працівника без month_row."""
+    days = list(emp.days)[:MAX_MONTH_DAYS]
+    codes = [day.code or "" for day in days] + [""] * (MAX_MONTH_DAYS - len(days))
+    hours = np.zeros(MAX_MONTH_DAYS, dtype=np.float64)
+    for i, day in enumerate(days):
+        if day.code in OVERTIME_CODE_FIELDS and day.hours:
+            try:
+                hours[i] = float(day.hours)
+            except ValueError:
+                pass
+
+    absence = emp.absence if isinstance(emp.absence, dict) else emp.absence.__dict__
+    absence_values = np.array(
+        [
+            (int(absence.get(f"{name}_1") or 0), int(absence.get(f"{name}_2") or 0))
+            for name in ABSENCE_FIELDS
+        ],
+        dtype=np.int32,
+    )
 
-        # Count overtime/special hours from attendance records
-        if day_status.code == "НУ":  # Надурочні
-            hours_val = float(day_status.hours) if day_status.hours else 0
-            if day <= 15:
-                first_half_overtime += hours_val
-            else:
-                second_half_overtime += hours_val
-        elif day_status.code == "РН":  # Нічні
-            hours_val = float(day_status.hours) if day_status.hours else 0
-            if day <= 15:
-                first_half_night += hours_val
-            else:
-                second_half_night += hours_val
-        elif day_status.code == "ВЧ":  # Вечірні
-            hours_val = float(day_status.hours) if day_status.hours else 0
-            if day <= 15:
-                first_half_evening += hours_val
-            else:
-                second_half_evening += hours_val
-        elif day_status.code == "РВ":  # Вихідні/святкові
-            hours_val = float(day_status.hours) if day_status.hours else 0
-            if day <= 15:
-                first_half_weekend += hours_val
-            else:
-                second_half_weekend += hours_val
+    # Handle both "8,25" and "8:15" formats of work hours
+    work_minutes = 0
+    totals = emp.totals if isinstance(emp.totals, dict) else {}
+    work_hours = str(totals.get('work_hours', '')).strip()
+    try:
+        if ':' in work_hours:
+            parts = work_hours.split(':')
+            work_minutes = int(parts[0]) * 60 + (int(parts[1]) if len(parts) > 1 else 0)
+        elif work_hours:
+            work_minutes = int(float(work_hours.replace(",", ".")) * 60)
+    except ValueError:
+        pass
 
-    # Pad to 31 days for template (handle Feb, Apr, Jun, Sep, Nov)
-    while len(days) < 31:
-        days.append(DayStatus(code="", hours="", weekend=False))
+    return EmployeeMonthRow(
+        codes=encode_day_codes(codes),
+        hours=hours,
+        absence=absence_values,
+        work_minutes=work_minutes,
+    )
 
-    # Calculate absence totals
-    absence = calculate_absence_totals(attendance_records, vacations, month_start, month_end)
 
-    # Check if we should limit hours calculation
-    limit_hours_calc = False
-    try:
-        if db:
-            limit_hours_raw = SystemSettings.get_value(db, "tabel_limit_hours_calc", False)
-            if isinstance(limit_hours_raw, str):
-                limit_hours_calc = limit_hours_raw.lower() in ("true", "1", "yes")
-            else:
-                limit_hours_calc = bool(limit_hours_raw)
-    except Exception as e:
-        logger.warning(f"Error reading limit_hours_calc setting: {e}")
-        limit_hours_calc = False
+def build_department_matrix(employees: list[EmployeeData], month_days: int) -> DepartmentMonthMatrix:
+    """
+    Збирає матрицю працівник × день для списку працівників.
 
-    # Calculate total hours using settings value for configured positions
-    # If limit_hours_calc is ON, only calculate hours for employees in the positions list
-    calculate_hours = not limit_hours_calc or is_hours_calc
+    Args:
+        employees: Список працівників
+        month_days: Кількість днів у місяці
 
-    if calculate_hours:
-        hours_to_use = work_hours_per_day if is_hours_calc else (staff.daily_work_hours or 8)
-        first_half_hours = format_hours_decimal(hours_to_use * work_days_first_half)
-        second_half_hours = format_hours_decimal(hours_to_use * work_days_second_half)
-        total_hours = format_hours_decimal(hours_to_use * (work_days_first_half + work_days_second_half))
-    else:
-        # Leave hours blank for employees not in the positions list
-        first_half_hours = ''
-        second_half_hours = ''
-        total_hours = ''
-
-    # Format data
-    short_name = format_short_name(staff.pib_nom)
-    formatted_rate = str(staff.rate).replace('.', ',') if staff.rate else None
-    
-    return EmployeeData(
-        pib=short_name,
-        position=get_position_label(staff.position).lower() if staff.position else "",
-        rate=formatted_rate,
-        days=days,
-        totals={
-            'work_days': work_days_first_half + work_days_second_half if work_days_first_half + work_days_second_half > 0 else '',
-            'work_hours': total_hours,
-            'first_half_work_days': work_days_first_half if work_days_first_half > 0 else '',
-            'first_half_work_hours': first_half_hours,
-            'second_half_work_days': work_days_second_half if work_days_second_half > 0 else '',
-            'second_half_work_hours': second_half_hours,
-            'first_half_overtime': first_half_overtime or '',
-            'first_half_night': first_half_night or '',
-            'first_half_evening': first_half_evening or '',
-            'first_half_weekend': first_half_weekend or '',
-            'second_half_overtime': second_half_overtime or '',
-            'second_half_night': second_half_night or '',
-            'second_half_evening': second_half_evening or '',
-            'second_half_weekend': second_half_weekend or '',
-        },
-        absence=absence,
+    Returns:
+        DepartmentMonthMatrix: Матриця кодів, годин та відсутностей
+    """
+    rows = [
+        emp.month_row if emp.month_row is not None else _month_row_from_employee(emp)
+        for emp in employees
+    ]
+    return DepartmentMonthMatrix.from_rows(rows, month_days)
+
+
+def _totals_from_matrix(matrix: DepartmentMonthMatrix) -> TabelTotals:
+    """Обчислює підсумки табеля векторними редукціями по матриці."""
+    matrix_totals = matrix.totals()
+    work_minutes = matrix_totals['work_minutes']
+
+    totals = TabelTotals(
+        work_days=matrix_totals['work_days'],
+        # Format total hours
+        work_hours=f"{work_minutes // 60}:{work_minutes % 60:02d}" if work_minutes > 0 else "0,00",
+        days=matrix_totals['days'],
+        absence=AbsenceTotals(**matrix_totals['absence']),
     )
 
+    # Add monthly overtime totals to the totals dict
+    for name in OVERTIME_CODE_FIELDS.values():
+        totals.__dict__[name] = matrix_totals[name] or ''
+
+    return totals
+
 
 def get_tabel_totals(employees: list[EmployeeData], month_days: int) -> TabelTotals:
     """
@@ -669,109 +1102,10 @@ def get_tabel_totals(employees: list[EmployeeData], month_days: int) -> TabelTot
     Returns:
         TabelTotals: Загальні підсумки
     """
-    totals = TabelTotals()
-
-    # Initialize day totals
-    totals.days = [0] * 31
-    total_hours_decimal = Decimal("0")
-
-    # Initialize monthly overtime totals
-    total_overtime = 0
-    total_night = 0
-    total_evening = 0
-    total_weekend = 0
-
-    for emp in employees:
-        # Ensure emp.totals is a dict (fix type corruption issues)
-        if not isinstance(emp.totals, dict):
-            logger.warning(f"emp.totals is {type(emp.totals)}, resetting to empty dict")
-            emp.totals = {}
-
-        # Handle empty string for work_days
-        work_days = emp.totals.get('work_days', 0)
-        if work_days and str(work_days).strip():
-            totals.work_days += int(work_days)
-
-        # Add to total hours (only for employees with hours calculated)
-        try:
-            work_hours = str(emp.totals['work_hours']).strip()
-            if work_hours:  # Only parse if not empty
-                # Handle both "8,25" and "8:15" formats
-                if ':' in work_hours:
-                    # Parse "8:15" format to decimal hours (8.25)
-                    parts = work_hours.split(':')
-                    hours = int(parts[0])
-                    minutes = int(parts[1]) if len(parts) > 1 else 0
-                    emp_hours = Decimal(str(hours + minutes / 60))
-                else:
-                    emp_hours = Decimal(work_hours.replace(",", "."))
-                total_hours_decimal += emp_hours
-        except (ValueError, decimal.InvalidOperation):
-            pass
-
-        # Sum day totals
-        for i, day in enumerate(emp.days):
-            if day.code:  # Only count non-empty days
-                totals.days[i] += 1
-
-        # Sum monthly overtime totals (first_half + second_half)
-        try:
-            if emp.totals.get('first_half_overtime'):
-                total_overtime += int(emp.totals['first_half_overtime'])
-            if emp.totals.get('second_half_overtime'):
-                total_overtime += int(emp.totals['second_half_overtime'])
-            if emp.totals.get('first_half_night'):
-                total_night += int(emp.totals['first_half_night'])
-            if emp.totals.get('second_half_night'):
-                total_night += int(emp.totals['second_half_night'])
-            if emp.totals.get('first_half_evening'):
-                total_evening += int(emp.totals['first_half_evening'])
-            if emp.totals.get('first_half_weekend'):
-                total_weekend += int(emp.totals['first_half_weekend'])
-        except (ValueError, TypeError):
-            pass
-
-        # Sum absence totals (both halves)
-        emp_absence = emp.absence
-        totals.absence.vacation_8_10_1 += emp_absence.vacation_8_10_1
-        totals.absence.vacation_8_10_2 += emp_absence.vacation_8_10_2
-        totals.absence.vacation_11_15_1 += emp_absence.vacation_11_15_1
-        totals.absence.vacation_11_15_2 += emp_absence.vacation_11_15_2
-        totals.absence.vacation_18_1 += emp_absence.vacation_18_1
-        totals.absence.vacation_18_2 += emp_absence.vacation_18_2
-        totals.absence.vacation_19_1 += emp_absence.vacation_19_1
-        totals.absence.vacation_19_2 += emp_absence.vacation_19_2
-        totals.absence.business_trip_1 += emp_absence.business_trip_1
-        totals.absence.business_trip_2 += emp_absence.business_trip_2
-        totals.absence.part_time_1 += emp_absence.part_time_1
-        totals.absence.part_time_2 += emp_absence.part_time_2
-        totals.absence.temp_transfer_1 += emp_absence.temp_transfer_1
-        totals.absence.temp_transfer_2 += emp_absence.temp_transfer_2
-        totals.absence.idle_1 += emp_absence.idle_1
-        totals.absence.idle_2 += emp_absence.idle_2
-        totals.absence.absenteeism_1 += emp_absence.absenteeism_1
-        totals.absence.absenteeism_2 += emp_absence.absenteeism_2
-        totals.absence.strike_1 += emp_absence.strike_1
-        totals.absence.strike_2 += emp_absence.strike_2
-        totals.absence.temp_disability_1 += emp_absence.temp_disability_1
-        totals.absence.temp_disability_2 += emp_absence.temp_disability_2
-        totals.absence.unexcused_1 += emp_absence.unexcused_1
-        totals.absence.unexcused_2 += emp_absence.unexcused_2
-
-
-    # Format total hours
-    totals.work_hours = format_hours_decimal(total_hours_decimal) if total_hours_decimal > 0 else "0,00"
-
-    # Add monthly overtime totals to the totals dict
-    totals.__dict__['overtime'] = total_overtime if total_overtime else ''
-    totals.__dict__['night'] = total_night if total_night else ''
-    totals.__dict__['evening'] = total_evening if total_evening else ''
-    totals.__dict__['weekend'] = total_weekend if total_weekend else ''
-
-    return totals
+    return _totals_from_matrix(build_department_matrix(employees, month_days))
 
 
-def generate_tabel_html(
+def iter_tabel_page_contexts(
     month: int,
     year: int,
     institution_name: str = DEFAULT_INSTITUTION_NAME,
@@ -782,9 +1116,14 @@ def generate_tabel_html(
     correction_month: int | None = None,
     correction_year: int | None = None,
     department_name: str | None = None,
-) -> str:
+    db=None,
+    tabel_settings: TabelSettings | None = None,
+) -> Iterator[dict[str, Any]]:
     """
-    Генерує HTML табеля для заданого місяця та року.
+    Завантажує дані табеля та по черзі повертає контекст шаблону кожної сторінки.
+
+    Дані з БД завантажуються до першої сторінки; контексти наступних сторінок
+    будуються лише тоді, коли їх запитує рендерер.
 
     Args:
         month: Місяць (1-12)
@@ -797,9 +1136,11 @@ def generate_tabel_html(
         correction_month: Місяць, що коригується (для корегуючих табелів)
         correction_year: Рік, що коригується (для корегуючих табелів)
         department_name: Назва підрозділу (опціонально)
+        db: Відкрита сесія БД (якщо None - відкривається власна)
+        tabel_settings: Вже завантажені налаштування табеля
 
-    Returns:
-        str: HTML код табеля
+    Yields:
+        dict: Контекст tabel_template.html для однієї сторінки
     """
     employees: list[EmployeeData] = []
     _, month_days = calendar.monthrange(year, month)
@@ -810,16 +1151,20 @@ def generate_tabel_html(
     # Use provided department name or default to empty (will be fetched if None)
     # Actually, we keep it as None to know if we need to fetch it
     
-    logger.info(f"Starting generate_tabel_html: month={month}, year={year}, is_correction={is_correction}")
+    logger.info(f"Starting tabel generation: month={month}, year={year}, is_correction={is_correction}")
 
     try:
-        with get_db_context() as db:
+        with nullcontext(db) if db is not None else get_db_context() as db:
+            if tabel_settings is None:
+                tabel_settings = load_tabel_settings(db)
+
             # Get department name from settings if not provided
             if department_name is None:
-                department_name = SystemSettings.get_value(db, "department_name", "")
+                department_name = tabel_settings.department_name
 
             employees, responsible_person, department_head, hr_person = get_employees_for_tabel(
-                db, month, year, is_correction, correction_month, correction_year
+                db, month, year, is_correction, correction_month, correction_year,
+                tabel_settings=tabel_settings,
             )
 
     except Exception as e:
@@ -842,54 +1187,26 @@ def generate_tabel_html(
     month_start_formatted = date(year, month, 1).strftime("%d.%m.%Y")
     month_end_formatted = date(year, month, month_days).strftime("%d.%m.%Y")
 
-    pages = []
-    for i in range(0, len(employee_dicts), employees_per_page):
+    # Staff × day matrix for the whole tabel; page totals are vectorized reductions over row slices
+    matrix = build_department_matrix(employees, month_days)
+    show_monthly_totals = tabel_settings.show_monthly_totals
+
+    # For correction mode, calculate actual span of attendance records
+    correction_start = ""
+    correction_end = ""
+    if is_correction:
+        active_days = matrix.active_days()
+        if active_days.size:
+            correction_start = date(year, month, int(active_days[0]) + 1).strftime("%d.%m.%Y")
+            correction_end = date(year, month, int(active_days[-1]) + 1).strftime("%d.%m.%Y")
+
+    total_pages = (len(employee_dicts) + employees_per_page - 1) // employees_per_page if employee_dicts else 0
+    for page_index, i in enumerate(range(0, len(employee_dicts), employees_per_page or 1)):
         page_employees = employee_dicts[i:i + employees_per_page]
         logger.debug(f"Processing page {i // employees_per_page + 1}, employees on page: {len(page_employees)}")
 
         # Calculate page totals
-        page_emp_data = []
-        for emp_dict in page_employees:
-            try:
-                # Debug output for each employee
-                logger.debug(f"Employee totals type: {type(emp_dict.get('totals'))}, value: {emp_dict.get('totals')}")
-                page_emp_data.append(EmployeeData(**emp_dict))
-            except Exception as e:
-                logger.error(f"Error creating EmployeeData: {e}, data: {emp_dict}")
-                raise
-
-        page_totals = get_tabel_totals(page_emp_data, month_days)
-
-        # Prepare template data for this page
-        # Get show_monthly_totals setting
-        show_monthly_totals = True
-        try:
-            with get_db_context() as settings_db:
-                show_monthly_totals_raw = SystemSettings.get_value(settings_db, "tabel_show_monthly_totals", True)
-                # Convert to boolean
-                if isinstance(show_monthly_totals_raw, str):
-                    show_monthly_totals = show_monthly_totals_raw.lower() in ("true", "1", "yes")
-                else:
-                    show_monthly_totals = bool(show_monthly_totals_raw)
-        except Exception:
-            pass
-
-        # For correction mode, calculate actual span of attendance records
-        correction_start = ""
-        correction_end = ""
-        if is_correction:
-            all_attendance_dates = []
-            for emp in employees:
-                for day in emp.days:
-                    if day.code and not day.strikethrough:
-                        # Calculate actual date for this day
-                        day_num = emp.days.index(day) + 1
-                        if day_num <= month_days:
-                            actual_date = date(year, month, day_num)
-                            all_attendance_dates.append(actual_date)
-            if all_attendance_dates:
-                correction_start = min(all_attendance_dates).strftime("%d.%m.%Y")
-                correction_end = max(all_attendance_dates).strftime("%d.%m.%Y")
+        page_totals = _totals_from_matrix(matrix.slice(i, i + employees_per_page))
 
         # For correction tabels, use the correction month/year for title
         if is_correction and correction_month and correction_year:
@@ -914,8 +1231,10 @@ def generate_tabel_html(
             'title_year': str(title_year),
             'title_month': title_month,
             'employees': page_employees,
-            'page_number': len(pages) + 1,
-            'total_pages': (len(employee_dicts) + employees_per_page - 1) // employees_per_page,
+            'page_number': page_index + 1,
+            'total_pages': total_pages,
+            # page-break class on grid-container for PDF pagination (not on first page)
+            'page_break': page_index > 0,
             'show_monthly_totals': show_monthly_totals,
             'is_correction': is_correction,
             'totals': {
@@ -953,24 +1272,10 @@ def generate_tabel_html(
                     'second_half_night': '',
                 }
 
-        # Render this page
-        if is_correction:
-            env = get_jinja_env_correction()
-        else:
-            env = get_jinja_env()
-        template = env.get_template('tabel_template.html')
-        page_html = template.render(**template_data)
-        # Wrap in page container for proper preview separation
-        # Add page-break class to grid-container for PDF pagination (but not on first page)
-        page_break_class = " page-break" if len(pages) > 0 else ""
-        page_html = page_html.replace(
-            '<div class="ritz grid-container"',
-            f'<div class="ritz grid-container{page_break_class}"'
-        )
-        pages.append(f'<div class="page-container">{page_html}</div>')
+        yield template_data
 
     # If no employees, render empty template with just headers
-    if not pages:
+    if not employee_dicts:
         # For correction tabels, use the correction month/year for title
         if is_correction and correction_month and correction_year:
             title_month = correction_month
@@ -997,6 +1302,7 @@ def generate_tabel_html(
             'employees': [],
             'page_number': 1,
             'total_pages': 1,
+            'page_break': False,
             'show_monthly_totals': False,
             'is_correction': is_correction,
             'totals': {
@@ -1013,22 +1319,124 @@ def generate_tabel_html(
             'department_head': department_head,
             'hr_person': hr_person,
         }
-        if is_correction:
-            env = get_jinja_env_correction()
-        else:
-            env = get_jinja_env()
-        template = env.get_template('tabel_template.html')
-        page_html = template.render(**template_data)
-        page_html = page_html.replace(
-            '<div class="ritz grid-container"',
-            '<div class="ritz grid-container"'
-        )
-        pages.append(f'<div class="page-container">{page_html}</div>')
+        yield template_data
 
-    # Join pages with separator (hidden during print)
-    html = f'\n<div class="page-separator"></div>\n'.join(pages)
 
-    return html
+def render_tabel_page(template_data: dict[str, Any], is_correction: bool = False) -> str:
+    """
+    Рендерить одну сторінку табеля у контейнері сторінки.
+
+    Args:
+        template_data: Контекст сторінки (див. iter_tabel_page_contexts)
+        is_correction: True для корегуючого табеля
+
+    Returns:
+        str: HTML сторінки
+    """
+    page_html = get_tabel_template(is_correction).render(**template_data)
+    return f'<div class="page-container">{page_html}</div>'
+
+
+def stream_tabel_html(
+    month: int,
+    year: int,
+    institution_name: str = DEFAULT_INSTITUTION_NAME,
+    edrpou_code: str = DEFAULT_EDRPOU_CODE,
+    tabel_number: str = "",
+    employees_per_page: int = 0,
+    is_correction: bool = False,
+    correction_month: int | None = None,
+    correction_year: int | None = None,
+    department_name: str | None = None,
+) -> Iterator[str]:
+    """
+    Генерує HTML табеля частинами: кожна сторінка рендериться й віддається
+    одразу (Template.generate), без побудови всього документа в пам'яті.
+
+    Об'єднання всіх частин дає той самий HTML, що й generate_tabel_html.
+
+    Args:
+        month: Місяць (1-12)
+        year: Рік
+        institution_name: Назва установи
+        edrpou_code: Код ЄДРПОУ
+        tabel_number: Номер табеля
+        employees_per_page: Кількість працівників на сторінці (0 = без обмеження)
+        is_correction: True для корегуючого табеля
+        correction_month: Місяць, що коригується (для корегуючих табелів)
+        correction_year: Рік, що коригується (для корегуючих табелів)
+        department_name: Назва підрозділу (опціонально)
+
+    Yields:
+        str: Фрагменти HTML у порядку документа
+    """
+    # Compiled once per process (template registry), reused for every page
+    template = get_tabel_template(is_correction)
+
+    page_contexts = iter_tabel_page_contexts(
+        month=month,
+        year=year,
+        institution_name=institution_name,
+        edrpou_code=edrpou_code,
+        tabel_number=tabel_number,
+        employees_per_page=employees_per_page,
+        is_correction=is_correction,
+        correction_month=correction_month,
+        correction_year=correction_year,
+        department_name=department_name,
+    )
+    for page_index, template_data in enumerate(page_contexts):
+        if page_index:
+            # Separator between pages (hidden during print)
+            yield PAGE_SEPARATOR_HTML
+        # Wrap in page container for proper preview separation
+        yield '<div class="page-container">'
+        yield from template.generate(**template_data)
+        yield '</div>'
+
+
+def generate_tabel_html(
+    month: int,
+    year: int,
+    institution_name: str = DEFAULT_INSTITUTION_NAME,
+    edrpou_code: str = DEFAULT_EDRPOU_CODE,
+    tabel_number: str = "",
+    employees_per_page: int = 0,
+    is_correction: bool = False,
+    correction_month: int | None = None,
+    correction_year: int | None = None,
+    department_name: str | None = None,
+) -> str:
+    """
+    Генерує HTML табеля для заданого місяця та року.
+
+    Args:
+        month: Місяць (1-12)
+        year: Рік
+        institution_name: Назва установи
+        edrpou_code: Код ЄДРПОУ
+        tabel_number: Номер табеля
+        employees_per_page: Кількість працівників на сторінці (0 = без обмеження)
+        is_correction: True для корегуючого табеля
+        correction_month: Місяць, що коригується (для корегуючих табелів)
+        correction_year: Рік, що коригується (для корегуючих табелів)
+        department_name: Назва підрозділу (опціонально)
+
+    Returns:
+        str: HTML код табеля
+    """
+    return "".join(stream_tabel_html(
+        month=month,
+        year=year,
+        institution_name=institution_name,
+        edrpou_code=edrpou_code,
+        tabel_number=tabel_number,
+        employees_per_page=employees_per_page,
+        is_correction=is_correction,
+        correction_month=correction_month,
+        correction_year=correction_year,
+        department_name=department_name,
+    ))
 
 
 def save_tabel_to_file(
@@ -1091,7 +1499,7 @@ def save_tabel_archive(
     raw_vacations: list | None = None,
 ) -> Path:
     """
-    Зберігає компактний архів табеля у JSON форматі.
+    Зберігає компактний архів табеля (стиснутий формат v2, див. archive_format).
 
     Архів містить мінімальні дані для відновлення табеля:
     - Версія формату
@@ -1121,7 +1529,6 @@ def save_tabel_archive(
     Returns:
         Path: Шлях до збереженого архіву
     """
-    import json
     from datetime import datetime
     from backend.models.settings import SystemSettings
     from backend.core.database import get_db_context
@@ -1142,7 +1549,7 @@ def save_tabel_archive(
 
     # Build archive data with is_approved from parameter
     archive_data = {
-        "version": "1.1",  # Bumped version for raw data support
+        "version": "2.0",  # Compressed archive with lazy raw_data section
         "archived_at": datetime.utcnow().isoformat(),
         "month": month,
         "year": year,
@@ -1168,15 +1575,30 @@ def save_tabel_archive(
         }
     }
 
-    # Format: Табель_Січень_2026.json or Табель_корегуючий_Січень_2026_#1.json
+    # Format: Табель_Січень_2026.vmarc or Табель_корегуючий_Січень_2026_#1.vmarc
     if is_correction:
-        filename = f"Табель_корегуючий_{month_name}_{year}_#{correction_sequence}.json"
+        stem = f"Табель_корегуючий_{month_name}_{year}_#{correction_sequence}"
     else:
-        filename = f"Табель_{month_name}_{year}.json"
-    filepath = output_dir / filename
+        stem = f"Табель_{month_name}_{year}"
+    filepath = output_dir / f"{stem}{ARCHIVE_SUFFIX}"
+
+    # Compressed v2 archive (written atomically); raw_data is a lazy section
+    write_archive(
+        filepath, archive_data,
+        lazy_sections=("raw_data",),
+        meta=catalogue_entry(archive_data),
+    )
+    # The new archive replaces a legacy JSON archive of the same tabel
+    (output_dir / f"{stem}{LEGACY_ARCHIVE_SUFFIX}").unlink(missing_ok=True)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(archive_data, f, ensure_ascii=False, indent=2)
+    record_archive(filepath, archive_data)
+
+    # Approved archives never change: render their HTML once, up front
+    if is_approved:
+        try:
+            warm_tabel_render_cache(filepath)
+        except Exception as e:
+            logger.warning(f"Failed to warm tabel render cache for {filepath}: {e}")
 
     return filepath
 
@@ -1186,10 +1608,11 @@ def reconstruct_tabel_from_archive(archive_path: Path) -> dict:
     Відновлює дані табеля з архіву.
 
     Args:
-        archive_path: Шлях до JSON архіву
+        archive_path: Шлях до архіву (v2 або JSON v1.0/v1.1)
 
     Returns:
-        dict: Словник з даними для відтворення табеля
+        ArchiveData: Словник з даними для відтворення табеля
+            (raw_data розпаковується лише при зверненні)
             - month: Місяць
             - year: Рік
             - is_correction: Чи корегуючий
@@ -1200,12 +1623,7 @@ def reconstruct_tabel_from_archive(archive_path: Path) -> dict:
             - archived_at: Час архівування
             - is_approved: Чи погоджено
     """
-    import json
-
-    with open(archive_path, 'r', encoding='utf-8') as f:
-        archive_data = json.load(f)
-
-    return archive_data
+    return read_archive(archive_path)
 
 
 def reconstruct_tabel_html_from_archive(archive_data: dict) -> str:
@@ -1291,12 +1709,7 @@ def reconstruct_tabel_html_from_archive(archive_data: dict) -> str:
         title_year = year
 
     # Generate HTML using template
-    if is_correction:
-        env = get_jinja_env_correction()
-    else:
-        env = get_jinja_env()
-
-    template = env.get_template("tabel_template.html")
+    template = get_tabel_template(is_correction)
 
     template_data = {
         "institution_name": settings.get("institution_name", DEFAULT_INSTITUTION_NAME),
@@ -1336,6 +1749,9 @@ def list_tabel_archives(output_dir: Path | None = None) -> list[dict]:
     """
     Повертає список архівів табелів з групуванням по основних табелях.
 
+    Метадані читаються з каталогу архівів (tabel_archive_catalogue), тому
+    файли архівів відкриваються лише якщо вони нові або змінилися.
+
     Структура:
     - main_tabels: Основні табелі (не корегуючі) з вкладеними corrections
     - orphan_corrections: Корегуючі табелі без основного табеля
@@ -1346,7 +1762,6 @@ def list_tabel_archives(output_dir: Path | None = None) -> list[dict]:
     Returns:
         dict: Словник з 'main_tabels' та 'orphan_corrections'
     """
-    import json
     from datetime import datetime
 
     if output_dir is None:
@@ -1355,38 +1770,36 @@ def list_tabel_archives(output_dir: Path | None = None) -> list[dict]:
     if not output_dir.exists():
         return {"main_tabels": [], "orphan_corrections": []}
 
-    # First, collect all archives
+    # Metadata comes from the archive catalogue; payloads are not opened
     all_archives = []
-    for filepath in output_dir.glob("*.json"):
+    for entry in load_catalogue(output_dir):
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
             # Parse archived date
-            archived_at = datetime.fromisoformat(data.get("archived_at", ""))
+            archived_at = datetime.fromisoformat(entry.get("archived_at") or "")
 
             # Build display name
-            month_name = MONTHS_UKR[data["month"] - 1]
-            if data.get("is_correction"):
-                corr_month_name = MONTHS_UKR[data["correction_month"] - 1] if data.get("correction_month") else "?"
-                display_name = f"↳ Корег. ({corr_month_name} {data['correction_year']})"
+            month_name = MONTHS_UKR[entry["month"] - 1]
+            if entry.get("is_correction"):
+                corr_month_name = MONTHS_UKR[entry["correction_month"] - 1] if entry.get("correction_month") else "?"
+                display_name = f"↳ Корег. ({corr_month_name} {entry['correction_year']})"
             else:
-                display_name = f"{month_name} {data['year']}"
+                display_name = f"{month_name} {entry['year']}"
 
             archive_info = {
-                "month": data["month"],
-                "year": data["year"],
-                "is_correction": data.get("is_correction", False),
-                "correction_month": data.get("correction_month"),
-                "correction_year": data.get("correction_year"),
+                "month": entry["month"],
+                "year": entry["year"],
+                "is_correction": entry.get("is_correction", False),
+                "correction_month": entry.get("correction_month"),
+                "correction_year": entry.get("correction_year"),
+                "correction_sequence": entry.get("correction_sequence"),
                 "display_name": display_name,
-                "path": filepath,
+                "path": entry["path"],
                 "archived_at": archived_at,
-                "is_approved": data.get("is_approved", False),
+                "is_approved": entry.get("is_approved", False),
             }
             all_archives.append(archive_info)
-        except (json.JSONDecodeError, KeyError, OSError) as e:
-            logger.warning(f"Failed to read archive {filepath}: {e}")
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            logger.warning(f"Invalid archive catalogue entry {entry.get('path')}: {e}")
             continue
 
     # Sort by archived_at (newest first)
@@ -1427,6 +1840,46 @@ def list_tabel_archives(output_dir: Path | None = None) -> list[dict]:
     }
 
 
+def find_approved_tabel_archive(
+    month: int,
+    year: int,
+    is_correction: bool = False,
+    correction_month: int | None = None,
+    correction_year: int | None = None,
+    output_dir: Path | None = None,
+) -> Path | None:
+    """
+    Знаходить архів погодженого табеля (з каталогу архівів).
+
+    Args:
+        month: Місяць табеля
+        year: Рік табеля
+        is_correction: Корегуючий табель
+        correction_month: Місяць що коригується (None - будь-який)
+        correction_year: Рік що коригується (None - будь-який)
+        output_dir: Директорія з архівами
+
+    Returns:
+        Path | None: Шлях до архіву (для корекцій - остання послідовність) або None
+    """
+    if output_dir is None:
+        output_dir = Path(__file__).parent.parent.parent / "tabel" / "archive"
+
+    matches = [
+        entry for entry in load_catalogue(output_dir)
+        if entry.get("is_approved")
+        and entry.get("month") == month
+        and entry.get("year") == year
+        and bool(entry.get("is_correction")) == is_correction
+        and (correction_month is None or entry.get("correction_month") == correction_month)
+        and (correction_year is None or entry.get("correction_year") == correction_year)
+    ]
+    if not matches:
+        return None
+    latest = max(matches, key=lambda entry: (entry.get("correction_sequence") or 0, entry.get("archived_at") or ""))
+    return Path(latest["path"])
+
+
 def _wrap_tabel_html_for_pdf(html_content: str) -> str:
     """
     Wraps tabel HTML content with proper head and styles for PDF conversion.
@@ -1606,6 +2059,7 @@ def generate_tabel_with_title(
     correction_month: int | None = None,
     correction_year: int | None = None,
     add_title_page: bool = True,
+    generate_html: bool = True,
 ) -> tuple[str, Path, Path | None]:
     """
     Generates a tabel with an optional title page.
@@ -1630,6 +2084,8 @@ def generate_tabel_with_title(
         correction_month: Month being corrected (for correction tabels)
         correction_year: Year being corrected (for correction tabels)
         add_title_page: True to include title page
+        generate_html: False to skip the HTML tabel (body PDF is taken from
+            the approved archive cache); HTML content is then ""
 
     Returns:
         tuple: (HTML content, output PDF path, title_page_pdf_path or None)
@@ -1666,6 +2122,7 @@ def generate_tabel_with_title(
     # Month names
     month_name = MONTHS_UKR[month - 1]
     month_genitive = MONTHS_GENITIVE[month - 1]  # e.g., "січня" for January
+    _, month_days = calendar.monthrange(year, month)
 
     # Generate HTML tabel
     html = generate_tabel_html(
@@ -1677,7 +2134,7 @@ def generate_tabel_with_title(
         is_correction=is_correction,
         correction_month=correction_month,
         correction_year=correction_year,
-    )
+    ) if generate_html else ""
 
     # Create output directory
     output_dir = Path(__file__).parent.parent.parent / "storage" / "tabels"
@@ -1785,11 +2242,16 @@ def get_employees_for_tabel(
     is_correction: bool = False,
     correction_month: int | None = None,
     correction_year: int | None = None,
+    tabel_settings: TabelSettings | None = None,
 ) -> tuple[list[EmployeeData], str, str, str]:
     """
     Retrieves and prepares employee data for the tabel, including responsible persons.
     Handles both normal and correction modes.
 
+    Attendance, processed vacations and tabel settings are bulk-loaded for the
+    whole month (see load_tabel_source_data), so the number of queries does not
+    grow with headcount.
+
     Args:
         db: Database session
         month: Month (1-12)
@@ -1797,6 +2259,7 @@ def get_employees_for_tabel(
         is_correction: True for correction tabel
         correction_month: Month being corrected
         correction_year: Year being corrected
+        tabel_settings: Preloaded tabel settings (loaded from db if None)
 
     Returns:
         tuple: (
@@ -1806,11 +2269,10 @@ def get_employees_for_tabel(
             hr_person: str
         )
     """
-    # Imports are already at module level, but we can verify
-    # from sqlalchemy import or_, and_
-    # from backend.models import Staff, Attendance, Document, DocumentType, DocumentStatus, SystemSettings
-
     employees: list[EmployeeData] = []
+
+    if tabel_settings is None:
+        tabel_settings = load_tabel_settings(db)
     
     # Get days in month
     _, month_days = calendar.monthrange(year, month)
@@ -1822,7 +2284,7 @@ def get_employees_for_tabel(
     hr_person = ""
 
     # Get HR signature from settings
-    hr_employee_id = SystemSettings.get_value(db, "hr_signature_id", None)
+    hr_employee_id = tabel_settings.hr_signature_id
     if hr_employee_id and hr_employee_id not in ("None", "none", ""):
         if str(hr_employee_id).startswith("custom:"):
             custom_name = str(hr_employee_id)[7:]
@@ -1898,39 +2360,16 @@ def get_employees_for_tabel(
                 if responsible_person and department_head:
                     break
 
-            # Group attendance by staff for easy lookup
-            attendance_by_staff = {}
-            for att in correction_attendance:
-                if att.staff_id not in attendance_by_staff:
-                    attendance_by_staff[att.staff_id] = []
-                attendance_by_staff[att.staff_id].append(att)
-
-            # Generate employee data for each staff with corrections
-            for staff in staff_list:
-                attendance = attendance_by_staff.get(staff.id, [])
-
-                # Get vacation documents that overlap with correction period
-                vacations = db.query(Document).filter(
-                    Document.staff_id == staff.id,
-                    Document.doc_type.in_([
-                        DocumentType.VACATION_PAID,
-                        DocumentType.VACATION_UNPAID
-                    ]),
-                    Document.status == DocumentStatus.PROCESSED,
-                    Document.date_end >= month_start,
-                    Document.date_start <= month_end,
-                ).all()
-
-                # Generate correction data for this employee
-                is_new_employee_flag = staff.id in new_staff_ids
-                
-                emp_data = get_employee_data(
-                    staff, month, year,
-                    attendance, vacations, db, 
-                    is_correction=True,
-                    is_new_employee=is_new_employee_flag
-                )
-                employees.append(emp_data)
+            # Only employees whose corrections or vacations changed are rebuilt
+            employees = _build_employees_cached(
+                db, staff_list, month, year, month_start, month_end, month_days,
+                tabel_settings,
+                is_correction=True,
+                correction_month=correction_month,
+                correction_year=correction_year,
+                attendance_records=correction_attendance,
+                new_staff_ids=new_staff_ids,
+            )
 
     else:
         # NORMAL MODE: Get employees whose contract is valid for current month
@@ -1996,34 +2435,14 @@ def get_employees_for_tabel(
             if responsible_person and department_head:
                 break
 
-        for staff in staff_list:
-            # Get attendance records for this month (excluding corrections)
-            attendance = db.query(Attendance).filter(
-                Attendance.staff_id == staff.id,
-                Attendance.date >= month_start,
-                Attendance.date <= month_end,
-                Attendance.is_correction == False,
-            ).all()
-
-            # Get vacation documents with processed status
-            # For locked/approved months, only show vacations that were created/approved BEFORE the lock
-            if is_month_locked:
-                # For approved months, don't show new vacation data
-                # (changes should come through correction mechanism)
-                vacations = []
-            else:
-                vacations = db.query(Document).filter(
-                    Document.staff_id == staff.id,
-                    Document.doc_type.in_([
-                        DocumentType.VACATION_PAID,
-                        DocumentType.VACATION_UNPAID
-                    ]),
-                    Document.status == DocumentStatus.PROCESSED,
-                    Document.date_end >= month_start,
-                    Document.date_start <= month_end,
-                ).all()
-
-            emp_data = get_employee_data(staff, month, year, attendance, vacations, db)
-            employees.append(emp_data)
+        # Attendance (excluding corrections) and processed vacations are loaded
+        # only for employees missing from the cache.
+        # For locked/approved months, don't show new vacation data
+        # (changes should come through correction mechanism)
+        employees = _build_employees_cached(
+            db, staff_list, month, year, month_start, month_end, month_days,
+            tabel_settings,
+            include_vacations=not is_month_locked,
+        )
 
     return employees, responsible_person, department_head, hr_person
@@ -0,0 +1,161 @@
+"""Реєстр Jinja2 середовищ для всіх рендерерів HTML.
+
+Кожне середовище створюється один раз на процес і тримає скомпільовані
+шаблони в пам'яті; байткод зберігається у спільному FileSystemBytecodeCache,
+тому холодний старт не перекомпільовує шаблони з нуля.
+
+Перевірка змін шаблонів на диску (mtime) увімкнена лише в режимі
+налагодження (VM_DEBUG=true).
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Callable
+
+from jinja2 import BaseLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+from backend.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+DESKTOP_TEMPLATES_DIR = PROJECT_ROOT / "desktop" / "templates"
+
+# Імена зареєстрованих середовищ
+TABEL_ENV = "tabel"
+TABEL_CORRECTION_ENV = "tabel_correction"
+DOCUMENTS_ENV = "documents"
+DOCUMENT_FILES_ENV = "document_files"
+WYSIWYG_ENV = "wysiwyg"
+PREVIEW_ENV = "preview"
+
+
+def _documents_loader() -> BaseLoader:
+    """Шаблони документів для веб-рендерера (backend/templates/documents)."""
+    from backend.services.document_renderer import get_templates_dir
+    return FileSystemLoader(str(get_templates_dir()))
+
+
+# name -> (фабрика завантажувача, autoescape)
+ENVIRONMENT_CONFIGS: dict[str, tuple[Callable[[], BaseLoader], bool]] = {
+    TABEL_ENV: (lambda: FileSystemLoader(str(DESKTOP_TEMPLATES_DIR / "tabel")), False),
+    TABEL_CORRECTION_ENV: (
+        lambda: FileSystemLoader(str(DESKTOP_TEMPLATES_DIR / "tabel_corection")),
+        False,
+    ),
+    DOCUMENTS_ENV: (_documents_loader, True),
+    DOCUMENT_FILES_ENV: (lambda: FileSystemLoader(str(DESKTOP_TEMPLATES_DIR / "documents")), False),
+    # WYSIWYG оболонка та шаблони документів (documents/<type>.html)
+    WYSIWYG_ENV: (
+        lambda: FileSystemLoader([
+            str(DESKTOP_TEMPLATES_DIR),
+            str(DESKTOP_TEMPLATES_DIR / "documents"),
+        ]),
+        False,
+    ),
+    PREVIEW_ENV: (lambda: FileSystemLoader(str(DESKTOP_TEMPLATES_DIR)), True),
+}
+
+
+class TemplateRegistry:
+    """
+    Потокобезпечний реєстр Jinja2 середовищ процесу.
+
+    Середовища створюються ліниво при першому зверненні і далі
+    перевикористовуються, тому get_template() повертає вже скомпільований
+    шаблон із кешу середовища.
+    """
+
+    def __init__(
+        self,
+        auto_reload: bool | None = None,
+        bytecode_cache_dir: Path | None = None,
+    ):
+        """
+        Args:
+            auto_reload: Перевіряти mtime шаблонів (за замовчуванням - режим налагодження)
+            bytecode_cache_dir: Директорія байткоду (за замовчуванням - тимчасова директорія)
+        """
+        settings = get_settings()
+        self.auto_reload = settings.debug if auto_reload is None else auto_reload
+        cache_dir = bytecode_cache_dir or settings.template_bytecode_cache_dir
+        if cache_dir is not None:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            self.bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+        else:
+            self.bytecode_cache = FileSystemBytecodeCache()
+        self._environments: dict[str, Environment] = {}
+        self._lock = threading.Lock()
+
+    def get_environment(self, name: str) -> Environment:
+        """
+        Повертає середовище за назвою, створюючи його при першому виклику.
+
+        Args:
+            name: Назва середовища (див. ENVIRONMENT_CONFIGS)
+
+        Returns:
+            Environment: Спільне середовище процесу
+
+        Raises:
+            KeyError: Якщо середовище не зареєстроване
+        """
+        env = self._environments.get(name)
+        if env is not None:
+            return env
+        with self._lock:
+            env = self._environments.get(name)
+            if env is None:
+                loader_factory, autoescape = ENVIRONMENT_CONFIGS[name]
+                env = Environment(
+                    loader=loader_factory(),
+                    autoescape=autoescape,
+                    auto_reload=self.auto_reload,
+                    bytecode_cache=self.bytecode_cache,
+                )
+                self._environments[name] = env
+                logger.debug(f"Jinja environment '{name}' created (auto_reload={self.auto_reload})")
+            return env
+
+    def get_template(self, name: str, template_name: str) -> Template:
+        """
+        Повертає скомпільований шаблон із середовища.
+
+        Args:
+            name: Назва середовища
+            template_name: Ім'я файлу шаблону
+
+        Returns:
+            Template: Скомпільований шаблон
+        """
+        return self.get_environment(name).get_template(template_name)
+
+    def clear(self) -> None:
+        """Скидає всі середовища (шаблони будуть перекомпільовані з байткоду)."""
+        with self._lock:
+            self._environments.clear()
+
+
+_registry: TemplateRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_template_registry() -> TemplateRegistry:
+    """
+    Повертає реєстр шаблонів процесу.
+
+    Returns:
+        TemplateRegistry: Спільний екземпляр реєстру
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = TemplateRegistry()
+    return _registry
+
+
+def get_template(name: str, template_name: str) -> Template:
+    """Скорочення для get_template_registry().get_template()."""
+    return get_template_registry().get_template(name, template_name)
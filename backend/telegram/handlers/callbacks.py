@@ -199,7 +199,7 @@ async def callback_documents_my(callback: CallbackQuery) -> None:
     from backend.core.database import get_db_session
     from backend.models.document import Document
     from sqlalchemy import select, desc
-    from sqlalchemy.orm import joinedload
+    from backend.services.document_list_service import document_list_options
 
     telegram_user_id = str(callback.from_user.id)
     staff = await get_staff_from_telegram(telegram_user_id)
@@ -215,7 +215,7 @@ async def callback_documents_my(callback: CallbackQuery) -> None:
     async for db in get_db_session():
         result = db.execute(
             select(Document)
-            .options(joinedload(Document.staff))
+            .options(*document_list_options())
             .where(Document.staff_id == staff.id)
             .order_by(desc(Document.created_at))
             .limit(20)
@@ -256,7 +256,7 @@ async def callback_documents_today(callback: CallbackQuery) -> None:
     from backend.core.database import get_db_session
     from backend.models.document import Document, DocumentStatus
     from sqlalchemy import select, desc
-    from sqlalchemy.orm import joinedload
+    from backend.services.document_list_service import document_list_options
 
     today = date.today()
     
@@ -266,7 +266,7 @@ async def callback_documents_today(callback: CallbackQuery) -> None:
     async for db in get_db_session():
         result = db.execute(
             select(Document)
-            .options(joinedload(Document.staff))
+            .options(*document_list_options())
             .where(
                 Document.status.in_([
                     DocumentStatus.DRAFT,
@@ -314,14 +314,14 @@ async def callback_documents_stale(callback: CallbackQuery) -> None:
     from backend.core.database import get_db_session
     from backend.models.document import Document, DocumentStatus
     from sqlalchemy import select, desc
-    from sqlalchemy.orm import joinedload
+    from backend.services.document_list_service import document_list_options
 
     stale_threshold = datetime.now() - timedelta(days=1)
 
     async for db in get_db_session():
         result = db.execute(
             select(Document)
-            .options(joinedload(Document.staff))
+            .options(*document_list_options())
             .where(
                 Document.status_changed_at < stale_threshold,
                 Document.status.in_([
@@ -370,7 +370,7 @@ async def callback_docs_page(callback: CallbackQuery) -> None:
     from backend.models.document import Document, DocumentStatus
     from backend.telegram.keyboards import get_document_list_keyboard
     from sqlalchemy import select, desc
-    from sqlalchemy.orm import joinedload
+    from backend.services.document_list_service import document_list_options
 
     # Parse callback: docs_{list_type}_page_{page}
     parts = callback.data.split("_")
@@ -394,7 +394,7 @@ async def callback_docs_page(callback: CallbackQuery) -> None:
 
             result = db.execute(
                 select(Document)
-                .options(joinedload(Document.staff))
+                .options(*document_list_options())
                 .where(Document.staff_id == staff.id)
                 .order_by(desc(Document.date_start))
             )
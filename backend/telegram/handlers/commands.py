@@ -8,7 +8,7 @@ from aiogram import Router
 from aiogram.filters import Command
 from aiogram.types import Message, InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.fsm.context import FSMContext
-from sqlalchemy import select, or_
+from sqlalchemy import select
 
 from backend.models.document import DocumentStatus
 from backend.models.staff import Staff
@@ -566,7 +566,7 @@ async def cmd_search(message: Message, state: FSMContext) -> None:
 async def handle_employee_name_input(message: Message, state: FSMContext) -> None:
     """Handle employee name input and show results."""
     from backend.core.database import get_db_session
-    from sqlalchemy import or_
+    from backend.services.search_service import apply_staff_search
 
     search_name = message.text.strip().lower()
 
@@ -577,16 +577,15 @@ async def handle_employee_name_input(message: Message, state: FSMContext) -> Non
         return
 
     async for db in get_db_session():
-        # Search by name (case-insensitive partial match)
+        # Search by name (full-text, case-insensitive word prefixes)
         result = db.execute(
-            select(Staff)
-            .where(
-                or_(
-                    Staff.pib_nom.ilike(f"%{search_name}%"),
-                    Staff.pib_dav.ilike(f"%{search_name}%"),
-                )
+            apply_staff_search(
+                select(Staff).where(Staff.is_active == True),
+                db,
+                search_name,
+                columns=("pib_nom", "pib_dav"),
+                ranked=True,
             )
-            .where(Staff.is_active == True)
             .order_by(Staff.pib_nom)
         )
         staff_list = result.scalars().all()
@@ -42,12 +42,12 @@ from PyQt6.QtGui import QColor, QTextCharFormat, QBrush
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebChannel import QWebChannel
-from jinja2 import Environment, FileSystemLoader
 from sqlalchemy.orm import joinedload
 
 from shared.enums import DocumentType, DocumentStatus, get_position_label
 from backend.core.database import get_db_context
 from backend.models.settings import SystemSettings
+from backend.services.template_registry import WYSIWYG_ENV, get_template_registry
 from desktop.ui.wysiwyg_bridge import WysiwygBridge, WysiwygEditorState
 
 logger = logging.getLogger(__name__)
@@ -1783,14 +1783,9 @@ class BuilderTab(QWidget):
             base_path = Path(__file__).parent.parent.parent
             templates_dir = base_path / "desktop" / "templates"
 
-            # Set up Jinja2 environment with both template directories
-            env = Environment(
-                loader=FileSystemLoader([
-                    str(templates_dir),                    # For wysiwyg_editor.html
-                    str(templates_dir / "documents")       # For document templates
-                ]),
-                auto_reload=True  # Always reload templates from disk
-            )
+            # Shared environment with both template directories
+            # (templates are re-checked on disk only in debug mode)
+            env = get_template_registry().get_environment(WYSIWYG_ENV)
 
             # Load document-specific template
             doc_type = self._get_doc_type()
@@ -3883,15 +3878,7 @@ class BuilderTab(QWidget):
 
         # Render document
         try:
-            base_path = Path(__file__).parent.parent.parent
-            templates_dir = base_path / "desktop" / "templates"
-            env = Environment(
-                loader=FileSystemLoader([
-                    str(templates_dir),
-                    str(templates_dir / "documents")
-                ]),
-                auto_reload=True
-            )
+            env = get_template_registry().get_environment(WYSIWYG_ENV)
             template = env.get_template(f"documents/{doc_type}.html")
             html_content = template.render(context)
 
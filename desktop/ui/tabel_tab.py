@@ -2,10 +2,7 @@
 
 import calendar
 import logging
-import os
 import shutil
-import subprocess
-import tempfile
 import traceback
 from datetime import date
 from pathlib import Path
@@ -50,6 +47,7 @@ from backend.services.tabel_service import (
     reconstruct_tabel_from_archive,
     reconstruct_tabel_html_from_archive,
     list_tabel_archives,
+    find_approved_tabel_archive,
     MONTHS_UKR,
     populate_title_docx,
     convert_docx_to_pdf,
@@ -57,11 +55,12 @@ from backend.services.tabel_service import (
     DEFAULT_INSTITUTION_NAME,
     DEFAULT_EDRPOU_CODE,
 )
+from backend.services.pdf_renderer import write_pdf
+from backend.services.tabel_render_cache import get_cached_tabel_html, get_tabel_pdf_path
 
 from shared.enums import get_position_label
+from shared.exceptions import DocumentGenerationError
 
-# WeasyPrint executable path
-WEASYPRINT_EXE = Path(__file__).parent.parent.parent / 'weasyprint' / 'dist' / 'weasyprint.exe'
 
 # CSS content embedded directly (instead of external sheet.css)
 TABEL_CSS = """/* Tabel (Timesheet) Styles - Ukrainian Government Form P-5 */
@@ -345,28 +344,11 @@ def _wrap_tabel_html_for_pdf(content_html: str) -> str:
 
 
 def _generate_pdf_with_weasyprint(html_content: str, output_path: Path) -> None:
-    """Генерує PDF з HTML контенту використовуючи WeasyPrint."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-        f.write(html_content)
-        html_path = f.name
-
+    """Генерує PDF з HTML контенту використовуючи WeasyPrint (спільний пул рендерингу)."""
     try:
-        if not os.path.exists(WEASYPRINT_EXE):
-            raise RuntimeError(f"WeasyPrint not found at: {WEASYPRINT_EXE}")
-
-        result = subprocess.run(
-            [WEASYPRINT_EXE, html_path, str(output_path)],
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        if result.returncode != 0:
-            raise RuntimeError(f"WeasyPrint failed: {result.stderr or 'Unknown error'}")
-
-    finally:
-        if os.path.exists(html_path):
-            os.remove(html_path)
+        write_pdf(html_content, output_path)
+    except DocumentGenerationError as e:
+        raise RuntimeError(str(e)) from e
 
 
 class TabelTab(QWidget):
@@ -711,12 +693,15 @@ class TabelTab(QWidget):
         self._load_tabel()
         self._check_show_warning()
 
-    def _open_archive_in_new_tab(self, archive_data: dict, display_name: str) -> int:
+    def _open_archive_in_new_tab(
+        self, archive_data: dict, display_name: str, archive_path: Path | None = None
+    ) -> int:
         """Open an archived tabel in a new tab.
 
         Args:
             archive_data: Archive data dictionary
             display_name: Name to show on tab
+            archive_path: Archive file; if given, HTML comes from the render cache
 
         Returns:
             int: Index of the new tab
@@ -730,8 +715,11 @@ class TabelTab(QWidget):
             web_view.sizePolicy().Policy.Expanding
         )
 
-        # Generate HTML from archive
-        html = reconstruct_tabel_html_from_archive(archive_data)
+        # Archived tabels are immutable: read cached HTML, render only on first open
+        if archive_path is not None:
+            html, _ = get_cached_tabel_html(Path(archive_path))
+        else:
+            html = reconstruct_tabel_html_from_archive(archive_data)
 
         # Set HTML with template directory
         template_dir = Path(__file__).parent.parent / "templates" / "tabel"
@@ -1252,7 +1240,7 @@ class TabelTab(QWidget):
         full_archive_data = reconstruct_tabel_from_archive(archive_path)
 
         # Open in new tab
-        self._open_archive_in_new_tab(full_archive_data, display_name)
+        self._open_archive_in_new_tab(full_archive_data, display_name, archive_path)
 
     def _get_days_in_month(self) -> int:
         """Get number of days in current month."""
@@ -1451,6 +1439,24 @@ class TabelTab(QWidget):
         self._print_filepath = filepath
         self._do_print_pdf()
 
+    def _cached_approved_tabel_pdf(self) -> Path | None:
+        """PDF погодженого табеля з кешу архіву (None - місяць не погоджено або без архіву)."""
+        # Archived tabel is rendered without page splitting
+        if self.EMPLOYEES_PER_PAGE > 0:
+            return None
+        try:
+            archive_path = find_approved_tabel_archive(
+                self._current_month,
+                self._current_year,
+                is_correction=self._is_correction,
+                correction_month=self._current_correction_month if self._is_correction else None,
+                correction_year=self._current_correction_year if self._is_correction else None,
+            )
+            return get_tabel_pdf_path(archive_path) if archive_path is not None else None
+        except Exception as e:
+            logger.warning(f"Cached tabel PDF is unavailable, printing web view: {e}")
+            return None
+
     def _do_print_pdf(self) -> None:
         """Actually print to PDF with optional title page from DOCX."""
         import traceback
@@ -1504,10 +1510,15 @@ class TabelTab(QWidget):
 
             # Step 1: Capture web view PDF to temp file
             tabel_pdf_path = temp_dir / "tabel.pdf"
-            self.web_view.page().printToPdf(
-                str(tabel_pdf_path),
-                page_layout
-            )
+            cached_pdf_path = self._cached_approved_tabel_pdf()
+            if cached_pdf_path is not None:
+                # Approved month: the archived tabel PDF is already rendered
+                shutil.copyfile(cached_pdf_path, tabel_pdf_path)
+            else:
+                self.web_view.page().printToPdf(
+                    str(tabel_pdf_path),
+                    page_layout
+                )
 
             # Wait for PDF to be generated (Qt6 printToPdf is async)
             # from PyQt6.QtWidgets import QApplication  # Already imported at top
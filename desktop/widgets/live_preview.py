@@ -3,10 +3,9 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtCore import pyqtSignal
-from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from backend.services.template_registry import PREVIEW_ENV, get_template_registry
 
 
 class LivePreviewWidget(QWidget):
@@ -27,12 +26,8 @@ class LivePreviewWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self.web_view)
 
-        # Jinja2 для HTML шаблонів
-        templates_dir = Path(__file__).parent.parent / "templates"
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(templates_dir)),
-            autoescape=True,
-        )
+        # Спільне Jinja2 середовище для HTML шаблонів (desktop/templates)
+        self.jinja_env = get_template_registry().get_environment(PREVIEW_ENV)
 
     def render_preview(self, context: dict[str, Any]):
         """
@@ -0,0 +1,56 @@
+"""Unit тести для формату архівів."""
+
+import json
+
+from backend.services import archive_format
+from backend.services.archive_format import (
+    ArchiveData,
+    read_archive,
+    read_archive_meta,
+    write_archive,
+)
+
+ARCHIVE = {
+    "version": "2.0",
+    "month": 3,
+    "year": 2025,
+    "employees": [{"pib": "Тестовий Т.Т.", "days": ["Р"] * 31}],
+    "raw_data": {"attendance": [{"code": "ВД", "date": "2025-03-03"}] * 200},
+}
+
+
+def test_round_trip_with_lazy_raw_data(tmp_path, monkeypatch):
+    """raw_data розпаковується лише при першому зверненні."""
+    path = write_archive(
+        tmp_path / "a.vmarc", ARCHIVE, lazy_sections=("raw_data",), meta={"month": 3},
+    )
+    assert path.stat().st_size < len(json.dumps(ARCHIVE, ensure_ascii=False).encode())
+
+    decoded = []
+    original = archive_format._decode_section
+    monkeypatch.setattr(
+        archive_format, "_decode_section", lambda blob: decoded.append(blob) or original(blob),
+    )
+
+    data = read_archive(path)
+    assert isinstance(data, ArchiveData)
+    assert data["employees"] == ARCHIVE["employees"]
+    assert "raw_data" in data and data.pending_sections == ("raw_data",)
+    assert len(decoded) == 1
+
+    assert data.get("raw_data") == ARCHIVE["raw_data"]
+    assert len(decoded) == 2
+    assert data.load_all() == ARCHIVE
+    assert read_archive_meta(path) == {"month": 3}
+
+
+def test_reads_legacy_json_archive(tmp_path):
+    """Старі JSON архіви (v1.1, indent=2) відкриваються тим самим читачем."""
+    legacy = {**ARCHIVE, "version": "1.1"}
+    path = tmp_path / "legacy.json"
+    path.write_text(json.dumps(legacy, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    data = read_archive(path)
+
+    assert data.load_all() == legacy
+    assert data.pending_sections == ()
@@ -0,0 +1,103 @@
+"""Unit тести для контентно-адресованого сховища файлів."""
+
+import hashlib
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from backend.models.blob import StoredBlob
+from backend.models.document import Document
+from backend.models.staff import Staff
+from backend.services.blob_store import BlobStore, blob_sha256
+from shared.enums import DocumentType, EmploymentType, WorkBasis
+
+
+@pytest.fixture
+def documents(db_session):
+    staff = Staff(
+        pib_nom="Шевченко Тарас Григорович",
+        rate=Decimal("1.0"),
+        position="доцент",
+        employment_type=EmploymentType.MAIN,
+        work_basis=WorkBasis.CONTRACT,
+        term_start=date(2025, 1, 1),
+        term_end=date(2027, 12, 31),
+    )
+    db_session.add(staff)
+    db_session.flush()
+    docs = [
+        Document(
+            staff_id=staff.id,
+            doc_type=DocumentType.VACATION_PAID,
+            date_start=date(2026, 7, 1),
+            date_end=date(2026, 7, 14),
+            days_count=14,
+        )
+        for _ in range(2)
+    ]
+    db_session.add_all(docs)
+    db_session.commit()
+    return docs
+
+
+@pytest.fixture
+def store(db_session, tmp_path):
+    return BlobStore(db_session, root=tmp_path / "blobs")
+
+
+def test_identical_content_is_stored_once(store, documents, db_session, tmp_path, monkeypatch):
+    data = b"%PDF-1.4 scan"
+    first = store.attach(documents[0], "file_scan_path", store.put_bytes(data, ".PDF"))
+
+    sha256 = hashlib.sha256(data).hexdigest()
+    assert first == tmp_path / "blobs" / sha256[:2] / sha256[2:4] / f"{sha256}.pdf"
+    assert blob_sha256(first) == sha256
+    assert blob_sha256(tmp_path / "2026" / "scan.pdf") is None
+
+    # Повторне збереження того самого вмісту не пише на диск
+    monkeypatch.setattr("backend.services.blob_store._write_atomic", pytest.fail)
+    second = store.attach(documents[1], "file_scan_path", store.put_bytes(data, ".pdf"))
+    store.attach(documents[1], "file_scan_path", store.put_bytes(data, ".pdf"))
+    db_session.commit()
+
+    assert second == first
+    assert db_session.get(StoredBlob, sha256).ref_count == 2
+
+
+def test_put_file_moves_staged_upload(store, tmp_path):
+    source = tmp_path / "upload.jpg"
+    source.write_bytes(b"jpeg")
+    duplicate = tmp_path / "again.jpg"
+    duplicate.write_bytes(b"jpeg")
+
+    blob = store.put_file(source, move=True)
+    assert store.put_file(duplicate, move=True) is blob
+
+    assert store.path(blob).read_bytes() == b"jpeg"
+    assert store.path(blob).suffix == ".jpg"
+    assert not source.exists() and not duplicate.exists()
+
+
+def test_garbage_collection_uses_document_references(store, documents, db_session):
+    kept = store.attach(documents[0], "file_docx_path", store.put_bytes(b"kept", ".pdf"))
+    replaced = store.attach(documents[1], "file_docx_path", store.put_bytes(b"old", ".pdf"))
+    store.attach(documents[1], "file_docx_path", store.put_bytes(b"new", ".pdf"))
+    db_session.commit()
+    assert db_session.get(StoredBlob, blob_sha256(replaced)).ref_count == 0
+
+    # Документ видалено напряму - лічильник завищений, але GC його перераховує
+    db_session.delete(documents[0])
+    db_session.commit()
+    orphan = store.root / "ab" / "cd" / ("abcd" + "0" * 60 + ".pdf")
+    orphan.parent.mkdir(parents=True)
+    orphan.write_bytes(b"orphan")
+
+    report = store.collect_garbage(min_age=timedelta(hours=1))
+    assert report.deleted == [] and report.recounted == 1
+
+    report = store.collect_garbage(min_age=timedelta(0))
+    assert sorted(report.deleted) == sorted([str(kept), str(replaced)])
+    assert report.orphan_files == [str(orphan)]
+    assert not kept.exists() and not replaced.exists() and not orphan.exists()
+    assert db_session.query(StoredBlob).count() == 1
@@ -0,0 +1,113 @@
+"""Unit тести для масового створення документів."""
+
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+
+from backend.models.document import Document
+from backend.models.staff import Staff
+from backend.services import bulk_document_service
+from backend.services.bulk_document_service import BulkDocumentService
+from shared.enums import DocumentStatus, DocumentType, EmploymentType, WorkBasis
+
+
+@pytest.fixture
+def staff_list(db_session):
+    staff = [
+        Staff(
+            pib_nom=f"Петренко{i} Петро Петрович",
+            rate=Decimal("1.0"),
+            position="доцент",
+            employment_type=EmploymentType.MAIN,
+            work_basis=WorkBasis.CONTRACT,
+            term_start=date(2025, 1, 1),
+            term_end=date(2027, 12, 31),
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(staff)
+    db_session.commit()
+    return staff
+
+
+@pytest.fixture
+def service(db_session, tmp_path):
+    service = BulkDocumentService(db_session, grammar=None)
+    service.storage_dir = tmp_path
+    return service
+
+
+@pytest.fixture
+def commits(db_session):
+    count = []
+    event.listen(db_session, "after_commit", lambda session: count.append(1))
+    return count
+
+
+def test_batch_is_created_in_one_transaction(service, staff_list, commits, tmp_path):
+    report = service.generate_batch(staff_list, "vacation_paid", date(2026, 7, 1), date(2026, 7, 14))
+
+    assert len(commits) == 1
+    assert [item.staff_id for item in report.items] == [staff.id for staff in staff_list]
+    assert all(item.success for item in report.items)
+    assert [document.id for document in report.documents] == [item.document_id for item in report.items]
+
+    document = report.documents[0]
+    assert document.doc_type == DocumentType.VACATION_PAID
+    assert document.status == DocumentStatus.DRAFT
+    assert document.days_count == 14
+    assert document.payment_period == "перша половина"
+    assert document.file_docx_path == str(tmp_path / "2026" / "липень" / "чернетки" / "Петренко0 П.П. відпустка липень 14 днів.pdf")
+    assert (tmp_path / "2026" / "липень" / "чернетки").is_dir()
+
+
+def test_large_batch_is_committed_in_chunks(service, staff_list, commits, db_session):
+    report = service.generate_batch(
+        staff_list, "vacation_paid", date(2026, 7, 1), date(2026, 7, 14), chunk_size=2,
+    )
+
+    assert len(commits) == 3
+    assert len(report.documents) == 5
+    assert db_session.query(Document).count() == 5
+
+
+def test_report_contains_per_staff_failures(service, staff_list):
+    broken = SimpleNamespace(id=999, pib_nom=None)
+    progress = []
+
+    report = service.generate_batch(
+        [staff_list[0], broken], "vacation_paid", date(2026, 7, 20), date(2026, 7, 21),
+        on_progress=lambda staff, document, error: progress.append((staff.id, error is None)),
+    )
+
+    assert [item.success for item in report.items] == [True, False]
+    assert report.failed[0].staff_id == 999 and report.failed[0].error
+    assert report.to_dict()["generated_count"] == 1
+    assert sorted(progress) == [(staff_list[0].id, True), (999, False)]
+
+
+def test_pdfs_are_rendered_after_the_inserts(service, staff_list, monkeypatch, db_session):
+    rendered = []
+
+    def fake_render(html):
+        rendered.append(html)
+        return b"%PDF-same"
+
+    monkeypatch.setattr(bulk_document_service, "render_pdf", fake_render)
+    report = service.generate_batch(staff_list[:2], "vacation_paid", date(2026, 7, 1), date(2026, 7, 14))
+
+    service.render_batch_pdfs(report, max_workers=2)
+
+    assert len(rendered) == 2 and all("<html" in html for html in rendered)
+    # Однаковий вміст - один файл сховища на обидва документи
+    paths = {item.file_path for item in report.items}
+    assert len(paths) == 1
+    assert Path(paths.pop()).read_bytes() == b"%PDF-same"
+    db_session.expire_all()
+    documents = db_session.query(Document).all()
+    assert all(document.rendered_html for document in documents)
+    assert {document.file_docx_path for document in documents} == {report.items[0].file_path}
@@ -0,0 +1,119 @@
+"""Unit тести для пакетної валідації масового створення документів."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from backend.models.attendance import Attendance
+from backend.models.document import Document
+from backend.models.staff import Staff
+from backend.services.bulk_validation import (
+    IntervalIndex,
+    ValidationTokenStore,
+    validate_batch,
+    validation_key,
+)
+from shared.enums import DocumentStatus, DocumentType, EmploymentType, WorkBasis
+
+
+@pytest.fixture
+def staff_list(db_session):
+    staff = [
+        Staff(
+            pib_nom=f"Коваленко{i} Іван Іванович",
+            rate=Decimal("1.0"),
+            position="доцент",
+            employment_type=EmploymentType.MAIN,
+            work_basis=WorkBasis.CONTRACT,
+            term_start=date(2025, 1, 1),
+            term_end=date(2027, 12, 31),
+            vacation_balance=30,
+        )
+        for i in range(4)
+    ]
+    db_session.add_all(staff)
+    db_session.commit()
+
+    def document(staff, start, end, status):
+        return Document(
+            staff_id=staff.id,
+            doc_type=DocumentType.VACATION_PAID,
+            date_start=start,
+            date_end=end,
+            days_count=(end - start).days + 1,
+            status=status,
+        )
+
+    db_session.add_all([
+        # Активний документ, що перетинається
+        document(staff[0], date(2026, 7, 10), date(2026, 7, 20), DocumentStatus.AGREED),
+        # Оброблений документ не блокує
+        document(staff[1], date(2026, 7, 10), date(2026, 7, 20), DocumentStatus.PROCESSED),
+        # Активний документ поза періодом
+        document(staff[1], date(2026, 8, 1), date(2026, 8, 5), DocumentStatus.DRAFT),
+        # Лікарняний діапазоном, що починається до періоду
+        Attendance(staff_id=staff[2].id, date=date(2026, 6, 25), date_end=date(2026, 7, 2), code="Л"),
+        # Робочі дні (у тому числі неповний день і вечірні години) не блокують
+        Attendance(staff_id=staff[3].id, date=date(2026, 7, 3), code="Р"),
+        Attendance(staff_id=staff[3].id, date=date(2026, 7, 6), code="РС"),
+        Attendance(staff_id=staff[3].id, date=date(2026, 7, 7), code="ВЧ"),
+    ])
+    db_session.commit()
+    return staff
+
+
+def test_interval_index_finds_overlaps_by_bisect():
+    index = IntervalIndex([
+        (date(2026, 1, 1), date(2026, 12, 31), "year"),
+        (date(2026, 3, 1), date(2026, 3, 5), "march"),
+        (date(2026, 7, 1), date(2026, 7, 14), "july"),
+    ])
+
+    assert index.overlapping(date(2026, 3, 5), date(2026, 3, 10)) == ["year", "march"]
+    assert index.overlapping(date(2026, 7, 14), date(2026, 7, 14)) == ["year", "july"]
+    assert index.overlapping(date(2027, 1, 1), date(2027, 1, 2)) == []
+    assert IntervalIndex().overlapping(date(2026, 1, 1), date(2026, 1, 2)) == []
+
+
+def test_validate_batch_uses_two_queries(db_session, staff_list):
+    for staff in staff_list:
+        db_session.refresh(staff)
+    statements = []
+    event.listen(db_session.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    result = validate_batch(db_session, staff_list, date(2026, 7, 1), date(2026, 7, 14))
+
+    assert len(statements) == 2
+    assert [staff.id for staff in result["valid"]] == [staff_list[1].id, staff_list[3].id]
+    reasons = {item["staff"].id: item["reasons"] for item in result["invalid"]}
+    assert reasons[staff_list[0].id][0].startswith("Перетин з існуючим документом #")
+    assert reasons[staff_list[2].id] == ["Перетин з записом відвідуваності 'Л' від 25.06.2026"]
+
+
+def test_validation_token_is_one_shot_and_bound_to_params(db_session, staff_list):
+    store = ValidationTokenStore()
+    period = (date(2026, 7, 1), date(2026, 7, 14))
+    result = validate_batch(db_session, staff_list, *period)
+    key = validation_key((staff.id for staff in staff_list), *period)
+
+    token = store.issue(key, result)
+    other_key = validation_key((staff.id for staff in staff_list), date(2026, 7, 2), period[1])
+    assert store.consume(token, other_key, staff_list) is None
+
+    token = store.issue(key, result)
+    cached = store.consume(token, key, staff_list)
+    assert cached["valid"] == result["valid"]
+    assert [item["reasons"] for item in cached["invalid"]] == [item["reasons"] for item in result["invalid"]]
+    assert store.consume(token, key, staff_list) is None
+
+
+def test_validation_token_expires(db_session, staff_list):
+    store = ValidationTokenStore(ttl=0)
+    key = validation_key([staff_list[0].id], date(2026, 7, 1), date(2026, 7, 14))
+
+    token = store.issue(key, {"valid": [staff_list[0]], "invalid": []})
+
+    assert store.consume(token, key, staff_list) is None
@@ -0,0 +1,80 @@
+"""Unit тести для запитів списків документів."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, select
+
+from backend.models.document import Document
+from backend.models.staff import Staff
+from backend.services.document_list_service import document_list_options, parse_list_fields
+from shared.enums import DocumentType, EmploymentType, WorkBasis
+
+
+@pytest.fixture
+def documents(db_session):
+    """Документи трьох працівників з великими полями."""
+    for i in range(3):
+        staff = Staff(
+            pib_nom=f"Працівник{i} Тест Тестович",
+            rate=Decimal("1.0"),
+            position="доцент",
+            employment_type=EmploymentType.MAIN,
+            work_basis=WorkBasis.CONTRACT,
+            term_start=date(2025, 1, 1),
+            term_end=date(2026, 12, 31),
+        )
+        db_session.add(staff)
+        db_session.flush()
+        for _ in range(2):
+            db_session.add(Document(
+                staff_id=staff.id,
+                doc_type=DocumentType.VACATION_PAID,
+                date_start=date(2026, 7, 1),
+                date_end=date(2026, 7, 14),
+                days_count=14,
+                rendered_html="<html>" + "x" * 1000 + "</html>",
+                editor_content="content",
+            ))
+    db_session.commit()
+    db_session.expunge_all()
+
+
+def test_list_query_defers_blobs_and_batches_staff(db_session, documents):
+    """Список: великі колонки не завантажуються, працівники - одним запитом."""
+    statements = []
+    engine = db_session.get_bind()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        docs = db_session.execute(
+            select(Document).options(*document_list_options()).order_by(Document.id)
+        ).scalars().all()
+        names = [doc.staff.pib_nom for doc in docs]
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len(names) == 6
+    assert len(statements) == 2
+    assert "rendered_html" not in statements[0]
+    assert "editor_content" not in statements[0]
+
+
+def test_requested_fields_are_loaded(db_session, documents):
+    """Поля з fields= завантажуються основним запитом."""
+    doc = db_session.execute(
+        select(Document).options(*document_list_options(parse_list_fields("content")))
+    ).scalars().first()
+
+    assert "editor_content" in doc.__dict__
+    assert "rendered_html" not in doc.__dict__
+
+
+def test_unknown_field_rejected():
+    """Невідоме поле - помилка."""
+    with pytest.raises(ValueError):
+        parse_list_fields("rendered_html,password")
@@ -0,0 +1,101 @@
+"""Unit тести для кешу HTML документів."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from backend.models.document import Document
+from backend.models.settings import SystemSettings
+from backend.models.staff import Staff
+from backend.services import document_render_cache as cache_module
+from backend.services.document_render_cache import (
+    document_render_cache,
+    get_rendered_html,
+    refresh_rendered_html,
+    render_context_version,
+)
+from shared.enums import DocumentType, EmploymentType, WorkBasis
+
+
+@pytest.fixture
+def document(db_session):
+    """Документ з працівником."""
+    document_render_cache.clear()
+    staff = Staff(
+        pib_nom="Іванов Іван Іванович",
+        rate=Decimal("1.0"),
+        position="доцент",
+        employment_type=EmploymentType.MAIN,
+        work_basis=WorkBasis.CONTRACT,
+        term_start=date(2025, 1, 1),
+        term_end=date(2026, 12, 31),
+    )
+    db_session.add(staff)
+    db_session.flush()
+    doc = Document(
+        staff_id=staff.id,
+        doc_type=DocumentType.VACATION_PAID,
+        date_start=date(2026, 7, 1),
+        date_end=date(2026, 7, 14),
+        days_count=14,
+    )
+    db_session.add(doc)
+    db_session.commit()
+    yield doc
+    document_render_cache.clear()
+
+
+@pytest.fixture
+def render_calls(monkeypatch):
+    """Підраховує фактичні рендеринги."""
+    calls = []
+    original = cache_module.render_document
+
+    def counting_render(document, db):
+        calls.append(document.id)
+        return original(document, db)
+
+    monkeypatch.setattr(cache_module, "render_document", counting_render)
+    return calls
+
+
+def test_stored_html_is_served_without_rendering(db_session, document, render_calls):
+    """Збережений HTML з актуальним відбитком віддається без рендерингу."""
+    html = refresh_rendered_html(document, db_session)
+    db_session.commit()
+    document_render_cache.clear()
+    render_calls.clear()
+
+    assert get_rendered_html(document, db_session) == html
+    assert render_calls == []
+
+
+def test_stale_entry_rerendered_once_without_db_write(db_session, document, render_calls):
+    """Зміна налаштувань робить HTML застарілим; новий рендер кешується в процесі, а не в БД."""
+    refresh_rendered_html(document, db_session)
+    db_session.commit()
+    stored_fingerprint = document.rendered_html_fingerprint
+
+    SystemSettings.set_value(db_session, "dept_abbr", "КІТ")
+    db_session.commit()
+    render_calls.clear()
+
+    context_version = render_context_version(db_session)
+    html = get_rendered_html(document, db_session, context_version)
+    assert "КІТ" in html
+    assert get_rendered_html(document, db_session, context_version) == html
+    assert render_calls == [document.id]
+
+    assert document.rendered_html_fingerprint == stored_fingerprint
+    assert not db_session.dirty
+
+
+def test_staff_change_invalidates_fingerprint(db_session, document):
+    """Зміна ПІБ працівника змінює відбиток документа."""
+    context_version = render_context_version(db_session)
+    before = cache_module.document_fingerprint(document, context_version)
+
+    document.staff.pib_nom = "Петров Петро Петрович"
+
+    assert cache_module.document_fingerprint(document, context_version) != before
@@ -0,0 +1,87 @@
+"""Unit тести для рендерингу документів."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from backend.models.document import Document
+from backend.models.settings import Approvers, SystemSettings
+from backend.models.staff import Staff
+from backend.services.document_renderer import get_render_context, render_document
+from shared.enums import DocumentType, EmploymentType, WorkBasis
+
+
+def _staff(pib_nom: str, position: str = "доцент") -> Staff:
+    return Staff(
+        pib_nom=pib_nom,
+        rate=Decimal("1.0"),
+        position=position,
+        employment_type=EmploymentType.MAIN,
+        work_basis=WorkBasis.CONTRACT,
+        term_start=date(2025, 1, 1),
+        term_end=date(2026, 12, 31),
+    )
+
+
+@pytest.fixture
+def documents(db_session):
+    """Документи кількох працівників, завідувач кафедри і погоджувач."""
+    head = _staff("Петренко Петро Петрович", "завідувач кафедри")
+    db_session.add(head)
+    db_session.add(Approvers(position_name="Проректор", full_name_dav="Сидоренку С.С.", order_index=1))
+    db_session.flush()
+    SystemSettings.set_value(db_session, "dept_head_id", head.id)
+    SystemSettings.set_value(db_session, "dept_abbr", "КІТ")
+
+    for i in range(10):
+        staff = _staff(f"Працівник{i} Тест Тестович")
+        db_session.add(staff)
+        db_session.flush()
+        doc = Document(
+            staff_id=staff.id,
+            doc_type=DocumentType.VACATION_PAID,
+            date_start=date(2026, 7, 1),
+            date_end=date(2026, 7, 14),
+            days_count=14,
+        )
+        db_session.add(doc)
+    db_session.commit()
+    return db_session.query(Document).order_by(Document.id).all()
+
+
+@pytest.fixture
+def count_queries(db_session):
+    """Лічильник SQL запитів сесії."""
+    statements = []
+    engine = db_session.get_bind()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def test_rendering_many_documents_costs_constant_queries(db_session, documents, count_queries):
+    """Налаштування та погоджувачі завантажуються один раз на сесію, а не на документ."""
+    for doc in documents:
+        doc.staff  # noqa: B018 - staff is loaded by the list query in real use
+    count_queries.clear()
+
+    htmls = [render_document(doc, db_session) for doc in documents]
+
+    assert len(count_queries) == 3
+    assert all("КІТ" in html and "ПЕТРЕНКО" in html for html in htmls)
+
+
+def test_render_context_invalidated_on_settings_change(db_session, documents):
+    """Зміна налаштувань скидає знімок контексту."""
+    assert get_render_context(db_session).settings["dept_abbr"] == "КІТ"
+
+    SystemSettings.set_value(db_session, "dept_abbr", "ІТ")
+    db_session.flush()
+
+    assert get_render_context(db_session).settings["dept_abbr"] == "ІТ"
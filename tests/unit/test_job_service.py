@@ -0,0 +1,116 @@
+"""Unit тести для черги фонових задач генерації."""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.models.generation_job import GenerationJob, JobStatus
+from backend.services.job_service import JobQueue, job_handler
+
+release = threading.Event()
+
+
+@job_handler("test_items")
+def run_test_items(ctx):
+    items = ctx.params["items"]
+    ctx.set_total(len(items))
+    for item in items:
+        if item < 0:
+            ctx.advance({"item": item}, error="negative")
+        else:
+            ctx.advance({"item": item * 2})
+    return {"count": len(items)}
+
+
+@job_handler("test_fail")
+def run_test_fail(ctx):
+    raise RuntimeError("boom")
+
+
+@job_handler("test_blocking")
+def run_test_blocking(ctx):
+    release.wait(5)
+    return {}
+
+
+@pytest.fixture
+def session_factory(temp_db):
+    engine = create_engine(temp_db, connect_args={"check_same_thread": False})
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture
+def queue(session_factory):
+    queue = JobQueue(session_factory=session_factory, workers=1)
+    yield queue
+    release.set()
+    queue.shutdown(wait=True)
+
+
+def wait_for(session_factory, job_id: int, timeout: float = 5) -> GenerationJob:
+    deadline = time.monotonic() + timeout
+    while True:
+        with session_factory() as db:
+            job = db.get(GenerationJob, job_id)
+            if not job.status.is_active or time.monotonic() > deadline:
+                return job
+        time.sleep(0.02)
+
+
+def test_job_reports_progress_and_partial_results(queue, session_factory):
+    with session_factory() as db:
+        job, created = queue.submit(db, "test_items", {"items": [1, -1, 3]})
+
+    job = wait_for(session_factory, job.id)
+
+    assert created
+    assert job.status == JobStatus.SUCCEEDED
+    assert (job.progress_done, job.progress_total) == (3, 3)
+    assert job.results == [{"item": 2}, {"item": -1, "error": "negative"}, {"item": 6}]
+    assert job.result == {"count": 3}
+
+
+def test_failed_job_stores_error(queue, session_factory):
+    with session_factory() as db:
+        job, _ = queue.submit(db, "test_fail", {})
+
+    job = wait_for(session_factory, job.id)
+
+    assert job.status == JobStatus.FAILED
+    assert job.error == "boom"
+
+
+def test_active_duplicate_is_deduplicated(queue, session_factory):
+    release.clear()
+    with session_factory() as db:
+        first, _ = queue.submit(db, "test_blocking", {}, dedup_key="doc:1")
+        second, created = queue.submit(db, "test_blocking", {}, dedup_key="doc:1")
+        other, other_created = queue.submit(db, "test_blocking", {}, dedup_key="doc:2")
+
+    assert second.id == first.id and not created
+    assert other.id != first.id and other_created
+
+    release.set()
+    assert wait_for(session_factory, first.id).status == JobStatus.SUCCEEDED
+    # A finished job does not block a new submission
+    with session_factory() as db:
+        third, created = queue.submit(db, "test_blocking", {}, dedup_key="doc:1")
+    assert created and third.id != first.id
+
+
+def test_unknown_job_kind_is_rejected(queue, session_factory):
+    with session_factory() as db, pytest.raises(ValueError):
+        queue.submit(db, "no_such_job", {})
+
+
+def test_recover_requeues_unfinished_jobs(queue, session_factory):
+    with session_factory() as db:
+        job = GenerationJob(kind="test_items", params={"items": [1]}, status=JobStatus.RUNNING)
+        db.add(job)
+        db.commit()
+
+    assert queue.recover() == 1
+    assert wait_for(session_factory, job.id).status == JobStatus.SUCCEEDED
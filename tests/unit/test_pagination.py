@@ -0,0 +1,73 @@
+"""Unit тести для keyset пагінації."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from backend.core.pagination import InvalidCursorError, paginate
+from backend.models.document import Document
+from backend.models.staff import Staff
+from shared.enums import DocumentType, EmploymentType, WorkBasis
+
+SORT_KEY = ((Document.created_at, True), (Document.id, True))
+
+
+@pytest.fixture
+def documents(db_session):
+    """11 документів, частина з однаковим created_at (у тому числі func.now() без мікросекунд)."""
+    staff = Staff(
+        pib_nom="Іванов Іван Іванович",
+        rate=Decimal("1.0"),
+        position="доцент",
+        employment_type=EmploymentType.MAIN,
+        work_basis=WorkBasis.CONTRACT,
+        term_start=date(2025, 1, 1),
+        term_end=date(2026, 12, 31),
+    )
+    db_session.add(staff)
+    db_session.flush()
+    for i in range(11):
+        doc = Document(
+            staff_id=staff.id,
+            doc_type=DocumentType.VACATION_PAID,
+            date_start=date(2026, 7, 1),
+            date_end=date(2026, 7, 14),
+            days_count=14,
+        )
+        if i < 6:
+            doc.created_at = datetime(2026, 1, 1 + i // 3, 12, 0, 0)
+        db_session.add(doc)
+    db_session.commit()
+
+
+def test_cursor_pages_match_offset_order(db_session, documents):
+    """Прохід курсорами дає той самий порядок, що й OFFSET, без пропусків і дублікатів."""
+    expected, _ = paginate(db_session.query(Document), SORT_KEY, limit=100)
+
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = paginate(db_session.query(Document), SORT_KEY, limit=4, cursor=cursor)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert [doc.id for doc in seen] == [doc.id for doc in expected]
+    assert len(seen) == 11
+
+
+def test_skip_mode_returns_next_cursor(db_session, documents):
+    """Старий режим skip/limit також повертає курсор наступної сторінки."""
+    first, cursor = paginate(db_session.query(Document), SORT_KEY, limit=4, skip=4)
+    second, _ = paginate(db_session.query(Document), SORT_KEY, limit=4, cursor=cursor)
+    by_offset, _ = paginate(db_session.query(Document), SORT_KEY, limit=4, skip=8)
+
+    assert [doc.id for doc in second] == [doc.id for doc in by_offset]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "WzFd"])
+def test_invalid_cursor(db_session, cursor):
+    """Пошкоджений курсор - InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        paginate(db_session.query(Document), SORT_KEY, limit=4, cursor=cursor)
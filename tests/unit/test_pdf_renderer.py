@@ -0,0 +1,95 @@
+"""Unit тести для пулу рендерингу PDF."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from backend.services import pdf_renderer
+from backend.services.pdf_renderer import (
+    FallbackPdfBackend,
+    PdfBackend,
+    PdfQueueFullError,
+    PdfRenderTimeoutError,
+    WeasyPrintExeBackend,
+    WeasyPrintPoolBackend,
+)
+
+
+def fake_render(html: str, base_url: str | None = None) -> bytes:
+    """Рендеринг-заглушка: виконується в процесі пулу."""
+    if html.startswith("sleep:"):
+        time.sleep(float(html.split(":")[1]))
+    return f"{os.getpid()}:{html}".encode()
+
+
+def missing_weasyprint(html: str, base_url: str | None = None) -> bytes:
+    raise ImportError("No module named 'weasyprint'")
+
+
+class RecordingBackend(PdfBackend):
+    name = "recording"
+
+    def __init__(self):
+        self.rendered = []
+
+    def render(self, html, base_url=None):
+        self.rendered.append(html)
+        return b"%PDF"
+
+
+@pytest.fixture
+def pool():
+    backend = WeasyPrintPoolBackend(
+        workers=1, queue_size=0, timeout=5, queue_timeout=0.2,
+        render_func=fake_render, initializer=None,
+    )
+    yield backend
+    backend.close()
+
+
+def test_pool_reuses_warm_worker_process(pool):
+    first = pool.render("a").decode()
+    second = pool.render("b").decode()
+
+    assert first.endswith(":a") and second.endswith(":b")
+    # Same long-lived process, not a new launch per document
+    assert first.split(":")[0] == second.split(":")[0] != str(os.getpid())
+
+
+def test_pool_rejects_jobs_when_queue_is_full(pool):
+    pool.render("warm")
+    worker = threading.Thread(target=pool.render, args=("sleep:1",))
+    worker.start()
+    time.sleep(0.1)
+    try:
+        with pytest.raises(PdfQueueFullError):
+            pool.render("b")
+    finally:
+        worker.join()
+
+
+def test_pool_restarts_after_timeout(pool):
+    pool.timeout = 0.5
+    with pytest.raises(PdfRenderTimeoutError):
+        pool.render("sleep:5")
+
+    assert pool.render("after").endswith(b":after")
+
+
+def test_fallback_switches_to_exe_when_api_is_unavailable():
+    primary = WeasyPrintPoolBackend(workers=1, render_func=missing_weasyprint, initializer=None)
+    fallback = RecordingBackend()
+    backend = FallbackPdfBackend(primary, fallback)
+
+    assert backend.render("<p>1</p>") == b"%PDF"
+    assert backend.render("<p>2</p>") == b"%PDF"
+    assert fallback.rendered == ["<p>1</p>", "<p>2</p>"]
+    assert backend.name == "recording"
+
+
+def test_exe_backend_is_used_without_weasyprint_package(monkeypatch):
+    monkeypatch.setattr(pdf_renderer, "weasyprint_available", lambda: False)
+
+    assert isinstance(pdf_renderer.create_pdf_backend(), WeasyPrintExeBackend)
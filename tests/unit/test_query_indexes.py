@@ -0,0 +1,112 @@
+"""Перевірка, що гарячі запити документів і табеля використовують складені індекси."""
+
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import desc, func
+
+from backend.models.attendance import Attendance
+from backend.models.document import Document
+from backend.services.stale_document_service import StaleDocumentService
+from shared.enums import DocumentStatus, DocumentType
+
+MONTH_START = date(2026, 3, 1)
+MONTH_END = date(2026, 3, 31)
+
+
+def query_plan(db_session, query) -> str:
+    """Текст EXPLAIN QUERY PLAN для ORM запиту."""
+    compiled = query.statement.compile(
+        dialect=db_session.get_bind().dialect, compile_kwargs={"literal_binds": True},
+    )
+    rows = db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+    return "\n".join(row[-1] for row in rows)
+
+
+def test_staff_documents_by_status_use_staff_status_index(db_session):
+    query = db_session.query(Document).filter(
+        Document.staff_id == 1,
+        Document.status.in_([DocumentStatus.AGREED, DocumentStatus.SIGNED_RECTOR]),
+    )
+
+    assert "ix_documents_staff_status" in query_plan(db_session, query)
+
+
+def test_stale_documents_use_status_changed_index(db_session):
+    query = db_session.query(Document).filter(
+        Document.status.in_(StaleDocumentService.MONITORED_STATUSES),
+        Document.status_changed_at < datetime.now() - timedelta(days=3),
+    ).order_by(desc(Document.status_changed_at))
+
+    assert "ix_documents_status_changed" in query_plan(db_session, query)
+
+
+def test_stale_filter_uses_stale_age_index(db_session):
+    query = db_session.query(func.count(Document.id)).filter(StaleDocumentService.stale_filter())
+
+    plan = query_plan(db_session, query)
+    assert "ix_documents_stale_age" in plan
+    assert "SCAN documents" not in plan
+
+
+def test_stale_page_is_read_in_index_order(db_session):
+    query = StaleDocumentService.stale_query(db_session, age_bucket="3-7")
+    query = query.order_by(*(column.asc() for column, _ in StaleDocumentService.SORT_KEY)).limit(50)
+
+    plan = query_plan(db_session, query)
+    assert "ix_documents_stale_age" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_tabel_vacations_use_status_period_index(db_session):
+    query = db_session.query(
+        Document.staff_id, func.count(Document.id),
+    ).filter(
+        Document.doc_type.in_([DocumentType.VACATION_PAID, DocumentType.VACATION_UNPAID]),
+        Document.status == DocumentStatus.PROCESSED,
+        Document.date_end >= MONTH_START,
+        Document.date_start <= MONTH_END,
+    ).group_by(Document.staff_id)
+
+    assert "ix_documents_status_period" in query_plan(db_session, query)
+
+
+def test_dashboard_upcoming_vacations_use_status_period_index(db_session):
+    query = db_session.query(func.count(Document.id)).filter(
+        Document.doc_type.in_([DocumentType.VACATION_PAID, DocumentType.VACATION_UNPAID]),
+        Document.date_start >= date.today(),
+        Document.status.in_([DocumentStatus.AGREED, DocumentStatus.SIGNED_RECTOR]),
+    )
+
+    assert "ix_documents_status_period" in query_plan(db_session, query)
+
+
+def test_documents_list_order_uses_created_at_index(db_session):
+    query = db_session.query(Document).order_by(
+        Document.created_at.desc(), Document.id.desc(),
+    ).limit(50)
+
+    plan = query_plan(db_session, query)
+    assert "ix_documents_created_at_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_staff_attendance_period_uses_staff_date_index(db_session):
+    query = db_session.query(Attendance).filter(
+        Attendance.staff_id == 1,
+        Attendance.date >= MONTH_START,
+        Attendance.date <= MONTH_END,
+    )
+
+    assert "ix_attendance_staff_date" in query_plan(db_session, query)
+
+
+def test_correction_tabel_uses_correction_period_index(db_session):
+    query = db_session.query(Attendance).filter(
+        Attendance.date >= MONTH_START,
+        Attendance.date <= MONTH_END,
+        Attendance.is_correction == True,
+        Attendance.correction_month == 2,
+        Attendance.correction_year == 2026,
+    ).order_by(Attendance.date)
+
+    assert "ix_attendance_correction_period" in query_plan(db_session, query)
@@ -0,0 +1,60 @@
+"""Unit тести для мініатюр і метаданих сканів."""
+
+import hashlib
+from io import BytesIO
+
+import pytest
+from pypdf import PdfWriter
+
+from backend.services import scan_thumbnails
+from backend.services.scan_thumbnails import (
+    extract_scan_info,
+    render_thumbnail,
+    thumbnail_url,
+    thumbnail_version,
+)
+
+
+def write_pdf(path, pages: int):
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=595, height=842)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def test_page_count_and_size_without_renderer(tmp_path, monkeypatch):
+    scan = write_pdf(tmp_path / "scan.pdf", pages=3)
+    monkeypatch.setattr(scan_thumbnails, "_module_available", lambda name: False)
+
+    info = extract_scan_info(scan, root=tmp_path / "thumbnails")
+
+    assert info.page_count == 3
+    assert info.size == scan.stat().st_size
+    assert info.thumbnail_path is None
+
+
+def test_image_thumbnail_is_content_addressed(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    buffer = BytesIO()
+    Image.new("RGB", (1240, 1754), "white").save(buffer, format="PNG")
+    scan = tmp_path / "scan.png"
+    scan.write_bytes(buffer.getvalue())
+    sha256 = hashlib.sha256(buffer.getvalue()).hexdigest()
+
+    thumbnail = render_thumbnail(scan, sha256, root=tmp_path, width=128)
+
+    assert thumbnail.name.startswith(f"{sha256}-128.")
+    with Image.open(thumbnail) as image:
+        assert image.width == 128
+    # Повторний рендеринг того самого скану не виконується
+    assert render_thumbnail(tmp_path / "missing.png", sha256, root=tmp_path, width=128) == thumbnail
+
+
+def test_thumbnail_url_contains_version():
+    path = "storage/thumbnails/ab/" + "ab" * 32 + "-256.webp"
+
+    assert thumbnail_version(path) == "ab" * 8
+    assert thumbnail_url(7, path) == f"/api/documents/7/thumbnail?v={'ab' * 8}"
+    assert thumbnail_url(7, None) is None
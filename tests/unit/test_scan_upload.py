@@ -0,0 +1,62 @@
+"""Unit тести для потокового приймання сканів."""
+
+import hashlib
+from io import BytesIO
+
+import pytest
+from fastapi import UploadFile
+
+from backend.services.scan_upload import ScanTooLargeError, stage_upload
+
+
+class CountingFile(BytesIO):
+    """Файл, що запам'ятовує розміри прочитаних блоків."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.reads = []
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.reads.append(len(chunk))
+        return chunk
+
+
+async def test_upload_is_streamed_in_chunks_and_hashed(tmp_path):
+    data = b"%PDF-1.4 " + b"x" * 2500
+    source = CountingFile(data)
+    upload = UploadFile(source, filename="scan.PDF")
+
+    staged = await stage_upload(upload, max_size=10_000, chunk_size=1000, directory=tmp_path / "incoming")
+
+    assert max(source.reads) <= 1000
+    assert staged.size == len(data)
+    assert staged.sha256 == hashlib.sha256(data).hexdigest()
+    assert staged.temp_path.suffix == ".pdf"
+
+    destination = await staged.commit(tmp_path / "scans" / "scan_1.pdf")
+    assert destination.read_bytes() == data
+    assert not staged.temp_path.exists()
+
+
+async def test_oversized_upload_is_rejected_early(tmp_path):
+    source = CountingFile(b"x" * 10_000)
+    upload = UploadFile(source, filename="scan.pdf")
+    incoming = tmp_path / "incoming"
+
+    with pytest.raises(ScanTooLargeError):
+        await stage_upload(upload, max_size=1500, chunk_size=1000, directory=incoming)
+
+    # Прочитано лише до перевищення ліміту, тимчасовий файл видалено
+    assert sum(source.reads) == 2000
+    assert list(incoming.iterdir()) == []
+
+
+async def test_declared_size_is_checked_before_reading(tmp_path):
+    source = CountingFile(b"x" * 10_000)
+    upload = UploadFile(source, filename="scan.pdf", size=10_000)
+
+    with pytest.raises(ScanTooLargeError):
+        await stage_upload(upload, max_size=1500, directory=tmp_path)
+
+    assert source.reads == []
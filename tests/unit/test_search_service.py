@@ -0,0 +1,97 @@
+"""Unit тести для повнотекстового пошуку."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from backend.models.document import Document
+from backend.models.staff import Staff
+from backend.services.search_service import (
+    apply_document_search,
+    apply_staff_search,
+    fts_match_expression,
+    has_search_index,
+)
+from shared.enums import DocumentType, EmploymentType, WorkBasis
+
+
+def _staff(pib_nom: str, position: str = "доцент", pib_dav: str | None = None) -> Staff:
+    return Staff(
+        pib_nom=pib_nom,
+        pib_dav=pib_dav,
+        rate=Decimal("1.0"),
+        position=position,
+        employment_type=EmploymentType.MAIN,
+        work_basis=WorkBasis.CONTRACT,
+        term_start=date(2025, 1, 1),
+        term_end=date(2026, 12, 31),
+    )
+
+
+@pytest.fixture
+def people(db_session):
+    """Співробітники з кириличними ПІБ і документ з коментарем."""
+    db_session.add_all([
+        _staff("Іваненко Ігор Петрович", pib_dav="Іваненку Ігорю Петровичу"),
+        _staff("Єрмоленко Ірина Іванівна", position="професор"),
+        _staff("Петренко Іван Олегович", position="завідувач кафедри"),
+    ])
+    db_session.flush()
+    db_session.add(Document(
+        staff_id=1,
+        doc_type=DocumentType.VACATION_PAID,
+        date_start=date(2026, 7, 1),
+        date_end=date(2026, 7, 14),
+        days_count=14,
+        custom_text="Щорічна відпустка",
+    ))
+    db_session.commit()
+    assert has_search_index(db_session)
+
+
+def _staff_names(db_session, query_text, **kwargs):
+    query = apply_staff_search(select(Staff), db_session, query_text, **kwargs)
+    return [staff.pib_nom for staff in db_session.execute(query).scalars()]
+
+
+def test_cyrillic_case_folding_and_prefixes(db_session, people):
+    """Пошук не залежить від регістру кирилиці і знаходить префікси слів."""
+    assert _staff_names(db_session, "ЄРМОЛ") == ["Єрмоленко Ірина Іванівна"]
+    assert _staff_names(db_session, "іваненко ігор") == ["Іваненко Ігор Петрович"]
+    assert _staff_names(db_session, "іваненку", columns=("pib_nom", "pib_dav")) == ["Іваненко Ігор Петрович"]
+
+
+def test_ranked_search_matches_filter(db_session, people):
+    """Ранжований пошук повертає ті самі рядки, що й фільтр, по ПІБ і посаді."""
+    ranked = _staff_names(db_session, "іван", columns=("pib_nom", "position"), ranked=True)
+    filtered = _staff_names(db_session, "іван", columns=("pib_nom", "position"))
+
+    assert sorted(ranked) == sorted(filtered) == sorted([
+        "Іваненко Ігор Петрович", "Єрмоленко Ірина Іванівна", "Петренко Іван Олегович",
+    ])
+    assert _staff_names(db_session, "завідувач", columns=("pib_nom", "position"), ranked=True) == [
+        "Петренко Іван Олегович",
+    ]
+
+
+def test_index_follows_updates(db_session, people):
+    """Тригери оновлюють індекс при зміні документа (включно з коментарями)."""
+    doc = db_session.get(Document, 1)
+    doc.rollback_reason = "Помилка в датах"
+    db_session.commit()
+
+    found = db_session.execute(
+        apply_document_search(select(Document.id), db_session, "ПОМИЛКА")
+    ).scalars().all()
+    assert found == [1]
+    assert db_session.execute(
+        apply_document_search(select(Document.id), db_session, "щорічна")
+    ).scalars().all() == [1]
+
+
+def test_match_expression_is_safe():
+    """Спецсимволи користувача не потрапляють у синтаксис FTS5."""
+    assert fts_match_expression('Мар\'яна" OR *') == '"Мар"* "яна"* "OR"*'
+    assert fts_match_expression("  -- ") is None
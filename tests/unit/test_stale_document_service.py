@@ -0,0 +1,94 @@
+"""Unit тести для SQL перевірки застарілих документів."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event, update
+
+from backend.core.pagination import paginate
+from backend.models.document import Document
+from backend.services.stale_document_service import StaleDocumentService
+from shared.enums import DocumentStatus, DocumentType
+
+
+@pytest.fixture
+def documents(db_session, sample_staff):
+    """Застарілі, свіжі та оброблені документи."""
+    long_ago = datetime.now() - timedelta(days=5)
+    specs = [
+        (DocumentStatus.DRAFT, long_ago, 0),
+        (DocumentStatus.AGREED, long_ago, StaleDocumentService.MAX_NOTIFICATIONS - 1),
+        (DocumentStatus.SCANNED, long_ago, StaleDocumentService.MAX_NOTIFICATIONS),
+        (DocumentStatus.DRAFT, datetime.now(), 0),
+        (DocumentStatus.PROCESSED, long_ago, 0),
+        (DocumentStatus.DRAFT, None, 0),
+    ]
+    docs = []
+    for status, changed_at, count in specs:
+        doc = Document(
+            staff_id=sample_staff.id,
+            doc_type=DocumentType.VACATION_PAID,
+            status=status,
+            date_start=date(2026, 7, 1),
+            date_end=date(2026, 7, 14),
+            days_count=14,
+            stale_notification_count=count,
+        )
+        doc.status_changed_at = changed_at
+        docs.append(doc)
+    db_session.add_all(docs)
+    db_session.flush()
+    # Статус ще не змінювався - рахується від updated_at
+    db_session.execute(
+        update(Document).where(Document.id == docs[-1].id).values(updated_at=long_ago, created_at=long_ago)
+    )
+    db_session.commit()
+    return docs
+
+
+def test_stale_documents_match_python_predicate(db_session, documents):
+    stale = StaleDocumentService.get_stale_documents(db_session)
+
+    expected = [doc.id for doc in documents if StaleDocumentService.is_document_stale(doc)]
+    assert [doc.id for doc in stale] == expected
+    assert len(expected) == 4
+
+
+def test_notifications_are_marked_with_one_update(db_session, documents):
+    statements = []
+    engine = db_session.get_bind()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        result = StaleDocumentService.check_and_notify_stale_documents(db_session)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len([s for s in statements if s.startswith("UPDATE")]) == 1
+    assert result["total_stale"] == 4
+    assert [item["id"] for item in result["notified"]] == [documents[0].id, documents[5].id]
+    assert [item["notification_count"] for item in result["requires_action"]] == [3, 3]
+
+    counts = {doc.id: doc.stale_notification_count for doc in db_session.query(Document)}
+    assert [counts[doc.id] for doc in documents] == [1, 3, 3, 0, 0, 1]
+
+
+def test_stale_query_pages_and_filters_in_sql(db_session, documents):
+    query = StaleDocumentService.stale_query(db_session)
+    assert query.count() == 4
+
+    first, cursor = paginate(query, StaleDocumentService.SORT_KEY, limit=3)
+    rest, last_cursor = paginate(query, StaleDocumentService.SORT_KEY, limit=3, cursor=cursor)
+    # Однаковий вік - порядок за id
+    assert [doc.id for doc in first + rest] == [documents[i].id for i in (0, 1, 2, 5)]
+    assert last_cursor is None
+
+    by_status = StaleDocumentService.stale_query(db_session, status=DocumentStatus.DRAFT)
+    assert {doc.id for doc in by_status} == {documents[0].id, documents[5].id}
+    assert StaleDocumentService.stale_query(db_session, age_bucket="3-7").count() == 4
+    assert StaleDocumentService.stale_query(db_session, age_bucket="7-30").count() == 0
+    with pytest.raises(ValueError):
+        StaleDocumentService.stale_query(db_session, age_bucket="week")
@@ -0,0 +1,71 @@
+"""Unit тести для каталогу архівів табелів."""
+
+import json
+from contextlib import contextmanager
+
+from backend.services import tabel_archive_catalogue
+from backend.services.tabel_archive_catalogue import CATALOGUE_FILENAME, load_catalogue
+from backend.services.tabel_service import list_tabel_archives, save_tabel_archive
+
+
+def _write_external_archive(archive_dir, name, **fields):
+    """Створює архів "поза програмою" (без оновлення каталогу)."""
+    data = {"version": "1.1", "archived_at": "2025-04-01T10:00:00", "raw_data": {}, **fields}
+    (archive_dir / name).write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def _spy_json_loads(monkeypatch):
+    """Записує імена файлів, які читаються через json.load."""
+    opened = []
+    original = json.load
+
+    def spy(f, *args, **kwargs):
+        opened.append(getattr(f, "name", ""))
+        return original(f, *args, **kwargs)
+
+    monkeypatch.setattr(tabel_archive_catalogue.json, "load", spy)
+    return opened
+
+
+def test_saved_archives_are_listed_without_opening_payloads(db_session, tmp_path, monkeypatch):
+    """save_tabel_archive оновлює каталог, список не відкриває архіви."""
+    @contextmanager
+    def test_db_context():
+        yield db_session
+
+    monkeypatch.setattr("backend.core.database.get_db_context", test_db_context)
+
+    save_tabel_archive(3, 2025, output_dir=tmp_path, is_approved=True)
+    save_tabel_archive(
+        3, 2025, is_correction=True, correction_month=2, correction_year=2025,
+        correction_sequence=2, output_dir=tmp_path,
+    )
+    assert (tmp_path / CATALOGUE_FILENAME).exists()
+
+    opened = _spy_json_loads(monkeypatch)
+    result = list_tabel_archives(tmp_path)
+
+    assert [name for name in opened if not name.endswith(CATALOGUE_FILENAME)] == []
+    [main] = result["main_tabels"]
+    assert main["path"].suffix == ".vmarc"
+    assert main["is_approved"] is True
+    assert main["corrections"][0]["correction_sequence"] == 2
+    assert result["orphan_corrections"] == []
+
+
+def test_external_changes_are_reindexed(tmp_path, monkeypatch):
+    """Нові та видалені поза програмою архіви виявляються скануванням."""
+    _write_external_archive(tmp_path, "a.json", month=1, year=2025, is_approved=True)
+    _write_external_archive(tmp_path, "b.json", month=2, year=2025)
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+    assert sorted(entry["month"] for entry in load_catalogue(tmp_path)) == [1, 2]
+
+    opened = _spy_json_loads(monkeypatch)
+    (tmp_path / "b.json").unlink()
+    _write_external_archive(tmp_path, "c.json", month=5, year=2025)
+    entries = load_catalogue(tmp_path)
+
+    assert sorted(entry["month"] for entry in entries) == [1, 5]
+    # Only the catalogue and the new archive are read; a.json and broken.json are cached
+    assert sorted(name.rsplit("/", 1)[-1] for name in opened) == sorted([CATALOGUE_FILENAME, "c.json"])
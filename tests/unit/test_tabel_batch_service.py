@@ -0,0 +1,113 @@
+"""Unit тести для пакетної генерації табелів."""
+
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError as PydanticValidationError
+
+from backend.api.routes.tabel import TabelBatchTarget
+from backend.models.attendance import Attendance
+from backend.models.staff import Staff
+from backend.services import tabel_batch_service, tabel_service
+from backend.services.tabel_batch_service import (
+    MAX_BATCH_TARGETS,
+    TabelTarget,
+    generate_tabel_batch,
+    get_render_pool,
+    shutdown_render_pool,
+)
+from backend.services.tabel_cache import tabel_employee_cache
+from shared.enums import EmploymentType, WorkBasis
+
+YEAR = 2099
+
+
+@pytest.fixture
+def batch_db(db_session, monkeypatch):
+    """Пакет і сервіс табеля працюють з тестовою сесією."""
+    @contextmanager
+    def test_db_context():
+        yield db_session
+
+    monkeypatch.setattr(tabel_service, "get_db_context", test_db_context)
+    monkeypatch.setattr(tabel_batch_service, "get_db_context", test_db_context)
+    tabel_employee_cache.clear()
+
+    for i in range(5):
+        staff = Staff(
+            pib_nom=f"Працівник{i} Тест Тестович",
+            rate=Decimal("1.0"),
+            position="Доцент",
+            employment_type=EmploymentType.MAIN,
+            work_basis=WorkBasis.CONTRACT,
+            term_start=date(2098, 1, 1),
+            term_end=date(2100, 12, 31),
+        )
+        db_session.add(staff)
+        db_session.flush()
+        db_session.add(Attendance(
+            staff_id=staff.id, date=date(YEAR, 2, 3), code="ВД", hours=Decimal("8.0"),
+        ))
+    db_session.commit()
+    yield db_session
+    tabel_employee_cache.clear()
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_batch_matches_single_generation(batch_db, max_workers):
+    """Кожен табель пакета збігається з окремою генерацією, порядок збережено."""
+    targets = [
+        TabelTarget(2, YEAR),
+        TabelTarget(1, YEAR),
+        TabelTarget(2, YEAR, True, 2, YEAR),
+    ]
+
+    results = generate_tabel_batch(targets, employees_per_page=2, max_workers=max_workers)
+
+    assert list(results) == targets
+    for target, result in results.items():
+        expected = tabel_service.generate_tabel_html(
+            target.month, target.year,
+            employees_per_page=2,
+            is_correction=target.is_correction,
+            correction_month=target.correction_month,
+            correction_year=target.correction_year,
+        )
+        assert result.error is None
+        assert result.html == expected
+    assert results[targets[0]].page_count == 3
+    assert results[targets[2]].target.label == "2099-02/correction-2099-02"
+
+
+def test_batches_share_one_render_pool(batch_db):
+    """Пул створюється один раз і використовується наступними пакетами."""
+    generate_tabel_batch([TabelTarget(1, YEAR)], max_workers=2)
+    pool = get_render_pool()
+    generate_tabel_batch([TabelTarget(2, YEAR)], max_workers=2)
+
+    assert get_render_pool() is pool
+    shutdown_render_pool()
+    assert get_render_pool() is not pool
+    shutdown_render_pool()
+
+
+def test_batch_size_is_bounded(batch_db):
+    """Пакет понад MAX_BATCH_TARGETS відхиляється."""
+    targets = [TabelTarget(1 + i % 12, 2030 + i // 12) for i in range(MAX_BATCH_TARGETS + 1)]
+
+    with pytest.raises(ValueError):
+        generate_tabel_batch(targets, max_workers=1)
+
+
+def test_correction_target_without_period(batch_db):
+    """Корекція без місяця/року: API відхиляє запит, а сервіс не падає на label."""
+    target = TabelTarget(1, YEAR, True)
+    assert target.label == f"{YEAR}-01/correction"
+
+    results = generate_tabel_batch([target], max_workers=1)
+    assert results[target].to_dict()["key"] == f"{YEAR}-01/correction"
+
+    with pytest.raises(PydanticValidationError):
+        TabelBatchTarget(month=1, year=2025, is_correction=True, correction_month=12)
@@ -0,0 +1,119 @@
+"""Unit тести для рушія класифікації днів табеля."""
+
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+from backend.services.tabel_engine import (
+    DepartmentMonthMatrix,
+    EmployeeMonthRow,
+    classify_month,
+    count_absence_days,
+)
+from shared.enums import DocumentStatus, DocumentType
+
+# Березень 2025: 1-2 - субота/неділя
+MONTH_START = date(2025, 3, 1)
+DAYS = 31
+
+
+def _attendance(start, end=None, code="ВД", hours="0"):
+    return SimpleNamespace(date=start, date_end=end, code=code, hours=Decimal(hours))
+
+
+def _vacation(start, end, doc_type=DocumentType.VACATION_PAID, status=DocumentStatus.PROCESSED):
+    return SimpleNamespace(date_start=start, date_end=end, doc_type=doc_type, status=status)
+
+
+def test_contract_bounds_and_weekends():
+    """Дні поза контрактом закреслені, вихідні порожні, інші - "Р"."""
+    grid = classify_month(
+        MONTH_START, DAYS, date(2025, 3, 5), date(2025, 3, 25), [], [],
+    )
+
+    assert grid.disabled[3] and grid.strikethrough[3]
+    assert grid.codes[4] == "Р"
+    assert grid.codes[7] == "" and grid.weekend[7]  # 8 березня - субота
+    assert grid.disabled[25] and grid.strikethrough[25]
+    assert grid.work_days() == (8, 7)
+
+
+def test_first_attendance_record_wins_over_vacation():
+    """Перший запис відвідуваності має пріоритет, відпустка заповнює решту."""
+    grid = classify_month(
+        MONTH_START, DAYS, date(2024, 1, 1), date(2026, 1, 1),
+        [
+            _attendance(date(2025, 3, 10), date(2025, 3, 12), code="НУ", hours="2.5"),
+            _attendance(date(2025, 3, 11), date(2025, 3, 20), code="ТН"),
+        ],
+        [_vacation(date(2025, 3, 17), date(2025, 3, 24))],
+    )
+
+    assert grid.codes[9:12] == ["НУ"] * 3
+    assert grid.codes[12:20] == ["ТН"] * 8
+    assert grid.codes[20] == "В"  # 21 березня - п'ятниця
+    assert grid.codes[21] == "" and grid.weekend[21]
+    assert grid.codes[23] == "В"
+    assert grid.overtime_totals()["first_half_overtime"] == 7.5
+
+
+def test_correction_mode_existing_employee():
+    """У корегуючому табелі існуючий працівник має порожні дні без корекцій."""
+    grid = classify_month(
+        MONTH_START, DAYS, date(2025, 3, 10), date(2025, 3, 12),
+        [_attendance(date(2025, 3, 20), code="ВД")], [],
+        is_correction=True,
+    )
+
+    assert grid.disabled[0] and not grid.strikethrough[0]
+    assert grid.codes[10] == ""
+    assert grid.codes[19] == "ВД"  # Після кінця контракту не закреслюється
+
+
+def test_absence_days_span_months_and_count_calendar_days():
+    """Діапазони обрізаються до місяця, вихідні враховуються."""
+    counts = count_absence_days(
+        [_attendance(date(2025, 2, 20), date(2025, 3, 3), code="ВД")],
+        [
+            _vacation(date(2025, 3, 14), date(2025, 4, 10)),
+            _vacation(date(2025, 3, 1), date(2025, 3, 5), status=DocumentStatus.DRAFT),
+        ],
+        MONTH_START,
+        date(2025, 3, 31),
+    )
+
+    assert counts["business_trip_1"] == 3
+    assert counts["business_trip_2"] == 0
+    assert counts["vacation_8_10_1"] == 2
+    assert counts["vacation_8_10_2"] == 16
+
+
+def test_department_matrix_totals():
+    """Підсумки матриці: робочі дні, стовпці днів, надурочні та відсутності."""
+    first = classify_month(
+        MONTH_START, DAYS, date(2024, 1, 1), date(2026, 1, 1),
+        [_attendance(date(2025, 3, 3), code="НУ", hours="2.5"),
+         _attendance(date(2025, 3, 20), code="НУ", hours="3")],
+        [],
+    )
+    second = classify_month(
+        MONTH_START, DAYS, date(2025, 3, 17), date(2026, 1, 1),
+        [], [_vacation(date(2025, 3, 24), date(2025, 3, 28))],
+    )
+    matrix = DepartmentMonthMatrix.from_rows(
+        [EmployeeMonthRow.from_grid(first, work_minutes=60), EmployeeMonthRow.from_grid(second)],
+        DAYS,
+    )
+
+    assert matrix.work_days().tolist() == [[9, 10], [0, 6]]
+    assert matrix.overtime_hours()[0, 0].tolist() == [2.5, 3.0]
+    assert matrix.day_counts()[0] == 0  # 1 березня - субота
+    assert matrix.day_counts()[16] == 2
+    assert matrix.active_days()[0] == 2
+
+    totals = matrix.totals()
+    assert totals["work_days"] == 25
+    assert totals["work_minutes"] == 60
+    assert totals["overtime"] == 5  # Цілі години по кожній половині
+    assert totals["absence"]["vacation_8_10_2"] == 5
+    assert matrix.slice(1, 2).totals()["work_days"] == 6
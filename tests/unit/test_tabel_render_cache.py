@@ -0,0 +1,78 @@
+"""Unit тести для кешу рендерингу архівних табелів."""
+
+from backend.services import pdf_renderer, tabel_service
+from backend.services.archive_format import write_archive
+from backend.services.tabel_archive_catalogue import catalogue_entry
+from backend.services.tabel_render_cache import (
+    RENDER_CACHE_DIRNAME,
+    get_cached_tabel_html,
+    get_cached_tabel_pdf,
+    get_tabel_pdf_path,
+    render_cache_key,
+    store_tabel_pdf,
+    warm_tabel_render_cache,
+)
+from backend.services.tabel_service import find_approved_tabel_archive
+
+ARCHIVE = {
+    "version": "2.0",
+    "archived_at": "2025-04-01T10:00:00",
+    "month": 3,
+    "year": 2025,
+    "is_approved": True,
+    "settings": {"institution_name": "Тестовий університет"},
+    "employees": [],
+    "raw_data": {},
+}
+
+
+def test_html_is_rendered_once_and_keyed_by_archive(tmp_path, monkeypatch):
+    """Повторне відкриття читає файл кешу; зміна архіву дає новий ключ."""
+    archive_path = write_archive(tmp_path / "a.vmarc", ARCHIVE, lazy_sections=("raw_data",))
+
+    calls = []
+    original = tabel_service.reconstruct_tabel_html_from_archive
+    monkeypatch.setattr(
+        tabel_service, "reconstruct_tabel_html_from_archive",
+        lambda data: calls.append(data) or original(data),
+    )
+
+    html, etag = get_cached_tabel_html(archive_path)
+    cached_html, cached_etag = get_cached_tabel_html(archive_path)
+
+    assert len(calls) == 1
+    assert (cached_html, cached_etag) == (html, etag)
+    assert "Тестовий університет" in html
+    assert (tmp_path / RENDER_CACHE_DIRNAME / f"{etag}.html").exists()
+
+    write_archive(archive_path, {**ARCHIVE, "month": 4}, lazy_sections=("raw_data",))
+    assert render_cache_key(archive_path) != etag
+
+
+
+def test_pdf_round_trip(tmp_path):
+    """PDF зберігається за тим самим ключем, що й HTML."""
+    archive_path = write_archive(tmp_path / "a.vmarc", ARCHIVE)
+
+    assert get_cached_tabel_pdf(archive_path) is None
+    store_tabel_pdf(archive_path, b"%PDF-1.7 test")
+    assert get_cached_tabel_pdf(archive_path) == b"%PDF-1.7 test"
+
+
+def test_approval_warms_pdf_used_by_export(tmp_path, monkeypatch):
+    """PDF погодженого архіву рендериться при погодженні, експорт знаходить його в кеші."""
+    renders = []
+    monkeypatch.setattr(pdf_renderer, "render_pdf", lambda html, base_url=None: renders.append(html) or b"%PDF-1.7")
+    archive_path = write_archive(tmp_path / "a.vmarc", ARCHIVE, meta=catalogue_entry(ARCHIVE))
+    write_archive(tmp_path / "draft.vmarc", {**ARCHIVE, "month": 4, "is_approved": False},
+                  meta=catalogue_entry({**ARCHIVE, "month": 4, "is_approved": False}))
+
+    warm_tabel_render_cache(archive_path)
+    found = find_approved_tabel_archive(3, 2025, output_dir=tmp_path)
+    pdf_path = get_tabel_pdf_path(found)
+
+    assert found == archive_path
+    assert find_approved_tabel_archive(4, 2025, output_dir=tmp_path) is None
+    assert pdf_path.read_bytes() == b"%PDF-1.7"
+    assert len(renders) == 1
+    assert "Тестовий університет" in renders[0]
@@ -0,0 +1,220 @@
+"""Unit тести для сервісу табеля."""
+
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from backend.models.attendance import Attendance
+from backend.models.document import Document
+from backend.models.settings import SystemSettings
+from backend.models.staff import Staff
+from backend.services import tabel_service
+from backend.services.tabel_cache import tabel_employee_cache
+from backend.services.tabel_service import (
+    generate_tabel_html,
+    get_employees_for_tabel,
+    load_tabel_fingerprints,
+    load_tabel_settings,
+    stream_tabel_html,
+)
+from shared.enums import DocumentStatus, DocumentType, EmploymentType, WorkBasis
+
+# Майбутній місяць - не заблокований, тому відпустки враховуються
+MONTH, YEAR = 3, 2099
+
+
+@pytest.fixture(autouse=True)
+def clear_tabel_cache():
+    """Кожен тест починає з порожнім кешем рядків табеля."""
+    tabel_employee_cache.clear()
+    yield
+    tabel_employee_cache.clear()
+
+
+@contextmanager
+def count_queries(session):
+    """Рахує SELECT запити, виконані через сесію."""
+    statements = []
+    engine = session.get_bind()
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_execute)
+
+
+def _add_staff(db_session, count: int) -> list[Staff]:
+    """Створює працівників з одним записом відвідуваності та відпусткою."""
+    staff_list = []
+    for i in range(count):
+        staff = Staff(
+            pib_nom=f"Працівник{i:03d} Тест Тестович",
+            rate=Decimal("1.0"),
+            position="Доцент",
+            employment_type=EmploymentType.MAIN,
+            work_basis=WorkBasis.CONTRACT,
+            term_start=date(2098, 1, 1),
+            term_end=date(2100, 12, 31),
+        )
+        db_session.add(staff)
+        staff_list.append(staff)
+    db_session.flush()
+
+    for staff in staff_list:
+        db_session.add(Attendance(
+            staff_id=staff.id,
+            date=date(YEAR, MONTH, 2),
+            date_end=date(YEAR, MONTH, 3),
+            code="ВД",
+            hours=Decimal("8.0"),
+        ))
+        db_session.add(Document(
+            staff_id=staff.id,
+            doc_type=DocumentType.VACATION_PAID,
+            status=DocumentStatus.PROCESSED,
+            date_start=date(YEAR, MONTH, 16),
+            date_end=date(YEAR, MONTH, 20),
+            days_count=5,
+        ))
+    db_session.commit()
+    return staff_list
+
+
+def test_load_tabel_settings_parses_values(db_session):
+    """Налаштування читаються одним запитом і коректно розбираються."""
+    SystemSettings.set_value(db_session, "tabel_work_hours_per_day", "8:15")
+    SystemSettings.set_value(db_session, "tabel_hours_calc_positions", ["specialist"])
+    SystemSettings.set_value(db_session, "tabel_limit_hours_calc", "true")
+
+    with count_queries(db_session) as statements:
+        settings = load_tabel_settings(db_session)
+
+    assert len(statements) == 1
+    assert settings.work_hours_per_day == 8.25
+    assert settings.hours_calc_positions == ["specialist"]
+    assert settings.limit_hours_calc is True
+    assert settings.show_monthly_totals is True
+
+
+def test_employees_for_tabel_query_count_is_constant(db_session):
+    """Кількість запитів не залежить від кількості працівників."""
+    _add_staff(db_session, 2)
+    with count_queries(db_session) as small:
+        employees, *_ = get_employees_for_tabel(db_session, MONTH, YEAR)
+    assert len(employees) == 2
+
+    _add_staff(db_session, 10)
+    with count_queries(db_session) as large:
+        employees, *_ = get_employees_for_tabel(db_session, MONTH, YEAR)
+    assert len(employees) == 12
+
+    assert len(large) == len(small)
+
+
+def test_employees_for_tabel_uses_grouped_records(db_session):
+    """Записи відвідуваності та відпустки потрапляють до свого працівника."""
+    _add_staff(db_session, 3)
+
+    employees, *_ = get_employees_for_tabel(db_session, MONTH, YEAR)
+
+    for emp in employees:
+        assert emp.days[1].code == "ВД"
+        assert emp.days[2].code == "ВД"
+        assert emp.absence.business_trip_1 == 2
+        # 16-20 березня 2099: понеділок-п'ятниця
+        assert [emp.days[d].code for d in range(15, 20)] == ["В"] * 5
+        assert emp.absence.vacation_8_10_2 == 5
+
+
+def test_employees_for_tabel_reuses_cached_rows(db_session, monkeypatch):
+    """Повторна генерація без змін не перераховує жодного працівника."""
+    _add_staff(db_session, 3)
+    first, *_ = get_employees_for_tabel(db_session, MONTH, YEAR)
+
+    built = []
+    original = tabel_service.build_employees_data
+    monkeypatch.setattr(
+        tabel_service, "build_employees_data",
+        lambda classified, *args: built.extend(classified) or original(classified, *args),
+    )
+    second, *_ = get_employees_for_tabel(db_session, MONTH, YEAR)
+
+    assert built == []
+    assert [emp.staff_id for emp in second] == [emp.staff_id for emp in first]
+    assert second[0] is first[0]
+
+
+def test_employees_for_tabel_rebuilds_only_changed_employee(db_session, monkeypatch):
+    """Зміна відвідуваності одного працівника перераховує лише його рядок."""
+    staff_list = _add_staff(db_session, 3)
+    get_employees_for_tabel(db_session, MONTH, YEAR)
+
+    attendance = db_session.query(Attendance).filter_by(staff_id=staff_list[1].id).one()
+    attendance.code = "ТН"
+    db_session.commit()
+
+    built = []
+    original = tabel_service.build_employees_data
+    monkeypatch.setattr(
+        tabel_service, "build_employees_data",
+        lambda classified, *args: built.extend(classified) or original(classified, *args),
+    )
+    employees, *_ = get_employees_for_tabel(db_session, MONTH, YEAR)
+
+    assert [staff.id for staff, *_ in built] == [staff_list[1].id]
+    changed = next(emp for emp in employees if emp.staff_id == staff_list[1].id)
+    assert changed.days[1].code == "ТН"
+
+
+def test_fingerprint_detects_change_within_same_second(db_session):
+    """Зміна годин без зміни updated_at (та сама секунда) змінює відбиток."""
+    staff = _add_staff(db_session, 1)[0]
+    month_start, month_end = date(YEAR, MONTH, 1), date(YEAR, MONTH, 31)
+
+    def fingerprint(records=None):
+        return load_tabel_fingerprints(
+            db_session, [staff.id], month_start, month_end, attendance_records=records,
+        )[staff.id]
+
+    before = fingerprint()
+    attendance = db_session.query(Attendance).filter_by(staff_id=staff.id).one()
+    assert fingerprint([attendance]) == before
+
+    db_session.query(Attendance).filter_by(id=attendance.id).update(
+        {"hours": Decimal("4.0"), "updated_at": attendance.updated_at},
+        synchronize_session=False,
+    )
+    db_session.commit()
+    db_session.refresh(attendance)
+
+    after = fingerprint()
+    assert after != before
+    assert after[0][1] == before[0][1]
+    assert fingerprint([attendance]) == after
+
+
+def test_stream_tabel_html_matches_full_render(db_session, monkeypatch):
+    """Потоковий рендер дає той самий HTML, page-break лише з другої сторінки."""
+    _add_staff(db_session, 5)
+
+    @contextmanager
+    def test_db_context():
+        yield db_session
+
+    monkeypatch.setattr(tabel_service, "get_db_context", test_db_context)
+
+    chunks = list(stream_tabel_html(MONTH, YEAR, employees_per_page=2))
+    html = generate_tabel_html(MONTH, YEAR, employees_per_page=2)
+
+    assert "".join(chunks) == html
+    assert len(chunks) > 3
+    assert html.count('class="page-container"') == 3
+    assert html.count("grid-container page-break") == 2
@@ -0,0 +1,33 @@
+"""Unit тести для реєстру Jinja2 шаблонів."""
+
+from backend.services.template_registry import (
+    TABEL_CORRECTION_ENV,
+    TABEL_ENV,
+    TemplateRegistry,
+)
+
+
+def test_environment_and_template_are_reused(tmp_path):
+    """Середовище та скомпільований шаблон створюються один раз."""
+    registry = TemplateRegistry(auto_reload=False, bytecode_cache_dir=tmp_path)
+
+    env = registry.get_environment(TABEL_ENV)
+    template = registry.get_template(TABEL_ENV, "tabel_template.html")
+
+    assert registry.get_environment(TABEL_ENV) is env
+    assert registry.get_template(TABEL_ENV, "tabel_template.html") is template
+    assert registry.get_environment(TABEL_CORRECTION_ENV) is not env
+    assert env.auto_reload is False
+
+
+def test_bytecode_cache_is_shared_between_registries(tmp_path):
+    """Новий реєстр (холодний старт) бере байткод з дискового кешу."""
+    TemplateRegistry(bytecode_cache_dir=tmp_path).get_template(TABEL_ENV, "tabel_template.html")
+    cached_files = list(tmp_path.iterdir())
+    assert cached_files
+
+    registry = TemplateRegistry(bytecode_cache_dir=tmp_path)
+    registry.get_template(TABEL_ENV, "tabel_template.html")
+
+    assert list(tmp_path.iterdir()) == cached_files
+    assert registry.get_environment(TABEL_ENV).bytecode_cache is registry.bytecode_cache